@@ -12,7 +12,7 @@ Functions:
 - show_unique_genres: Display a list of all unique movie genres.
 - count_movies_by_genre: Display the number of movies for each genre.
 - avg_age_in_genre: Calculate the average age of actors in each genre.
-- movie_by_keyword: Search and display movies by a keyword in the title.
+- find_movie_by_keyword: Search movies through the full-text index (from movie_db_funcs.search).
 - movies_page_by_page: Paginate and display movies in pages.
 - list_everything: Display a combined list of all movies and actors.
 - list_movie_age: Display a list of movies and their ages.
@@ -27,6 +27,9 @@ import uuid
 import math
 from datetime import date
 
+from movie_db_funcs.repository import get_connection, read, transaction
+from movie_db_funcs.search import find_movie_by_keyword
+
 __all__ = ['init_database', 'add_movie', 'add_actor', 'show_entire_library',
            'show_unique_genres', 'count_movies_by_genre', 'avg_actor_age_in_genre',
            'find_movie_by_keyword', 'show_movies_page_by_page', 'list_everything',
@@ -59,9 +62,6 @@ def movie_age(year):
 
 def add_movie_cast(movie_id, actor_id):
     try:
-        sqlite_connection = sqlite3.connect('movie_database.db')
-        cursor = sqlite_connection.cursor()
-
         sqlite_add_movie_cast = '''
             INSERT OR IGNORE INTO movie_cast
             (movie_cast_id, movie_id, actor_id)
@@ -70,48 +70,36 @@ def add_movie_cast(movie_id, actor_id):
 
         movie_cast_id = create_uuid()
         data = (movie_cast_id, movie_id, actor_id)
-        cursor.execute(sqlite_add_movie_cast, data)
-
-        sqlite_connection.commit()
-        cursor.close()
+        with transaction() as cursor:
+            cursor.execute(sqlite_add_movie_cast, data)
 
     except sqlite3.Error as error:
         print("Error working with SQLite", error)
 
-    finally:
-        if sqlite_connection:
-            sqlite_connection.close()
-
 
 # ---- Database Initialization ----
 
 def init_database():
     """
     Initialize the SQLite database using a SQL script file.
-    Creates a function for generating UUIDs within SQL queries.
+    The uuid() SQL function comes from the shared connection.
 
     :raises sqlite3.Error: If any error occurs during database interaction.
     """
     try:
-        sqlite_connection = sqlite3.connect('movie_database.db')
-        cursor = sqlite_connection.cursor()
-
         with open("movie_database_init.sql", 'r', encoding='utf-8') as script_file:
             init_script = script_file.read()
 
-        sqlite_connection.create_function("uuid", 0, create_uuid)
-        cursor.executescript(init_script)
-
-        sqlite_connection.commit()
-        cursor.close()
+        # Run the whole script as one transaction instead of one per statement
+        get_connection().executescript(f"BEGIN;\n{init_script};\nCOMMIT;")
 
     except sqlite3.Error as error:
+        # A failed statement leaves the script's transaction open on the shared
+        # connection; later writes would join it and never be committed
+        if get_connection().in_transaction:
+            get_connection().execute('ROLLBACK')
         print("Error working with SQLite", error)
 
-    finally:
-        if sqlite_connection:
-            sqlite_connection.close()
-
 
 # ---- Data Insertion Functions ----
 
@@ -123,9 +111,6 @@ def add_movie():
     """
     try:
         print("\nAdding movie", end='')
-        sqlite_connection = sqlite3.connect('movie_database.db')
-        cursor = sqlite_connection.cursor()
-
         sqlite_insert_movie = '''
             INSERT OR IGNORE INTO movies
             (movie_id, title, release_year, genre)
@@ -166,12 +151,10 @@ def add_movie():
             break
 
         data = (movie_id, title, year, genre)
-        cursor.execute(sqlite_insert_movie, data)
+        with transaction() as cursor:
+            cursor.execute(sqlite_insert_movie, data)
         print(f'\nMovie "{title}" was added to the database.')
 
-        sqlite_connection.commit()
-        cursor.close()
-
         print("Would you like to add cast to this movie?")
         print("1. Add a new actor/actress")
         print("2. Add an existing actor/actress")
@@ -195,16 +178,14 @@ def add_movie():
             actor_name, actor_birth_year = add_actor()
         elif actor_input == 2:
             try:
-                sqlite_connection = sqlite3.connect('movie_database.db')
-                cursor = sqlite_connection.cursor()
-
                 sqlite_select_all_actor = '''
                     SELECT rowid, actor_id, name
                     FROM actors;
                 '''
 
-                cursor.execute(sqlite_select_all_actor)
-                list_of_actors = cursor.fetchall()
+                with read() as cursor:
+                    cursor.execute(sqlite_select_all_actor)
+                    list_of_actors = cursor.fetchall()
                 print("\nAvailable actors:")
 
                 for actor in list_of_actors:
@@ -234,28 +215,18 @@ def add_movie():
 
                 selected_actor = list_of_actors[actor_no_input - 1][1]
                 cast_insert = (create_uuid(), movie_id, selected_actor)
-                cursor.execute(sqlite_insert_an_actor, cast_insert)
+                with transaction() as cursor:
+                    cursor.execute(sqlite_insert_an_actor, cast_insert)
 
                 selected_actor_name = list_of_actors[actor_no_input - 1][2]
                 print(f"{selected_actor_name} was added to the cast of {title}")
 
-                sqlite_connection.commit()
-                cursor.close()
-
             except sqlite3.Error as error:
                 print("Error working with SQLite", error)
 
-            finally:
-                if sqlite_connection:
-                    sqlite_connection.close()
-
     except sqlite3.Error as error:
         print("Error working with SQLite", error)
 
-    finally:
-        if sqlite_connection:
-            sqlite_connection.close()
-
 
 def add_actor():
     """
@@ -265,9 +236,6 @@ def add_actor():
     """
     try:
         print("\nAdding actor.", end='')
-        sqlite_connection = sqlite3.connect('movie_database.db')
-        cursor = sqlite_connection.cursor()
-
         sqlite_insert_actor = '''
             INSERT OR IGNORE INTO actors
             (actor_id, name, birth_year)
@@ -300,22 +268,16 @@ def add_actor():
             break
 
         data = (actor_id, name, year)
-        cursor.execute(sqlite_insert_actor, data)
+        with transaction() as cursor:
+            cursor.execute(sqlite_insert_actor, data)
         print(f"\nActor/actress {name} was added to the database.")
 
-        sqlite_connection.commit()
-        cursor.close()
-
         return (name, year)
 
     except sqlite3.Error as error:
         print("Error working with SQLite", error)
         return None
 
-    finally:
-        if sqlite_connection:
-            sqlite_connection.close()
-
 
 # ---- Data Display Functions ----
 
@@ -327,9 +289,6 @@ def show_entire_library():
     """
     try:
         print("\nList of all movies with the cast:")
-        sqlite_connection = sqlite3.connect('movie_database.db')
-        cursor = sqlite_connection.cursor()
-
         sqlite_select_entire_library = '''
             SELECT m.title, a.name
             FROM movie_cast mc
@@ -338,22 +297,16 @@ def show_entire_library():
             ORDER BY 1, 2;
         '''
 
-        cursor.execute(sqlite_select_entire_library)
-        movie_library = cursor.fetchall()
+        with read() as cursor:
+            cursor.execute(sqlite_select_entire_library)
+            movie_library = cursor.fetchall()
 
         for entry in movie_library:
             print(f"Movie: {entry[0]}. Actor: {entry[1]}")
 
-        sqlite_connection.commit()
-        cursor.close()
-
     except sqlite3.Error as error:
         print("Error working with SQLite", error)
 
-    finally:
-        if sqlite_connection:
-            sqlite_connection.close()
-
 
 def show_unique_genres():
     """
@@ -363,32 +316,23 @@ def show_unique_genres():
     """
     try:
         print("\nList of unique genres:")
-        sqlite_connection = sqlite3.connect('movie_database.db')
-        cursor = sqlite_connection.cursor()
-
         sqlite_select_unique_genres = '''
             SELECT DISTINCT genre
             FROM movies
             ORDER BY genre;
         '''
 
-        cursor.execute(sqlite_select_unique_genres)
-        genre_list = cursor.fetchall()
+        with read() as cursor:
+            cursor.execute(sqlite_select_unique_genres)
+            genre_list = cursor.fetchall()
 
         print("Genres:")
         for genre in genre_list:
             print(f"- {genre[0]}")
 
-        sqlite_connection.commit()
-        cursor.close()
-
     except sqlite3.Error as error:
         print("Error working with SQLite", error)
 
-    finally:
-        if sqlite_connection:
-            sqlite_connection.close()
-
 
 def count_movies_by_genre():
     """
@@ -398,9 +342,6 @@ def count_movies_by_genre():
     """
     try:
         print("\nNumber of movies by genre:")
-        sqlite_connection = sqlite3.connect('movie_database.db')
-        cursor = sqlite_connection.cursor()
-
         sqlite_count_movies_by_genre = '''
             SELECT genre, count(movie_id)
             FROM movies
@@ -408,22 +349,16 @@ def count_movies_by_genre():
             ORDER BY genre;
         '''
 
-        cursor.execute(sqlite_count_movies_by_genre)
-        movies_by_genre = cursor.fetchall()
+        with read() as cursor:
+            cursor.execute(sqlite_count_movies_by_genre)
+            movies_by_genre = cursor.fetchall()
 
         for number, genre in enumerate(movies_by_genre, 1):
             print(f"{number}. {genre[0]}: {genre[1]}")
 
-        sqlite_connection.commit()
-        cursor.close()
-
     except sqlite3.Error as error:
         print("Error working with SQLite", error)
 
-    finally:
-        if sqlite_connection:
-            sqlite_connection.close()
-
 
 def avg_actor_age_in_genre():
     """
@@ -433,9 +368,6 @@ def avg_actor_age_in_genre():
     """
     try:
         print("\nAverage cast age in genre:")
-        sqlite_connection = sqlite3.connect('movie_database.db')
-        cursor = sqlite_connection.cursor()
-
         sqlite_avg_actor_age_in_genre = '''
             SELECT m.genre, AVG(DATE('now') - a.birth_year)
             FROM movie_cast mc
@@ -445,68 +377,17 @@ def avg_actor_age_in_genre():
             ORDER BY genre;
         '''
 
-        cursor.execute(sqlite_avg_actor_age_in_genre)
-        avg_age_in_genre = cursor.fetchall()
+        with read() as cursor:
+            cursor.execute(sqlite_avg_actor_age_in_genre)
+            avg_age_in_genre = cursor.fetchall()
 
         for number, entry in enumerate(avg_age_in_genre, 1):
             print(f"{number}. Genre: {(entry[0].lower())}, "
                   f"average cast age: {round(entry[1])}")
 
-        sqlite_connection.commit()
-        cursor.close()
-
-    except sqlite3.Error as error:
-        print("Error working with SQLite", error)
-
-    finally:
-        if sqlite_connection:
-            sqlite_connection.close()
-
-
-# ---- Movie Search Functions ----
-
-def find_movie_by_keyword():
-    """
-    Search for movies by a keyword in the title and display the results.
-
-    Prompts the user for input to enter a keyword for the search.
-
-    :raises sqlite3.Error: If any error occurs during database interaction.
-    """
-    try:
-        print("\nSearching for a movie by keyword:")
-        sqlite_connection = sqlite3.connect('movie_database.db')
-        cursor = sqlite_connection.cursor()
-
-        movies_by_keyword = '''
-            SELECT title, release_year
-            FROM movies
-            WHERE title LIKE ?;
-        '''
-
-        print("\nEnter keyword: ")
-        keyword = input(">>> ")
-        keyword = f"%{keyword}%"
-        cursor.execute(movies_by_keyword, (keyword,))
-        movies_by_keyword_list = cursor.fetchall()
-
-        if movies_by_keyword_list:
-            print("\nFound movies:")
-            for number, movie in enumerate(movies_by_keyword_list, 1):
-                print(f"{number}. {movie[0]} ({movie[1]})")
-        else:
-            print("No movies found with that keyword.")
-
-        sqlite_connection.commit()
-        cursor.close()
-
     except sqlite3.Error as error:
         print("Error working with SQLite", error)
 
-    finally:
-        if sqlite_connection:
-            sqlite_connection.close()
-
 
 def show_movies_page_by_page():
     """
@@ -519,9 +400,6 @@ def show_movies_page_by_page():
     """
     try:
         print("\nList of movies page by page:")
-        sqlite_connection = sqlite3.connect('movie_database.db')
-        cursor = sqlite_connection.cursor()
-
         sqlite_select_total_pages = '''
             SELECT CAST(COUNT(movie_id) AS REAL) / ?
             FROM movies
@@ -540,8 +418,9 @@ def show_movies_page_by_page():
                 continue
             break
 
-        cursor.execute(sqlite_select_total_pages, (movies_by_page,))
-        total_pages = math.ceil(cursor.fetchone()[0])
+        with read() as cursor:
+            cursor.execute(sqlite_select_total_pages, (movies_by_page,))
+            total_pages = math.ceil(cursor.fetchone()[0])
 
         sqlite_select_page_with_movies = '''
             SELECT title
@@ -556,8 +435,9 @@ def show_movies_page_by_page():
         movie_index = 1
 
         while True:
-            cursor.execute(sqlite_select_page_with_movies, (movies_by_page, offset))
-            output = cursor.fetchall()
+            with read() as cursor:
+                cursor.execute(sqlite_select_page_with_movies, (movies_by_page, offset))
+                output = cursor.fetchall()
 
             print(f"\nPage {page_counter} of {total_pages}")
             for number, movie in enumerate(output, movie_index):
@@ -584,16 +464,9 @@ def show_movies_page_by_page():
             else:
                 break
 
-        sqlite_connection.commit()
-        cursor.close()
-
     except sqlite3.Error as error:
         print("Error working with SQLite", error)
 
-    finally:
-        if sqlite_connection:
-            sqlite_connection.close()
-
 
 def list_everything():
     """
@@ -603,9 +476,6 @@ def list_everything():
     """
     try:
         print("\nAll actors and movies:")
-        sqlite_connection = sqlite3.connect('movie_database.db')
-        cursor = sqlite_connection.cursor()
-
         select_list_of_everything = '''
             SELECT title, "Movie" AS Type
             FROM movies
@@ -615,8 +485,9 @@ def list_everything():
             ORDER BY 2, 1;
         '''
 
-        cursor.execute(select_list_of_everything)
-        list_of_everything = cursor.fetchall()
+        with read() as cursor:
+            cursor.execute(select_list_of_everything)
+            list_of_everything = cursor.fetchall()
 
         if list_of_everything:
             for number, item in enumerate(list_of_everything, 1):
@@ -624,16 +495,9 @@ def list_everything():
         else:
             print("No actors or movies found.")
 
-        sqlite_connection.commit()
-        cursor.close()
-
     except sqlite3.Error as error:
         print("Error working with SQLite", error)
 
-    finally:
-        if sqlite_connection:
-            sqlite_connection.close()
-
 
 def list_movies_and_age():
     """
@@ -645,19 +509,15 @@ def list_movies_and_age():
     """
     try:
         print("\nMovies and their age:")
-        sqlite_connection = sqlite3.connect('movie_database.db')
-        cursor = sqlite_connection.cursor()
-
-        sqlite_connection.create_function("movie_age", 1, movie_age)
-
         select_movies_and_age = '''
             SELECT title, movie_age(release_year)
             FROM movies
             ORDER BY title;
         '''
 
-        cursor.execute(select_movies_and_age)
-        list_of_movies_and_age = cursor.fetchall()
+        with read() as cursor:
+            cursor.execute(select_movies_and_age)
+            list_of_movies_and_age = cursor.fetchall()
 
         if list_of_movies_and_age:
             for number, item in enumerate(list_of_movies_and_age, 1):
@@ -665,12 +525,5 @@ def list_movies_and_age():
         else:
             print("No movies found.")
 
-        sqlite_connection.commit()
-        cursor.close()
-
     except sqlite3.Error as error:
         print("Error working with SQLite", error)
-
-    finally:
-        if sqlite_connection:
-            sqlite_connection.close()
@@ -25,6 +25,78 @@ CREATE TABLE IF NOT EXISTS movie_cast (
     CONSTRAINT actor_in_movie UNIQUE (actor_id, movie_id)
 );
 
+-- Creating MOVIE_SEARCH full-text index, keyed on movies.movie_id
+-- (the implicit movies.rowid is not stable across VACUUM)
+CREATE VIRTUAL TABLE IF NOT EXISTS movie_search USING fts5(
+    movie_id UNINDEXED,
+    title,
+    genre,
+    cast_names,
+    prefix = '2 3',
+    tokenize = 'unicode61 remove_diacritics 2'
+);
+
+-- Keeping MOVIE_SEARCH in sync with MOVIES
+CREATE TRIGGER IF NOT EXISTS movie_search_movie_insert AFTER INSERT ON movies
+BEGIN
+    INSERT INTO movie_search (movie_id, title, genre, cast_names)
+        VALUES (new.movie_id, new.title, new.genre, '');
+END;
+
+CREATE TRIGGER IF NOT EXISTS movie_search_movie_update AFTER UPDATE OF title, genre ON movies
+BEGIN
+    UPDATE movie_search SET title = new.title, genre = new.genre
+        WHERE movie_id = new.movie_id;
+END;
+
+CREATE TRIGGER IF NOT EXISTS movie_search_movie_delete AFTER DELETE ON movies
+BEGIN
+    DELETE FROM movie_search WHERE movie_id = old.movie_id;
+END;
+
+-- Keeping cast names in MOVIE_SEARCH in sync with MOVIE_CAST and ACTORS
+CREATE TRIGGER IF NOT EXISTS movie_search_cast_insert AFTER INSERT ON movie_cast
+BEGIN
+    UPDATE movie_search SET cast_names = (
+        SELECT group_concat(a.name, ' ')
+        FROM movie_cast mc JOIN actors a ON a.actor_id = mc.actor_id
+        WHERE mc.movie_id = new.movie_id
+    )
+    WHERE movie_id = new.movie_id;
+END;
+
+CREATE TRIGGER IF NOT EXISTS movie_search_cast_delete AFTER DELETE ON movie_cast
+BEGIN
+    UPDATE movie_search SET cast_names = coalesce((
+        SELECT group_concat(a.name, ' ')
+        FROM movie_cast mc JOIN actors a ON a.actor_id = mc.actor_id
+        WHERE mc.movie_id = old.movie_id
+    ), '')
+    WHERE movie_id = old.movie_id;
+END;
+
+CREATE TRIGGER IF NOT EXISTS movie_search_actor_update AFTER UPDATE OF name ON actors
+BEGIN
+    UPDATE movie_search SET cast_names = (
+        SELECT group_concat(a.name, ' ')
+        FROM movie_cast mc JOIN actors a ON a.actor_id = mc.actor_id
+        WHERE mc.movie_id = movie_search.movie_id
+    )
+    WHERE movie_id IN (
+        SELECT mc.movie_id FROM movie_cast mc WHERE mc.actor_id = new.actor_id
+    );
+END;
+
+-- Indexing movies added before MOVIE_SEARCH existed
+INSERT INTO movie_search (movie_id, title, genre, cast_names)
+    SELECT m.movie_id, m.title, m.genre, coalesce((
+        SELECT group_concat(a.name, ' ')
+        FROM movie_cast mc JOIN actors a ON a.actor_id = mc.actor_id
+        WHERE mc.movie_id = m.movie_id
+    ), '')
+    FROM movies m
+    WHERE m.movie_id NOT IN (SELECT movie_id FROM movie_search);
+
 -- Populating MOVIES table with values
 INSERT OR IGNORE INTO movies (movie_id, title, release_year, genre)
     VALUES
@@ -5,6 +5,7 @@ This package provides functionality to initialize a movie database, add movies a
 search for movies, display information, and more.
 
 Modules:
+    repository: Holds the shared, tuned SQLite connection used by the other modules.
     db_init: Contains database initialization functions.
     data_insertion: Handles adding movies and actors.
     data_display: Provides functions to display movie, actor, and genre data.
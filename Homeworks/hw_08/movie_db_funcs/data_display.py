@@ -7,7 +7,7 @@ and actor ages.
 
 Requires:
     sqlite3: A built-in Python module for working with SQLite databases.
-    .utils: A custom utility module containing the movie_age function.
+    .repository: The shared connection layer (movie_age is registered on the connection).
 
 Functions:
     show_entire_library: Display all movies and associated actors.
@@ -19,7 +19,7 @@ Functions:
 """
 
 import sqlite3
-from .utils import movie_age
+from .repository import read
 
 
 # ---- Display all movies and their cast ----
@@ -31,8 +31,6 @@ def show_entire_library():
     """
     try:
         print("\nList of all movies with the cast:")
-        sqlite_connection = sqlite3.connect('movie_database.db')
-        cursor = sqlite_connection.cursor()
 
         sqlite_select_entire_library = '''
             SELECT m.title, a.name
@@ -42,22 +40,16 @@ def show_entire_library():
             ORDER BY 1, 2;
         '''
 
-        cursor.execute(sqlite_select_entire_library)
-        movie_library = cursor.fetchall()
+        with read() as cursor:
+            cursor.execute(sqlite_select_entire_library)
+            movie_library = cursor.fetchall()
 
         for entry in movie_library:
             print(f"Movie: {entry[0]}. Actor: {entry[1]}")
 
-        sqlite_connection.commit()
-        cursor.close()
-
     except sqlite3.Error as error:
         print("Error working with SQLite", error)
 
-    finally:
-        if sqlite_connection:
-            sqlite_connection.close()
-
 
 # ---- Display all unique movie genres ----
 def show_unique_genres():
@@ -68,8 +60,6 @@ def show_unique_genres():
     """
     try:
         print("\nList of unique genres:")
-        sqlite_connection = sqlite3.connect('movie_database.db')
-        cursor = sqlite_connection.cursor()
 
         sqlite_select_unique_genres = '''
             SELECT DISTINCT genre
@@ -77,23 +67,17 @@ def show_unique_genres():
             ORDER BY genre;
         '''
 
-        cursor.execute(sqlite_select_unique_genres)
-        genre_list = cursor.fetchall()
+        with read() as cursor:
+            cursor.execute(sqlite_select_unique_genres)
+            genre_list = cursor.fetchall()
 
         print("Genres:")
         for genre in genre_list:
             print(f"- {genre[0]}")
 
-        sqlite_connection.commit()
-        cursor.close()
-
     except sqlite3.Error as error:
         print("Error working with SQLite", error)
 
-    finally:
-        if sqlite_connection:
-            sqlite_connection.close()
-
 
 # ---- Count movies by genre ----
 def count_movies_by_genre():
@@ -104,8 +88,6 @@ def count_movies_by_genre():
     """
     try:
         print("\nNumber of movies by genre:")
-        sqlite_connection = sqlite3.connect('movie_database.db')
-        cursor = sqlite_connection.cursor()
 
         sqlite_count_movies_by_genre = '''
             SELECT genre, count(movie_id)
@@ -114,22 +96,16 @@ def count_movies_by_genre():
             ORDER BY genre;
         '''
 
-        cursor.execute(sqlite_count_movies_by_genre)
-        movies_by_genre = cursor.fetchall()
+        with read() as cursor:
+            cursor.execute(sqlite_count_movies_by_genre)
+            movies_by_genre = cursor.fetchall()
 
         for number, genre in enumerate(movies_by_genre, 1):
             print(f"{number}. {genre[0]}: {genre[1]}")
 
-        sqlite_connection.commit()
-        cursor.close()
-
     except sqlite3.Error as error:
         print("Error working with SQLite", error)
 
-    finally:
-        if sqlite_connection:
-            sqlite_connection.close()
-
 
 # ---- Calculate and display average actor age in each genre ----
 def avg_actor_age_in_genre():
@@ -140,8 +116,6 @@ def avg_actor_age_in_genre():
     """
     try:
         print("\nAverage cast age in genre:")
-        sqlite_connection = sqlite3.connect('movie_database.db')
-        cursor = sqlite_connection.cursor()
 
         sqlite_avg_actor_age_in_genre = '''
             SELECT m.genre, AVG(DATE('now') - a.birth_year)
@@ -152,23 +126,17 @@ def avg_actor_age_in_genre():
             ORDER BY genre;
         '''
 
-        cursor.execute(sqlite_avg_actor_age_in_genre)
-        avg_age_in_genre = cursor.fetchall()
+        with read() as cursor:
+            cursor.execute(sqlite_avg_actor_age_in_genre)
+            avg_age_in_genre = cursor.fetchall()
 
         for number, entry in enumerate(avg_age_in_genre, 1):
             print(f"{number}. Genre: {(entry[0].lower())}, "
                   f"average cast age: {round(entry[1])}")
 
-        sqlite_connection.commit()
-        cursor.close()
-
     except sqlite3.Error as error:
         print("Error working with SQLite", error)
 
-    finally:
-        if sqlite_connection:
-            sqlite_connection.close()
-
 
 # ---- Display a combined list of all movies and actors ----
 def list_everything():
@@ -179,8 +147,6 @@ def list_everything():
     """
     try:
         print("\nAll actors and movies:")
-        sqlite_connection = sqlite3.connect('movie_database.db')
-        cursor = sqlite_connection.cursor()
 
         select_list_of_everything = '''
             SELECT title, "Movie" AS Type
@@ -191,8 +157,9 @@ def list_everything():
             ORDER BY 2, 1;
         '''
 
-        cursor.execute(select_list_of_everything)
-        list_of_everything = cursor.fetchall()
+        with read() as cursor:
+            cursor.execute(select_list_of_everything)
+            list_of_everything = cursor.fetchall()
 
         if list_of_everything:
             for number, item in enumerate(list_of_everything, 1):
@@ -200,16 +167,9 @@ def list_everything():
         else:
             print("No actors or movies found.")
 
-        sqlite_connection.commit()
-        cursor.close()
-
     except sqlite3.Error as error:
         print("Error working with SQLite", error)
 
-    finally:
-        if sqlite_connection:
-            sqlite_connection.close()
-
 
 # ---- Display movies and their ages ----
 def list_movies_and_age():
@@ -222,10 +182,6 @@ def list_movies_and_age():
     """
     try:
         print("\nMovies and their age:")
-        sqlite_connection = sqlite3.connect('movie_database.db')
-        cursor = sqlite_connection.cursor()
-
-        sqlite_connection.create_function("movie_age", 1, movie_age)
 
         select_movies_and_age = '''
             SELECT title, movie_age(release_year)
@@ -233,8 +189,9 @@ def list_movies_and_age():
             ORDER BY title;
         '''
 
-        cursor.execute(select_movies_and_age)
-        list_of_movies_and_age = cursor.fetchall()
+        with read() as cursor:
+            cursor.execute(select_movies_and_age)
+            list_of_movies_and_age = cursor.fetchall()
 
         if list_of_movies_and_age:
             for number, item in enumerate(list_of_movies_and_age, 1):
@@ -242,12 +199,5 @@ def list_movies_and_age():
         else:
             print("No movies found.")
 
-        sqlite_connection.commit()
-        cursor.close()
-
     except sqlite3.Error as error:
         print("Error working with SQLite", error)
-
-    finally:
-        if sqlite_connection:
-            sqlite_connection.close()
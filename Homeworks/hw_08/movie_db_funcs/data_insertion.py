@@ -6,6 +6,7 @@ to a movie database, using UUIDs for unique identification.
 
 Requires:
     sqlite3: A built-in Python module for working with SQLite databases.
+    .repository: The shared connection layer.
     .utils: A custom utility module containing the create_uuid function.
 
 Functions:
@@ -14,6 +15,7 @@ Functions:
     add_movie: Add a new movie to the database and optionally add cast members.
 """
 
+from .repository import read, transaction
 from .utils import create_uuid
 import sqlite3
 
@@ -30,9 +32,6 @@ def add_movie_cast(movie_id, actor_id):
     :raises sqlite3.Error: If any error occurs during database interaction.
     """
     try:
-        sqlite_connection = sqlite3.connect('movie_database.db')
-        cursor = sqlite_connection.cursor()
-
         sqlite_add_movie_cast = '''
             INSERT OR IGNORE INTO movie_cast
             (movie_cast_id, movie_id, actor_id)
@@ -41,18 +40,12 @@ def add_movie_cast(movie_id, actor_id):
 
         movie_cast_id = create_uuid()
         data = (movie_cast_id, movie_id, actor_id)
-        cursor.execute(sqlite_add_movie_cast, data)
-
-        sqlite_connection.commit()
-        cursor.close()
+        with transaction() as cursor:
+            cursor.execute(sqlite_add_movie_cast, data)
 
     except sqlite3.Error as error:
         print("Error working with SQLite", error)
 
-    finally:
-        if sqlite_connection:
-            sqlite_connection.close()
-
 
 # ---- Add new actor to the database ----
 def add_actor():
@@ -67,8 +60,6 @@ def add_actor():
     """
     try:
         print("\nAdding actor.", end='')
-        sqlite_connection = sqlite3.connect('movie_database.db')
-        cursor = sqlite_connection.cursor()
 
         sqlite_insert_actor = '''
             INSERT OR IGNORE INTO actors
@@ -102,22 +93,16 @@ def add_actor():
             break
 
         data = (actor_id, name, year)
-        cursor.execute(sqlite_insert_actor, data)
+        with transaction() as cursor:
+            cursor.execute(sqlite_insert_actor, data)
         print(f"\nActor/actress {name} was added to the database.")
 
-        sqlite_connection.commit()
-        cursor.close()
-
         return name, year
 
     except sqlite3.Error as error:
         print("Error working with SQLite", error)
         return None
 
-    finally:
-        if sqlite_connection:
-            sqlite_connection.close()
-
 
 # ---- Add new movie to the database ----
 def add_movie():
@@ -130,8 +115,6 @@ def add_movie():
     """
     try:
         print("\nAdding movie", end='')
-        sqlite_connection = sqlite3.connect('movie_database.db')
-        cursor = sqlite_connection.cursor()
 
         sqlite_insert_movie = '''
             INSERT OR IGNORE INTO movies
@@ -173,12 +156,10 @@ def add_movie():
             break
 
         data = (movie_id, title, year, genre)
-        cursor.execute(sqlite_insert_movie, data)
+        with transaction() as cursor:
+            cursor.execute(sqlite_insert_movie, data)
         print(f'\nMovie "{title}" was added to the database.')
 
-        sqlite_connection.commit()
-        cursor.close()
-
         # ---- Add cast to movie ----
         print("Would you like to add cast to this movie?")
         print("1. Add a new actor/actress")
@@ -207,16 +188,14 @@ def add_movie():
         elif actor_input == 2:
             # Code block for adding existing actor
             try:
-                sqlite_connection = sqlite3.connect('movie_database.db')
-                cursor = sqlite_connection.cursor()
-
                 sqlite_select_all_actor = '''
                     SELECT rowid, actor_id, name
                     FROM actors;
                 '''
 
-                cursor.execute(sqlite_select_all_actor)
-                list_of_actors = cursor.fetchall()
+                with read() as cursor:
+                    cursor.execute(sqlite_select_all_actor)
+                    list_of_actors = cursor.fetchall()
                 print("\nAvailable actors:")
 
                 for actor in list_of_actors:
@@ -246,24 +225,14 @@ def add_movie():
 
                 selected_actor = list_of_actors[actor_no_input - 1][1]
                 cast_insert = (create_uuid(), movie_id, selected_actor)
-                cursor.execute(sqlite_insert_an_actor, cast_insert)
+                with transaction() as cursor:
+                    cursor.execute(sqlite_insert_an_actor, cast_insert)
 
                 selected_actor_name = list_of_actors[actor_no_input - 1][2]
                 print(f"\n{selected_actor_name} was added to the cast of {title}")
 
-                sqlite_connection.commit()
-                cursor.close()
-
             except sqlite3.Error as error:
                 print("Error working with SQLite", error)
 
-            finally:
-                if sqlite_connection:
-                    sqlite_connection.close()
-
     except sqlite3.Error as error:
         print("Error working with SQLite", error)
-
-    finally:
-        if sqlite_connection:
-            sqlite_connection.close()
@@ -1,45 +1,40 @@
 """
 Database initialization module for a movie database.
 
-This module provides a function to initialize an SQLite database using an SQL script
-and creates a custom function for generating UUIDs within SQL queries.
+This module provides a function to initialize an SQLite database using an SQL script.
+The custom function for generating UUIDs within SQL queries is registered on the
+shared connection.
 
 Requires:
     sqlite3: A built-in Python module for working with SQLite databases.
-    .utils: A custom utility module containing the create_uuid function.
+    .repository: The shared connection layer.
 
 Functions:
-    init_database: Initialize the SQLite database and create a custom UUID function.
+    init_database: Initialize the SQLite database.
 """
 
-from .utils import create_uuid
+from .repository import get_connection
 import sqlite3
 
 
-# ---- Initialize database and set up UUID function ----
+# ---- Initialize database ----
 def init_database():
     """
     Initialize the SQLite database using a SQL script file.
-    Creates a function for generating UUIDs within SQL queries.
+    The uuid() SQL function comes from the shared connection.
 
     :raises sqlite3.Error: If any error occurs during database interaction.
     """
     try:
-        sqlite_connection = sqlite3.connect('movie_database.db')
-        cursor = sqlite_connection.cursor()
-
         with open("movie_database_init.sql", 'r', encoding='utf-8') as script_file:
             init_script = script_file.read()
 
-        sqlite_connection.create_function("uuid", 0, create_uuid)
-        cursor.executescript(init_script)
-
-        sqlite_connection.commit()
-        cursor.close()
+        # Run the whole script as one transaction instead of one per statement
+        get_connection().executescript(f"BEGIN;\n{init_script};\nCOMMIT;")
 
     except sqlite3.Error as error:
+        # A failed statement leaves the script's transaction open on the shared
+        # connection; later writes would join it and never be committed
+        if get_connection().in_transaction:
+            get_connection().execute('ROLLBACK')
         print("Error working with SQLite", error)
-
-    finally:
-        if sqlite_connection:
-            sqlite_connection.close()
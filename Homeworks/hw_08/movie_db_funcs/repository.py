@@ -0,0 +1,132 @@
+"""
+Shared SQLite connection layer for the movie database.
+
+This module keeps one long-lived connection per thread instead of opening a new
+one for every query. The connection is tuned once when it is opened (WAL journal,
+relaxed fsync, in-memory temp storage, larger page cache) and keeps a cache of
+prepared statements, so repeated queries are not parsed again. Reads run in
+autocommit mode without a transaction; writes go through an explicit
+transaction that is committed or rolled back as a whole.
+
+Requires:
+    sqlite3: A built-in Python module for working with SQLite databases.
+    threading: A built-in Python module, used to keep one connection per thread.
+    atexit: A built-in Python module, used to close the connection on exit.
+    .utils: A custom utility module containing the create_uuid and movie_age functions.
+
+Functions:
+    get_connection: Return the connection of the current thread, opening it on first use.
+    read: Context manager yielding a cursor for read-only queries.
+    transaction: Context manager yielding a cursor inside a write transaction.
+    close_connection: Close the connection of the current thread.
+"""
+
+import atexit
+import sqlite3
+import threading
+from contextlib import contextmanager
+
+from .utils import create_uuid, movie_age
+
+
+DB_PATH = 'movie_database.db'
+
+# Prepared statements kept per connection, keyed by SQL text
+STATEMENT_CACHE_SIZE = 256
+
+PRAGMAS = (
+    'PRAGMA journal_mode = WAL',
+    'PRAGMA synchronous = NORMAL',
+    'PRAGMA foreign_keys = ON',
+    'PRAGMA temp_store = MEMORY',
+    'PRAGMA cache_size = -20000',  # 20 MB
+    'PRAGMA mmap_size = 268435456',  # 256 MB
+    'PRAGMA busy_timeout = 5000',
+)
+
+_local = threading.local()
+
+
+# ---- Connection management ----
+def get_connection():
+    """
+    Return the connection of the current thread, opening and tuning it on first use.
+
+    The connection runs in autocommit mode (isolation_level=None); use
+    transaction() to group writes.
+
+    :return: The shared SQLite connection.
+    :rtype: sqlite3.Connection
+    """
+    connection = getattr(_local, 'connection', None)
+    if connection is None:
+        connection = sqlite3.connect(
+            DB_PATH,
+            isolation_level=None,
+            cached_statements=STATEMENT_CACHE_SIZE,
+        )
+        for pragma in PRAGMAS:
+            connection.execute(pragma)
+        connection.create_function("uuid", 0, create_uuid)
+        connection.create_function("movie_age", 1, movie_age)
+        _local.connection = connection
+    return connection
+
+
+@contextmanager
+def read():
+    """
+    Yield a cursor for read-only queries; nothing is committed.
+
+    :return: A cursor on the shared connection.
+    :rtype: sqlite3.Cursor
+    """
+    cursor = get_connection().cursor()
+    try:
+        yield cursor
+    finally:
+        cursor.close()
+
+
+@contextmanager
+def transaction():
+    """
+    Yield a cursor inside a write transaction.
+
+    The transaction is committed when the block ends and rolled back if it
+    raises. Nested use joins the outer transaction.
+
+    :return: A cursor on the shared connection.
+    :rtype: sqlite3.Cursor
+    """
+    connection = get_connection()
+    cursor = connection.cursor()
+    if connection.in_transaction:
+        try:
+            yield cursor
+        finally:
+            cursor.close()
+        return
+
+    cursor.execute('BEGIN IMMEDIATE')
+    try:
+        yield cursor
+        cursor.execute('COMMIT')
+    except BaseException:
+        cursor.execute('ROLLBACK')
+        raise
+    finally:
+        cursor.close()
+
+
+def close_connection():
+    """
+    Close the connection of the current thread, if it is open.
+    """
+    connection = getattr(_local, 'connection', None)
+    if connection is not None:
+        _local.connection = None
+        connection.close()
+
+
+atexit.register(close_connection)
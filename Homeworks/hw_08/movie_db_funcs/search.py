@@ -4,24 +4,60 @@ Module for interacting with a movie database using SQLite.
 This module provides functions to search for movies by a keyword and
 display movies in a paginated format from an SQLite database.
 
+Keyword search runs against the movie_search FTS5 index (titles, genres
+and cast names), which triggers in movie_database_init.sql keep in sync.
+
 Requires:
     sqlite3: A built-in Python module for working with SQLite databases.
+    re: A built-in Python module for regular expressions, used to split
+    keywords into search terms.
     math: A built-in Python module for mathematical operations, used for
     calculating the number of pages in pagination.
+    .repository: The shared connection layer.
 
 Functions:
-    find_movie_by_keyword: Search for movies by a keyword in the title.
+    build_match_query: Turn user input into an FTS5 prefix query.
+    find_movie_by_keyword: Search for movies by keyword in titles, genres and cast.
     show_movies_page_by_page: Display movies in a paginated format.
 """
 
 import sqlite3
 import math
+import re
+
+from .repository import read
+
+
+SEARCH_RESULTS_LIMIT = 50
+
+# Column weights for bm25(): movie_id (not indexed), title, genre, cast_names
+SEARCH_WEIGHTS = (0.0, 10.0, 2.0, 5.0)
+
+
+# ---- Build full-text query ----
+def build_match_query(keyword):
+    """
+    Turn user input into an FTS5 query matching every word as a prefix.
+
+    Words are quoted, so FTS5 operators and punctuation in the input are
+    searched as plain text.
+
+    :param keyword: The text entered by the user.
+    :type keyword: str
+    :return: The MATCH expression, or None if the input has no words.
+    :rtype: str or None
+    """
+    terms = re.findall(r'\w+', keyword)
+    if not terms:
+        return None
+    return ' '.join(f'"{term}"*' for term in terms)
 
 
 # ---- Find movie by keyword ----
 def find_movie_by_keyword():
     """
-    Search for movies by a keyword in the title and display the results.
+    Search for movies by keywords in titles, genres and cast names and display
+    the best matches first.
 
     Prompts the user for input to enter a keyword for the search.
 
@@ -29,20 +65,25 @@ def find_movie_by_keyword():
     """
     try:
         print("\nSearching for a movie by keyword:")
-        sqlite_connection = sqlite3.connect('movie_database.db')
-        cursor = sqlite_connection.cursor()
 
-        movies_by_keyword = '''
-            SELECT title, release_year
-            FROM movies
-            WHERE title LIKE ?;
+        movies_by_keyword = f'''
+            SELECT movies.title, movies.release_year
+            FROM movie_search
+            JOIN movies ON movies.movie_id = movie_search.movie_id
+            WHERE movie_search MATCH ?
+            ORDER BY bm25(movie_search, {', '.join(map(str, SEARCH_WEIGHTS))})
+            LIMIT ?;
         '''
 
         print("\nEnter keyword: ")
         keyword = input(">>> ")
-        keyword = f"%{keyword}%"
-        cursor.execute(movies_by_keyword, (keyword,))
-        movies_by_keyword_list = cursor.fetchall()
+        match_query = build_match_query(keyword)
+
+        movies_by_keyword_list = []
+        if match_query:
+            with read() as cursor:
+                cursor.execute(movies_by_keyword, (match_query, SEARCH_RESULTS_LIMIT))
+                movies_by_keyword_list = cursor.fetchall()
 
         if movies_by_keyword_list:
             print("\nFound movies:")
@@ -51,16 +92,9 @@ def find_movie_by_keyword():
         else:
             print("No movies found with that keyword.")
 
-        sqlite_connection.commit()
-        cursor.close()
-
     except sqlite3.Error as error:
         print("Error working with SQLite", error)
 
-    finally:
-        if sqlite_connection:
-            sqlite_connection.close()
-
 
 # ---- Paginate movies display ----
 def show_movies_page_by_page():
@@ -74,8 +108,6 @@ def show_movies_page_by_page():
     """
     try:
         print("\nList of movies page by page:")
-        sqlite_connection = sqlite3.connect('movie_database.db')
-        cursor = sqlite_connection.cursor()
 
         sqlite_select_total_pages = '''
             SELECT CAST(COUNT(movie_id) AS REAL) / ?
@@ -95,8 +127,9 @@ def show_movies_page_by_page():
                 continue
             break
 
-        cursor.execute(sqlite_select_total_pages, (movies_by_page,))
-        total_pages = math.ceil(cursor.fetchone()[0])
+        with read() as cursor:
+            cursor.execute(sqlite_select_total_pages, (movies_by_page,))
+            total_pages = math.ceil(cursor.fetchone()[0])
 
         sqlite_select_page_with_movies = '''
             SELECT title
@@ -111,8 +144,9 @@ def show_movies_page_by_page():
         movie_index = 1
 
         while True:
-            cursor.execute(sqlite_select_page_with_movies, (movies_by_page, offset))
-            output = cursor.fetchall()
+            with read() as cursor:
+                cursor.execute(sqlite_select_page_with_movies, (movies_by_page, offset))
+                output = cursor.fetchall()
 
             print(f"\nPage {page_counter} of {total_pages}")
             for number, movie in enumerate(output, movie_index):
@@ -139,12 +173,5 @@ def show_movies_page_by_page():
             else:
                 break
 
-        sqlite_connection.commit()
-        cursor.close()
-
     except sqlite3.Error as error:
         print("Error working with SQLite", error)
-
-    finally:
-        if sqlite_connection:
-            sqlite_connection.close()
@@ -0,0 +1,157 @@
+import math
+import statistics
+import time
+import tracemalloc
+
+from django.contrib.auth.models import AnonymousUser
+from django.db import connection
+from django.test.client import RequestFactory
+from django.test.utils import CaptureQueriesContext
+
+from . import views
+from .models import Book, Review
+
+
+# ---- Scenarios ----
+def books_reviews_plain():
+    """Books and Reviews without optimization."""
+    for book in Book.objects.all():
+        for review in book.reviews.all():
+            review.rating
+
+
+def books_reviews_prefetch():
+    """Books and Reviews with prefetch_related."""
+    for book in Book.objects.prefetch_related('reviews').all():
+        for review in book.reviews.all():
+            review.rating
+
+
+def books_authors_plain():
+    """Books and Authors without optimization."""
+    for book in Book.objects.all():
+        for author in book.authors.all():
+            author.name
+
+
+def books_authors_prefetch():
+    """Books and Authors with prefetch_related."""
+    for book in Book.objects.prefetch_related('authors').all():
+        for author in book.authors.all():
+            author.name
+
+
+def reviews_books_plain():
+    """Reviews and Books without optimization."""
+    for review in Review.objects.all():
+        review.book.title
+
+
+def reviews_books_select():
+    """Reviews and Books with select_related."""
+    for review in Review.objects.select_related('book').all():
+        review.book.title
+
+
+def _render_view(view, path):
+    request = RequestFactory().get(path)
+    request.user = AnonymousUser()
+    response = view(request)
+    response.content  # Force template rendering
+
+
+def view_book_list():
+    """The book_list view, rendered."""
+    _render_view(views.book_list, '/books/list/')
+
+
+def view_orm_queries():
+    """The orm_queries view, rendered."""
+    _render_view(views.orm_queries, '/books/orm_queries/')
+
+
+SCENARIOS = {
+    'books_reviews_plain': books_reviews_plain,
+    'books_reviews_prefetch': books_reviews_prefetch,
+    'books_authors_plain': books_authors_plain,
+    'books_authors_prefetch': books_authors_prefetch,
+    'reviews_books_plain': reviews_books_plain,
+    'reviews_books_select': reviews_books_select,
+    'view_book_list': view_book_list,
+    'view_orm_queries': view_orm_queries,
+}
+
+
+# ---- Runner ----
+def _percentile(values, percent):
+    """
+    Return the nearest-rank percentile of a list of numbers.
+
+    :param values: The measured values.
+    :param percent: The percentile, 0-100.
+    :return: The percentile value.
+    """
+    ordered = sorted(values)
+    rank = max(1, math.ceil(len(ordered) * percent / 100))
+    return ordered[rank - 1]
+
+
+def run_scenario(func, warmup=1, repeat=5):
+    """
+    Measure one scenario.
+
+    Warmup runs fill connection and template caches and are not measured.
+    Timed runs use perf_counter; the query count is taken from the last
+    timed run, and peak memory from one extra run under tracemalloc, so
+    tracing does not distort the timings.
+
+    :param func: The scenario callable.
+    :param warmup: The number of unmeasured runs.
+    :param repeat: The number of timed runs.
+    :return: A dictionary with timing, query and memory figures.
+    """
+    for _ in range(warmup):
+        func()
+
+    timings = []
+    for _ in range(repeat):
+        with CaptureQueriesContext(connection) as captured:
+            started = time.perf_counter()
+            func()
+            timings.append(time.perf_counter() - started)
+
+    tracemalloc.start()
+    try:
+        func()
+        _current, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    return {
+        'median_s': statistics.median(timings),
+        'p95_s': _percentile(timings, 95),
+        'min_s': min(timings),
+        'max_s': max(timings),
+        'queries': len(captured.captured_queries),
+        'peak_memory_kib': round(peak / 1024, 1),
+        'runs': repeat,
+    }
+
+
+def run_benchmarks(names=None, warmup=1, repeat=5, on_result=None):
+    """
+    Run the selected scenarios (all by default) in a fixed order.
+
+    :param names: Scenario names to run, or None for all of them.
+    :param warmup: The number of unmeasured runs per scenario.
+    :param repeat: The number of timed runs per scenario.
+    :param on_result: Optional callable receiving (name, result) as each
+        scenario finishes.
+    :return: A dictionary of results keyed by scenario name.
+    """
+    results = {}
+    for name in names or SCENARIOS:
+        results[name] = run_scenario(SCENARIOS[name], warmup=warmup, repeat=repeat)
+        if on_result:
+            on_result(name, results[name])
+    return results
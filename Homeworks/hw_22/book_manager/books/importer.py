@@ -0,0 +1,166 @@
+import csv
+import time
+from datetime import date
+from itertools import islice
+
+from django.db import transaction
+
+from .models import Author, Book, Review
+from .ratings import refresh_books
+from .response_cache import invalidate_tags
+
+
+IMPORT_BATCH_SIZE = 2000
+
+
+# ---- Row Parsing ----
+def iter_csv_batches(csvfile, batch_size=IMPORT_BATCH_SIZE):
+    """
+    Read a books CSV as a stream and yield its rows in fixed-size batches.
+
+    Only one batch is held in memory at a time, whatever the file size.
+
+    :param csvfile: An open text file with the CSV data.
+    :param batch_size: The number of rows per batch.
+    :return: An iterator of lists of row dictionaries.
+    """
+    reader = csv.DictReader(csvfile)
+    reader.fieldnames = [field.strip() for field in reader.fieldnames]  # Normalize field names
+    while True:
+        batch = list(islice(reader, batch_size))
+        if not batch:
+            break
+        yield batch
+
+
+def _parse_row(row):
+    """
+    Convert a CSV row into author, book and optional review values.
+
+    :param row: A row dictionary from the CSV reader.
+    :return: A tuple of (author key, book key, review tuple or None).
+    """
+    author_key = (row['author'], date.fromisoformat(row['date_of_birth']))
+    book_key = (row['title'], date.fromisoformat(row['publication_date']))
+
+    review = None
+    reviewer_name = row.get('reviewer_name')
+    rating = row.get('rating')
+    comment = row.get('comment')
+    if reviewer_name and rating and comment:
+        review = (reviewer_name, int(rating), comment)
+    return author_key, book_key, review
+
+
+# ---- Batch Resolution ----
+def _fetch_authors(keys):
+    """
+    Map (name, date_of_birth) keys to ids of existing authors with one query.
+    """
+    names = {name for name, _ in keys}
+    return {
+        (name, dob): pk
+        for pk, name, dob in Author.objects.filter(name__in=names).values_list('id', 'name', 'date_of_birth')
+        if (name, dob) in keys
+    }
+
+
+def _fetch_books(keys):
+    """
+    Map (title, publication_date) keys to ids of existing books with one query.
+    """
+    titles = {title for title, _ in keys}
+    return {
+        (title, published): pk
+        for pk, title, published in Book.objects.filter(title__in=titles).values_list('id', 'title', 'publication_date')
+        if (title, published) in keys
+    }
+
+
+def _resolve(keys, fetch, build, model):
+    """
+    Return ids for all keys, bulk-inserting the ones that do not exist yet.
+
+    Ids of the inserted rows are read back with a second lookup, so this
+    does not rely on the database returning primary keys from bulk inserts.
+    """
+    ids = fetch(keys)
+    missing = [key for key in keys if key not in ids]
+    if missing:
+        model.objects.bulk_create([build(key) for key in missing], batch_size=IMPORT_BATCH_SIZE)
+        ids.update(fetch(set(missing)))
+    return ids
+
+
+def import_batch(rows):
+    """
+    Import one batch of CSV rows with a fixed number of queries.
+
+    Authors and books are looked up once per batch and only missing ones are
+    inserted; author links and reviews are written with bulk inserts.
+
+    :param rows: A list of row dictionaries from the CSV reader.
+    :return: The number of reviews created.
+    """
+    parsed = [_parse_row(row) for row in rows]
+    author_keys = {author_key for author_key, _, _ in parsed}
+    book_keys = {book_key for _, book_key, _ in parsed}
+
+    with transaction.atomic():
+        author_ids = _resolve(
+            author_keys, _fetch_authors,
+            lambda key: Author(name=key[0], date_of_birth=key[1]), Author,
+        )
+        book_ids = _resolve(
+            book_keys, _fetch_books,
+            lambda key: Book(title=key[0], publication_date=key[1]), Book,
+        )
+
+        # ---- Associate Authors with Books ----
+        BookAuthor = Book.authors.through
+        links = {(book_ids[book_key], author_ids[author_key]) for author_key, book_key, _ in parsed}
+        existing_links = set(
+            BookAuthor.objects.filter(book_id__in={book_id for book_id, _ in links})
+            .values_list('book_id', 'author_id')
+        )
+        BookAuthor.objects.bulk_create(
+            [BookAuthor(book_id=book_id, author_id=author_id) for book_id, author_id in links - existing_links],
+            batch_size=IMPORT_BATCH_SIZE,
+        )
+
+        # ---- Create Reviews ----
+        reviews = [
+            Review(book_id=book_ids[book_key], reviewer_name=review[0], rating=review[1], comment=review[2])
+            for _, book_key, review in parsed
+            if review
+        ]
+        Review.objects.bulk_create(reviews, batch_size=IMPORT_BATCH_SIZE)
+
+        # Bulk inserts send no signals, refresh rating aggregates explicitly
+        refresh_books({review.book_id for review in reviews})
+
+    return len(reviews)
+
+
+def import_books(csvfile, batch_size=IMPORT_BATCH_SIZE, progress=None):
+    """
+    Import books, authors, and reviews from a CSV stream batch by batch.
+
+    Bulk inserts send no model signals, so cached pages are invalidated
+    once at the end.
+
+    :param csvfile: An open text file with the CSV data.
+    :param batch_size: The number of rows per batch.
+    :param progress: Optional callable receiving (rows, reviews, elapsed seconds)
+        after every batch.
+    :return: A tuple of (rows processed, reviews created).
+    """
+    started = time.perf_counter()
+    rows_done = reviews_done = 0
+    for batch in iter_csv_batches(csvfile, batch_size):
+        reviews_done += import_batch(batch)
+        rows_done += len(batch)
+        if progress:
+            progress(rows_done, reviews_done, time.perf_counter() - started)
+    invalidate_tags('books', 'authors', 'reviews')
+    return rows_done, reviews_done
@@ -1,8 +1,15 @@
 from django.core.management.base import BaseCommand
+from django.db.models import Max
 from faker import Faker
 import random
 
+from books.management.commands._options import positive_int
 from books.models import Author, Book, Review
+from books.ratings import reconcile_rating_aggregates
+from books.response_cache import invalidate_tags
+
+
+BATCH_SIZE = 5000
 
 
 class Command(BaseCommand):
@@ -11,65 +18,107 @@ class Command(BaseCommand):
 
     This command generates a specified number of authors, books, and reviews
     using the Faker library and randomization. The generated data is stored
-    in the database.
+    in the database with bulk inserts, so it scales to benchmark datasets.
     """
     help = 'Populate the database with fake authors, books, and reviews.'
 
+    def add_arguments(self, parser):
+        """
+        Add dataset size options.
+
+        :param parser: The argument parser of the command.
+        """
+        parser.add_argument('--authors', type=int, default=20, help='Number of authors to create.')
+        parser.add_argument('--books', type=int, default=50, help='Number of books to create.')
+        parser.add_argument('--max-reviews', type=positive_int, default=3, help='Maximum number of reviews per book.')
+        parser.add_argument('--seed', type=int, default=None, help='Random seed for a reproducible dataset.')
+
     def handle(self, *args, **options):
         """
         Create fake authors, books, and reviews and populate the database.
 
         This method generates:
-        - 20 authors with random names and birthdates.
-        - 50 books with random titles, publication dates, and authors.
-        - 1–3 reviews per book with random reviewer names, ratings, and comments.
+        - `--authors` authors with random names and birthdates.
+        - `--books` books with random titles, publication dates, and 1–2 authors.
+        - 1–`--max-reviews` reviews per book with random reviewer names, ratings, and comments.
 
         :param args: Additional positional arguments (not used).
-        :param options: Additional keyword arguments (not used).
+        :param options: Dataset size options.
         """
         fake = Faker()
-        num_authors = 20  # Number of authors to create
-        num_books = 50    # Number of books to create
+        rng = random.Random(options['seed'])
+        if options['seed'] is not None:
+            fake.seed_instance(options['seed'])
+        num_authors = options['authors']  # Number of authors to create
+        num_books = options['books']      # Number of books to create
 
         # ---- Create Authors ----
-        authors = []
-        for _ in range(num_authors):
-            first_name = fake.first_name()
-            last_name = fake.last_name()
-            date_of_birth = fake.date_of_birth(minimum_age=25, maximum_age=80)
-            author = Author.objects.create(
-                name=f'{first_name} {last_name}',
-                date_of_birth=date_of_birth
+        author_ids = self._bulk_create(Author, (
+            Author(
+                name=f'{fake.first_name()} {fake.last_name()}',
+                date_of_birth=fake.date_of_birth(minimum_age=25, maximum_age=80)
             )
-            authors.append(author)
+            for _ in range(num_authors)
+        ))
 
         # ---- Create Books ----
-        books = []
-        for _ in range(num_books):
-            title = fake.catch_phrase()
-            publication_date = fake.date_between(start_date='-10y', end_date='today')
-            book = Book.objects.create(
-                title=title,
-                publication_date=publication_date
+        book_ids = self._bulk_create(Book, (
+            Book(
+                title=fake.catch_phrase(),
+                publication_date=fake.date_between(start_date='-10y', end_date='today')
             )
-            # Assign random authors to the book
-            num_book_authors = random.randint(1, 2)
-            book_authors = random.sample(authors, num_book_authors)
-            book.authors.add(*book_authors)
-            books.append(book)
+            for _ in range(num_books)
+        ))
+
+        # Assign random authors to the books
+        BookAuthor = Book.authors.through
+        self._bulk_create(BookAuthor, return_ids=False, objects=(
+            BookAuthor(book_id=book_id, author_id=author_id)
+            for book_id in book_ids
+            for author_id in rng.sample(author_ids, min(rng.randint(1, 2), len(author_ids)))
+        ))
 
         # ---- Create Reviews ----
-        for book in books:
-            num_reviews = random.randint(1, 3)
-            for _ in range(num_reviews):
-                reviewer_name = fake.first_name()
-                rating = random.randint(1, 5)
-                comment = fake.paragraph(nb_sentences=3)
-                Review.objects.create(
-                    book=book,
-                    reviewer_name=reviewer_name,
-                    rating=rating,
-                    comment=comment
-                )
+        self._bulk_create(Review, return_ids=False, objects=(
+            Review(
+                book_id=book_id,
+                reviewer_name=fake.first_name(),
+                rating=rng.randint(1, 5),
+                comment=fake.paragraph(nb_sentences=3)
+            )
+            for book_id in book_ids
+            for _ in range(rng.randint(1, options['max_reviews']))
+        ))
+
+        # Bulk inserts send no signals: fill the rating aggregates and drop
+        # cached pages that predate the new rows
+        reconcile_rating_aggregates()
+        invalidate_tags('books', 'authors', 'reviews')
 
         self.stdout.write(self.style.SUCCESS('Successfully populated the database.'))
+
+    @staticmethod
+    def _bulk_create(model, objects, return_ids=True):
+        """
+        Insert objects in batches and return the ids of the new rows.
+
+        Ids are read back by range, so this does not depend on the database
+        returning primary keys from bulk inserts.
+
+        :param model: The model class of the objects.
+        :param objects: An iterable of unsaved instances.
+        :param return_ids: Whether to read back the ids of the created rows.
+        :return: The ids of the created rows, or None.
+        """
+        last_id = model.objects.aggregate(last_id=Max('id'))['last_id'] or 0
+        batch = []
+        for obj in objects:
+            batch.append(obj)
+            if len(batch) >= BATCH_SIZE:
+                model.objects.bulk_create(batch)
+                batch = []
+        if batch:
+            model.objects.bulk_create(batch)
+        if not return_ids:
+            return None
+        return list(model.objects.filter(id__gt=last_id).order_by('id').values_list('id', flat=True))
@@ -0,0 +1,18 @@
+import argparse
+
+
+def positive_int(value):
+    """
+    Parse a command-line option that must be at least 1.
+
+    :param value: The raw option value.
+    :return: The parsed integer.
+    :raises argparse.ArgumentTypeError: If the value is not a positive integer.
+    """
+    try:
+        number = int(value)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"invalid int value: {value!r}")
+    if number < 1:
+        raise argparse.ArgumentTypeError(f"must be at least 1, got {number}")
+    return number
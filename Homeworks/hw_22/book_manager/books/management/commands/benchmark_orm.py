@@ -0,0 +1,115 @@
+import json
+import subprocess
+from datetime import datetime, timezone
+
+from django.core.management import call_command
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection
+
+from books.benchmarks import SCENARIOS, run_benchmarks
+from books.management.commands._options import positive_int
+from books.models import Author, Book, Review
+
+
+class Command(BaseCommand):
+    """
+    Run the ORM benchmark scenarios and report timings as text and JSON.
+
+    Each scenario runs with warmup and repetitions; median/p95 time, query
+    count and peak memory are reported. The JSON output also records the
+    git commit and dataset size, so runs can be compared across commits.
+    """
+    help = 'Benchmark ORM access patterns and views; optionally populate a dataset first.'
+
+    def add_arguments(self, parser):
+        """
+        Add dataset, repetition and output options.
+
+        :param parser: The argument parser of the command.
+        """
+        parser.add_argument('scenarios', nargs='*',
+                            help=f"Scenarios to run (default: all): {', '.join(SCENARIOS)}.")
+        parser.add_argument('--populate', action='store_true',
+                            help='Generate a dataset with 2_1_populate_books before running.')
+        parser.add_argument('--authors', type=int, default=200)
+        parser.add_argument('--books', type=int, default=2000)
+        parser.add_argument('--max-reviews', type=positive_int, default=5)
+        parser.add_argument('--seed', type=int, default=42)
+        parser.add_argument('--warmup', type=int, default=1)
+        parser.add_argument('--repeat', type=positive_int, default=5)
+        parser.add_argument('--json', dest='json_path', default=None,
+                            help='Write results as JSON to this file (- for standard output).')
+
+    def handle(self, *args, **options):
+        """
+        Optionally populate the database, then run and report the scenarios.
+
+        :param args: Additional positional arguments (not used).
+        :param options: Command options.
+        """
+        unknown = set(options['scenarios']) - set(SCENARIOS)
+        if unknown:
+            raise CommandError(f"Unknown scenarios: {', '.join(sorted(unknown))}")
+
+        if options['populate']:
+            call_command(
+                '2_1_populate_books',
+                authors=options['authors'],
+                books=options['books'],
+                max_reviews=options['max_reviews'],
+                seed=options['seed'],
+            )
+
+        dataset = {
+            'authors': Author.objects.count(),
+            'books': Book.objects.count(),
+            'reviews': Review.objects.count(),
+        }
+        self.stdout.write(
+            f"Dataset: {dataset['authors']} authors, {dataset['books']} books, {dataset['reviews']} reviews"
+        )
+
+        def report(name, result):
+            self.stdout.write(
+                f"{name:<24} median {result['median_s'] * 1000:9.2f} ms  "
+                f"p95 {result['p95_s'] * 1000:9.2f} ms  "
+                f"queries {result['queries']:6d}  "
+                f"peak {result['peak_memory_kib']:10.1f} KiB"
+            )
+
+        results = run_benchmarks(
+            options['scenarios'] or None,
+            warmup=options['warmup'],
+            repeat=options['repeat'],
+            on_result=report,
+        )
+
+        if options['json_path']:
+            payload = json.dumps({
+                'commit': self._git_commit(),
+                'timestamp': datetime.now(timezone.utc).isoformat(),
+                'database': connection.vendor,
+                'dataset': dataset,
+                'warmup': options['warmup'],
+                'repeat': options['repeat'],
+                'results': results,
+            }, indent=2)
+            if options['json_path'] == '-':
+                self.stdout.write(payload)
+            else:
+                with open(options['json_path'], 'w') as f:
+                    f.write(payload)
+
+    @staticmethod
+    def _git_commit():
+        """
+        Return the current git commit hash, or None outside a git checkout.
+
+        :return: The commit hash.
+        """
+        try:
+            return subprocess.run(
+                ['git', 'rev-parse', 'HEAD'], capture_output=True, text=True, check=True
+            ).stdout.strip()
+        except (OSError, subprocess.CalledProcessError):
+            return None
@@ -0,0 +1,23 @@
+from django.core.management.base import BaseCommand
+
+from books.ratings import reconcile_rating_aggregates
+
+
+class Command(BaseCommand):
+    """
+    Recompute the denormalized rating aggregates of all books and authors.
+
+    Fixes drift left by changes that bypass the Review signals; the same
+    job runs periodically through Celery beat.
+    """
+    help = 'Recompute review_count, rating_sum and avg_rating of books and authors.'
+
+    def handle(self, *args, **options):
+        """
+        Run the reconciliation and report how many rows were checked.
+
+        :param args: Additional positional arguments (not used).
+        :param options: Additional keyword arguments (not used).
+        """
+        books, authors = reconcile_rating_aggregates()
+        self.stdout.write(self.style.SUCCESS(f'Reconciled ratings of {books} books and {authors} authors.'))
@@ -1,64 +1,93 @@
-from django.utils.deprecation import MiddlewareMixin
-from django.core.cache import cache
 from django.http import HttpResponse
 
+from . import response_cache
 
-class AnonymousUserCacheMiddleware(MiddlewareMixin):
+
+class ResponseCacheMiddleware:
     """
-    Middleware to cache responses for anonymous users on specific paths.
+    Middleware to cache full responses for anonymous users on configured paths.
 
     Features:
-    - Caches GET requests for anonymous users on pre-defined paths.
-    - Retrieves cached responses to reduce server load and response time.
-    - Does not affect authenticated users or non-GET requests.
+    - Caches status, headers and body of GET/HEAD responses, so content type
+      and other headers survive a cache hit.
+    - Keys entries by full path plus configurable request headers (`VARY_ON`).
+    - Drops entries through tags: every path lists the tags it depends on and
+      model signals invalidate those tags (see `books.signals`).
+    - Serves stale content while a single request regenerates an expired or
+      invalidated entry, so an expiry costs one regeneration, not one per
+      concurrent request.
+    - Does not affect authenticated users or other methods.
+
+    Configuration lives in `settings.RESPONSE_CACHE` (see
+    `books.response_cache.DEFAULTS`).
 
     Attributes:
-        PATHS_TO_CACHE (list): Paths eligible for caching.
+        get_response (callable): The next middleware or view to handle the request.
     """
-    PATHS_TO_CACHE = [
-        '/books/list/',
-    ]
 
-    def process_request(self, request):
+    def __init__(self, get_response):
+        """
+        Initialize the middleware.
+
+        :param get_response: The next middleware or view to handle the request.
         """
-        Handle incoming requests and return cached responses if applicable.
+        self.get_response = get_response
 
-        For anonymous users making GET requests to paths in `PATHS_TO_CACHE`,
-        attempts to retrieve the cached response.
+    def __call__(self, request):
+        """
+        Serve the request from the cache when possible, otherwise run the view
+        and cache its response.
 
         :param request: The HTTP request object.
-        :return: Cached HttpResponse if available, otherwise None.
+        :return: The HTTP response object.
         """
-        if request.user.is_authenticated:
-            return None
-        if request.method != 'GET':
-            return None
-        if request.path not in self.PATHS_TO_CACHE:
-            return None
-
-        cache_key = 'anonymous_cache_%s' % request.get_full_path()
-        response = cache.get(cache_key)
-        if response:
-            return HttpResponse(response)
-
-    def process_response(self, request, response):
+        config = response_cache.get_config()
+        tags = config['PATHS'].get(request.path)
+        if tags is None or request.method not in ('GET', 'HEAD') or request.user.is_authenticated:
+            return self.get_response(request)
+
+        key = response_cache.cache_key(request, config)
+        entry, fresh = response_cache.lookup(key, tags)
+        if entry is not None:
+            if fresh:
+                return self._build_response(entry, 'HIT')
+            if not response_cache.acquire_regeneration(key, config):
+                # Another request is regenerating this entry
+                return self._build_response(entry, 'STALE')
+
+        tag_versions = response_cache.get_tag_versions(tags)
+        response = self.get_response(request)
+        if self._is_cacheable(response):
+            response_cache.store(key, response, tag_versions, config)
+        else:
+            response_cache.release_regeneration(key)
+        response['X-Cache'] = 'MISS'
+        return response
+
+    @staticmethod
+    def _build_response(entry, state):
         """
-        Cache the response for eligible requests.
+        Rebuild a response from a cached entry.
 
-        Stores the response content in the cache for GET requests to paths
-        in `PATHS_TO_CACHE` made by anonymous users.
+        :param entry: The cached entry.
+        :param state: The value of the X-Cache header.
+        :return: The HTTP response object.
+        """
+        response = HttpResponse(entry['content'], status=entry['status'])
+        for header, value in entry['headers']:
+            response[header] = value
+        response['X-Cache'] = state
+        return response
+
+    @staticmethod
+    def _is_cacheable(response):
+        """
+        Tell whether a response is safe to share between anonymous users.
 
-        :param request: The HTTP request object.
         :param response: The HTTP response object.
-        :return: The original response, after caching if applicable.
+        :return: True if the response can be cached.
         """
-        if request.user.is_authenticated:
-            return response
-        if request.method != 'GET':
-            return response
-        if request.path not in self.PATHS_TO_CACHE:
-            return response
-
-        cache_key = 'anonymous_cache_%s' % request.get_full_path()
-        cache.set(cache_key, response.content, 60 * 15)  # Cache for 15 minutes
-        return response
+        if response.status_code != 200 or response.streaming or response.cookies:
+            return False
+        cache_control = response.get('Cache-Control', '')
+        return 'private' not in cache_control and 'no-store' not in cache_control
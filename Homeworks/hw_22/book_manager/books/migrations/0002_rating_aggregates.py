@@ -0,0 +1,72 @@
+from django.db import migrations, models
+from django.db.models import Count, Sum
+
+
+def fill_rating_aggregates(apps, schema_editor):
+    """Compute the new aggregate columns from existing reviews."""
+    for model_name, review_path in (('Book', 'reviews'), ('Author', 'books__reviews')):
+        model = apps.get_model('books', model_name)
+        rows = []
+        for row in model.objects.values('pk').annotate(
+            count=Count(review_path), total=Sum(f'{review_path}__rating'),
+        ).filter(count__gt=0):
+            rows.append(model(
+                pk=row['pk'],
+                review_count=row['count'],
+                rating_sum=row['total'],
+                avg_rating=row['total'] / row['count'],
+            ))
+        model.objects.bulk_update(rows, ['review_count', 'rating_sum', 'avg_rating'], batch_size=1000)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('books', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='author',
+            name='review_count',
+            field=models.PositiveIntegerField(default=0, editable=False),
+        ),
+        migrations.AddField(
+            model_name='author',
+            name='rating_sum',
+            field=models.IntegerField(default=0, editable=False),
+        ),
+        migrations.AddField(
+            model_name='author',
+            name='avg_rating',
+            field=models.FloatField(editable=False, null=True),
+        ),
+        migrations.AddField(
+            model_name='book',
+            name='review_count',
+            field=models.PositiveIntegerField(default=0, editable=False),
+        ),
+        migrations.AddField(
+            model_name='book',
+            name='rating_sum',
+            field=models.IntegerField(default=0, editable=False),
+        ),
+        migrations.AddField(
+            model_name='book',
+            name='avg_rating',
+            field=models.FloatField(editable=False, null=True),
+        ),
+        migrations.AddIndex(
+            model_name='author',
+            index=models.Index(fields=['review_count'], name='author_review_count_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='author',
+            index=models.Index(fields=['-avg_rating'], name='author_avg_rating_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='book',
+            index=models.Index(fields=['-review_count', '-avg_rating'], name='book_rating_leaderboard_idx'),
+        ),
+        migrations.RunPython(fill_rating_aggregates, migrations.RunPython.noop),
+    ]
@@ -9,9 +9,23 @@ class Author(models.Model):
     Attributes:
         name (str): The full name of the author.
         date_of_birth (date): The author's date of birth.
+        review_count (int): The number of reviews of the author's books.
+        rating_sum (int): The sum of the ratings of those reviews.
+        avg_rating (float): The average rating of those reviews, if any.
+
+    The rating fields are maintained from `Review` signals (see `books.ratings`).
     """
     name = models.CharField(max_length=100)
     date_of_birth = models.DateField()
+    review_count = models.PositiveIntegerField(default=0, editable=False)
+    rating_sum = models.IntegerField(default=0, editable=False)
+    avg_rating = models.FloatField(null=True, editable=False)
+
+    class Meta:
+        indexes = [
+            models.Index(fields=['review_count'], name='author_review_count_idx'),
+            models.Index(fields=['-avg_rating'], name='author_avg_rating_idx'),
+        ]
 
     def __str__(self):
         """
@@ -31,10 +45,23 @@ class Book(models.Model):
         title (str): The title of the book.
         authors (ManyToManyField): The authors who wrote the book.
         publication_date (date): The book's publication date.
+        review_count (int): The number of reviews of the book.
+        rating_sum (int): The sum of the ratings of those reviews.
+        avg_rating (float): The average rating of those reviews, if any.
+
+    The rating fields are maintained from `Review` signals (see `books.ratings`).
     """
     title = models.CharField(max_length=200)
     authors = models.ManyToManyField(Author, related_name='books')
     publication_date = models.DateField()
+    review_count = models.PositiveIntegerField(default=0, editable=False)
+    rating_sum = models.IntegerField(default=0, editable=False)
+    avg_rating = models.FloatField(null=True, editable=False)
+
+    class Meta:
+        indexes = [
+            models.Index(fields=['-review_count', '-avg_rating'], name='book_rating_leaderboard_idx'),
+        ]
 
     def __str__(self):
         """
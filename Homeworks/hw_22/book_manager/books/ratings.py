@@ -0,0 +1,133 @@
+from django.db import connection
+from django.db.models import Count, F, FloatField, Sum
+from django.db.models.functions import Cast, NullIf
+
+from .models import Author, Book
+
+
+RECONCILE_BATCH_SIZE = 1000
+
+
+# ---- Incremental Updates ----
+def _shift(queryset, count_delta, rating_delta):
+    """
+    Add a review (deltas +1, +rating) to or remove one (-1, -rating) from the
+    aggregates of every row of `queryset` in a single UPDATE.
+
+    The right-hand sides see the values before the update, so the average is
+    computed from the new sum and count.
+    """
+    queryset.update(
+        review_count=F('review_count') + count_delta,
+        rating_sum=F('rating_sum') + rating_delta,
+        avg_rating=(
+            Cast(F('rating_sum') + rating_delta, FloatField())
+            / NullIf(F('review_count') + count_delta, 0)
+        ),
+    )
+
+
+def _supports_expression_updates():
+    """
+    Whether the database can run the arithmetic UPDATEs of `_shift`.
+
+    djongo translates SQL to MongoDB operations and has no equivalent of
+    CAST, NULLIF or column arithmetic in SET clauses, so there the affected
+    rows are recomputed instead.
+    """
+    return connection.vendor != 'djongo'
+
+
+def review_added(book_id, rating):
+    """
+    Count a new review in the aggregates of its book and the book's authors.
+
+    :param book_id: The id of the reviewed book.
+    :param rating: The rating of the review.
+    """
+    if not _supports_expression_updates():
+        refresh_books([book_id])
+        return
+    _shift(Book.objects.filter(pk=book_id), 1, rating)
+    _shift(Author.objects.filter(books=book_id), 1, rating)
+
+
+def review_removed(book_id, rating):
+    """
+    Remove a deleted review from the aggregates of its book and the book's authors.
+
+    :param book_id: The id of the reviewed book.
+    :param rating: The rating of the review.
+    """
+    if not _supports_expression_updates():
+        refresh_books([book_id])
+        return
+    _shift(Book.objects.filter(pk=book_id), -1, -rating)
+    _shift(Author.objects.filter(books=book_id), -1, -rating)
+
+
+# ---- Recomputation ----
+def _recompute(model, ids, review_path):
+    """
+    Recompute the aggregates of the given rows from the reviews table.
+
+    :param model: `Book` or `Author`.
+    :param ids: The ids of the rows to recompute.
+    :param review_path: The lookup from the model to its reviews.
+    """
+    ids = list(ids)
+    for start in range(0, len(ids), RECONCILE_BATCH_SIZE):
+        batch_ids = ids[start:start + RECONCILE_BATCH_SIZE]
+        totals = {
+            row['pk']: row
+            for row in model.objects.filter(pk__in=batch_ids).values('pk').annotate(
+                count=Count(review_path), total=Sum(f'{review_path}__rating'),
+            )
+        }
+        rows = []
+        for obj in model.objects.filter(pk__in=batch_ids).only('pk', 'review_count', 'rating_sum', 'avg_rating'):
+            count = totals.get(obj.pk, {}).get('count') or 0
+            total = totals.get(obj.pk, {}).get('total') or 0
+            avg = total / count if count else None
+            if (obj.review_count, obj.rating_sum, obj.avg_rating) != (count, total, avg):
+                obj.review_count, obj.rating_sum, obj.avg_rating = count, total, avg
+                rows.append(obj)
+        model.objects.bulk_update(rows, ['review_count', 'rating_sum', 'avg_rating'])
+
+
+def refresh_books(book_ids):
+    """
+    Recompute the aggregates of the given books and of their authors.
+
+    Used after bulk inserts of reviews, which send no signals.
+
+    :param book_ids: The ids of the books.
+    """
+    book_ids = set(book_ids)
+    _recompute(Book, book_ids, 'reviews')
+    refresh_authors(Author.objects.filter(books__in=book_ids).values_list('pk', flat=True).distinct())
+
+
+def refresh_authors(author_ids):
+    """
+    Recompute the aggregates of the given authors.
+
+    :param author_ids: The ids of the authors.
+    """
+    _recompute(Author, set(author_ids), 'books__reviews')
+
+
+def reconcile_rating_aggregates():
+    """
+    Recompute the aggregates of every book and author, fixing any drift.
+
+    Incremental updates skip changes made without signals (bulk operations,
+    raw SQL, cascades), so this runs periodically.
+
+    :return: A tuple of (books checked, authors checked).
+    """
+    book_ids = list(Book.objects.values_list('pk', flat=True))
+    author_ids = list(Author.objects.values_list('pk', flat=True))
+    _recompute(Book, book_ids, 'reviews')
+    _recompute(Author, author_ids, 'books__reviews')
+    return len(book_ids), len(author_ids)
@@ -0,0 +1,138 @@
+import hashlib
+import time
+
+from django.conf import settings
+from django.core.cache import cache
+
+
+DEFAULTS = {
+    # Seconds a cached response is served as fresh
+    'TIMEOUT': 60 * 15,
+    # Seconds an expired or invalidated response may still be served while
+    # one request regenerates it
+    'STALE_TIMEOUT': 60 * 5,
+    # Seconds other requests wait for a regeneration before trying themselves
+    'LOCK_TIMEOUT': 30,
+    # Request.META keys that produce separate cache entries
+    'VARY_ON': ['HTTP_ACCEPT_LANGUAGE'],
+    # Cached paths and the tags that invalidate them
+    'PATHS': {},
+}
+
+
+def get_config():
+    """
+    Return the response cache configuration, `settings.RESPONSE_CACHE`
+    merged over the defaults.
+
+    :return: A configuration dictionary.
+    """
+    return {**DEFAULTS, **getattr(settings, 'RESPONSE_CACHE', {})}
+
+
+# ---- Tags ----
+def _tag_key(tag):
+    return f'response_cache:tag:{tag}'
+
+
+def get_tag_versions(tags):
+    """
+    Return the current version of every tag, creating missing ones.
+
+    :param tags: The tag names.
+    :return: A dictionary of tag name to version.
+    """
+    keys = {_tag_key(tag): tag for tag in tags}
+    versions = cache.get_many(keys)
+    for key, tag in keys.items():
+        if key not in versions:
+            # Start from the clock so an evicted version never matches old entries
+            cache.add(key, time.time_ns(), None)
+            versions[key] = cache.get(key)
+    return {tag: versions[key] for key, tag in keys.items()}
+
+
+def invalidate_tags(*tags):
+    """
+    Mark every cached response carrying one of the tags as stale.
+
+    :param tags: The tag names.
+    """
+    for tag in set(tags):
+        try:
+            cache.incr(_tag_key(tag))
+        except ValueError:
+            # No version stored yet, nothing has been cached with this tag
+            pass
+
+
+# ---- Entries ----
+def cache_key(request, config):
+    """
+    Build the cache key of a request from its full path and vary keys.
+
+    :param request: The HTTP request object.
+    :param config: The response cache configuration.
+    :return: The cache key.
+    """
+    parts = [request.get_full_path()] + [request.META.get(name, '') for name in config['VARY_ON']]
+    digest = hashlib.md5('\0'.join(parts).encode()).hexdigest()
+    return f'response_cache:entry:{digest}'
+
+
+def lookup(key, tags):
+    """
+    Fetch a cached entry and tell whether it is still fresh.
+
+    An entry is stale once its freshness time has passed or one of its tags
+    was invalidated after it was stored.
+
+    :param key: The entry cache key.
+    :param tags: The tags of the cached path.
+    :return: A tuple of (entry or None, is_fresh).
+    """
+    entry = cache.get(key)
+    if entry is None:
+        return None, False
+    fresh = entry['fresh_until'] > time.time() and entry['tags'] == get_tag_versions(tags)
+    return entry, fresh
+
+
+def acquire_regeneration(key, config):
+    """
+    Let exactly one request regenerate a stale entry.
+
+    :param key: The entry cache key.
+    :param config: The response cache configuration.
+    :return: True if the caller should regenerate the response.
+    """
+    return cache.add(f'{key}:lock', 1, config['LOCK_TIMEOUT'])
+
+
+def release_regeneration(key):
+    """
+    Give up regenerating an entry, e.g. when the new response is not cacheable.
+
+    :param key: The entry cache key.
+    """
+    cache.delete(f'{key}:lock')
+
+
+def store(key, response, tag_versions, config):
+    """
+    Store status, headers and body of a response with its tag versions.
+
+    :param key: The entry cache key.
+    :param response: The response to store.
+    :param tag_versions: Tag versions read before the view ran.
+    :param config: The response cache configuration.
+    """
+    entry = {
+        'status': response.status_code,
+        'headers': list(response.items()),
+        'content': response.content,
+        'tags': tag_versions,
+        'fresh_until': time.time() + config['TIMEOUT'],
+    }
+    cache.set(key, entry, config['TIMEOUT'] + config['STALE_TIMEOUT'])
+    release_regeneration(key)
@@ -1,24 +1,141 @@
-from django.db.models.signals import post_save, post_delete
+from django.db import transaction
+from django.db.models.signals import post_save, post_delete, pre_delete, m2m_changed
 from django.dispatch import receiver
-from django.core.cache import cache
 
-from .models import Book
+from . import ratings
+from .models import Author, Book, Review
+from .response_cache import invalidate_tags
 
 
-# !!!!!!!! Commented to fix MongoDB compatibility issues !!!!!!!!
+# Cache tag dropped when an instance of each model changes
+MODEL_CACHE_TAGS = {
+    Book: 'books',
+    Author: 'authors',
+    Review: 'reviews',
+}
+
 
 # ---- Signal Handlers ----
-# @receiver(post_save, sender=Book)
-# @receiver(post_delete, sender=Book)
-# def clear_book_cache(sender, **kwargs):
-#     """
-#     Clear the cache for the book list whenever a Book instance is saved or deleted.
-#
-#     This function is triggered by the `post_save` and `post_delete` signals
-#     for the `Book` model. It ensures that cached book list data is invalidated
-#     when a book is added, updated, or removed.
-#
-#     :param sender: The model class (Book) that triggered the signal.
-#     :param kwargs: Additional arguments passed by the signal.
-#     """
-#     cache.delete('book_list')
+@receiver(post_save, sender=Book)
+@receiver(post_delete, sender=Book)
+@receiver(post_save, sender=Author)
+@receiver(post_delete, sender=Author)
+@receiver(post_save, sender=Review)
+@receiver(post_delete, sender=Review)
+def invalidate_response_cache(sender, **kwargs):
+    """
+    Invalidate cached responses that depend on the changed model.
+
+    This function is triggered by the `post_save` and `post_delete` signals
+    for the `Book`, `Author` and `Review` models. It bumps the model's cache
+    tag, so every cached page listing such instances is regenerated.
+
+    :param sender: The model class that triggered the signal.
+    :param kwargs: Additional arguments passed by the signal.
+    """
+    invalidate_tags(MODEL_CACHE_TAGS[sender])
+
+
+@receiver(m2m_changed, sender=Book.authors.through)
+def invalidate_book_authors_cache(sender, action, **kwargs):
+    """
+    Invalidate cached responses when authors are linked to or unlinked from books.
+
+    :param sender: The intermediate model of `Book.authors`.
+    :param action: The kind of change, e.g. 'post_add'.
+    :param kwargs: Additional arguments passed by the signal.
+    """
+    if action in ('post_add', 'post_remove', 'post_clear'):
+        invalidate_tags('books', 'authors')
+
+
+# ---- Rating Aggregates ----
+@receiver(post_save, sender=Review)
+def update_ratings_on_review_save(sender, instance, created, **kwargs):
+    """
+    Keep book and author rating aggregates in sync with a saved review.
+
+    New reviews are added incrementally; an edited review may have changed
+    its rating, so its book and authors are recomputed. A review moved to
+    another book is fixed by the periodic reconciliation.
+
+    :param sender: The Review model class.
+    :param instance: The saved Review instance.
+    :param created: Whether the review was just created.
+    :param kwargs: Additional arguments passed by the signal.
+    """
+    if created:
+        ratings.review_added(instance.book_id, instance.rating)
+    else:
+        ratings.refresh_books([instance.book_id])
+
+
+@receiver(post_delete, sender=Review)
+def update_ratings_on_review_delete(sender, instance, **kwargs):
+    """
+    Remove a deleted review from book and author rating aggregates.
+
+    :param sender: The Review model class.
+    :param instance: The deleted Review instance.
+    :param kwargs: Additional arguments passed by the signal.
+    """
+    ratings.review_removed(instance.book_id, instance.rating)
+
+
+@receiver(pre_delete, sender=Book)
+def remember_authors_of_deleted_book(sender, instance, **kwargs):
+    """
+    Remember the authors of a book about to be deleted.
+
+    The deletion removes the book's author links together with its reviews,
+    so afterwards the authors can no longer be found through the book.
+
+    :param sender: The Book model class.
+    :param instance: The Book instance being deleted.
+    :param kwargs: Additional arguments passed by the signal.
+    """
+    instance._deleted_author_ids = list(instance.authors.values_list('pk', flat=True))
+
+
+@receiver(post_delete, sender=Book)
+def update_ratings_on_book_delete(sender, instance, **kwargs):
+    """
+    Recompute the aggregates of a deleted book's authors once the deletion commits.
+
+    :param sender: The Book model class.
+    :param instance: The deleted Book instance.
+    :param kwargs: Additional arguments passed by the signal.
+    """
+    author_ids = getattr(instance, '_deleted_author_ids', [])
+    if not author_ids:
+        return
+
+    def refresh():
+        ratings.refresh_authors(author_ids)
+        invalidate_tags('authors')
+
+    transaction.on_commit(refresh)
+
+
+@receiver(m2m_changed, sender=Book.authors.through)
+def update_ratings_on_authors_change(sender, instance, action, reverse, pk_set, **kwargs):
+    """
+    Recompute author aggregates when authors are linked to or unlinked from books.
+
+    :param sender: The intermediate model of `Book.authors`.
+    :param instance: The Book (or, from the reverse side, Author) being changed.
+    :param action: The kind of change, e.g. 'post_add'.
+    :param reverse: Whether the change was made from the Author side.
+    :param pk_set: The ids of the added or removed objects.
+    :param kwargs: Additional arguments passed by the signal.
+    """
+    if action == 'pre_clear' and not reverse:
+        instance._cleared_author_ids = list(instance.authors.values_list('pk', flat=True))
+    elif action in ('post_add', 'post_remove', 'post_clear'):
+        if reverse:
+            author_ids = [instance.pk]
+        elif action == 'post_clear':
+            author_ids = getattr(instance, '_cleared_author_ids', [])
+        else:
+            author_ids = pk_set
+        ratings.refresh_authors(author_ids)
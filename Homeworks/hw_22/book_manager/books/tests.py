@@ -1,3 +1,25 @@
+from datetime import date
+
 from django.test import TestCase
 
-# Create your tests here.
+from .models import Author, Book, Review
+
+
+class RatingAggregateTests(TestCase):
+    def setUp(self):
+        self.author = Author.objects.create(name="Author", date_of_birth=date(1970, 1, 1))
+        self.kept = Book.objects.create(title="Kept", publication_date=date(2020, 1, 1))
+        self.deleted = Book.objects.create(title="Deleted", publication_date=date(2021, 1, 1))
+        self.kept.authors.add(self.author)
+        self.deleted.authors.add(self.author)
+        Review.objects.create(book=self.kept, reviewer_name="A", rating=4, comment="")
+        Review.objects.create(book=self.deleted, reviewer_name="B", rating=2, comment="")
+
+    def test_deleting_a_book_updates_its_authors(self):
+        with self.captureOnCommitCallbacks(execute=True):
+            self.deleted.delete()
+
+        self.author.refresh_from_db()
+        self.assertEqual(self.author.review_count, 1)
+        self.assertEqual(self.author.rating_sum, 4)
+        self.assertEqual(self.author.avg_rating, 4.0)
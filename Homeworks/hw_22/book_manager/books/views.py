@@ -1,6 +1,6 @@
 import uuid
 from django.core.exceptions import FieldError
-from django.db.models import Avg, Count, F
+from django.db.models import F
 from django.db.models.expressions import OrderBy
 from django.db import connection
 from django.shortcuts import render, redirect
@@ -99,15 +99,16 @@ def orm_queries(request):
     :return: Rendered template with authors and books data.
     """
     authors = Author.objects.annotate(
-        avg_books_rating=Avg('books__reviews__rating')
+        avg_books_rating=F('avg_rating')
     ).order_by('name')
 
+    # Ratings are denormalized on Book, so this is an indexed ORDER BY
     books = Book.objects.annotate(
-        rating_count=Count('reviews'),
-        avg_book_rating=Avg('reviews__rating')
+        rating_count=F('review_count'),
+        avg_book_rating=F('avg_rating')
     ).order_by(
-        OrderBy(F('rating_count'), descending=True),
-        OrderBy(F('avg_book_rating'), descending=True)
+        OrderBy(F('review_count'), descending=True),
+        OrderBy(F('avg_rating'), descending=True)
     )
 
     return render(request, 'books/orm_queries.html', {'authors': authors, 'books': books})
@@ -140,17 +141,16 @@ class AuthorBookReviewView(View):
         """
         Fetch authors with books having more than 10 reviews using raw SQL.
 
+        Reads the denormalized review count of each author (an indexed
+        filter) instead of grouping over all reviews.
+
         :return: List of authors with names.
         """
         with connection.cursor() as cursor:
             query = """
                 SELECT DISTINCT a.name
                 FROM books_author a
-                JOIN books_book_authors ba ON a.id = ba.author_id
-                JOIN books_book b ON ba.book_id = b.id
-                JOIN books_review r ON b.id = r.book_id
-                GROUP BY a.name
-                HAVING COUNT(r.id) > %s;
+                WHERE a.review_count > %s;
             """
             params = [10]
             cursor.execute(query, params)
@@ -185,15 +185,15 @@ def no_sql_orm_queries(request):
     """
     try:
         authors = Author.objects.annotate(
-            avg_books_rating=Avg('books__reviews__rating')
+            avg_books_rating=F('avg_rating')
         ).order_by('name')
 
         books = Book.objects.annotate(
-            rating_count=Count('reviews'),
-            avg_book_rating=Avg('reviews__rating')
+            rating_count=F('review_count'),
+            avg_book_rating=F('avg_rating')
         ).order_by(
-            '-rating_count',
-            '-avg_book_rating'
+            '-review_count',
+            '-avg_rating'
         )
 
     except FieldError:
@@ -1,5 +1,6 @@
 import os
 from celery import Celery
+from celery.schedules import crontab
 
 # ---- PostgreSQL Configuration (Commented for Reference) ----
 # os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'root.settings')
@@ -19,3 +20,11 @@ app.conf.mongodb_backend_settings = {
     'database': 'book_manager',  # MongoDB database for task metadata
     'taskmeta_collection': 'celery_taskmeta',  # Collection for storing task metadata
 }
+
+# ---- Periodic Tasks ----
+app.conf.beat_schedule = {
+    'reconcile-ratings': {
+        'task': 'books.tasks.reconcile_ratings',
+        'schedule': crontab(hour=3, minute=0),  # Nightly, after catalogue imports
+    },
+}
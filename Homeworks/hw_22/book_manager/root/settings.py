@@ -53,7 +53,7 @@ MIDDLEWARE = [
     'django.middleware.clickjacking.XFrameOptionsMiddleware',
     'debug_toolbar.middleware.DebugToolbarMiddleware',  # Task 2.3
     'ums.middleware.AutoRenewCookieMiddleware',  # Task 1
-    # 'books.middleware.AnonymousUserCacheMiddleware',  # Commented to analyze queries performance
+    'books.middleware.ResponseCacheMiddleware',
 ]
 
 
@@ -162,6 +162,19 @@ CACHES = {
     }
 }
 
+# Full-response cache for anonymous users: path -> tags that invalidate it
+RESPONSE_CACHE = {
+    'TIMEOUT': 60 * 15,
+    'STALE_TIMEOUT': 60 * 5,
+    'VARY_ON': ['HTTP_ACCEPT_LANGUAGE'],
+    'PATHS': {
+        '/books/list/': ['books', 'authors'],
+        '/books/optimized/': ['books', 'authors', 'reviews'],
+        '/books/orm_queries/': ['books', 'authors', 'reviews'],
+        '/books/raw_sql_queries/': ['books', 'authors', 'reviews'],
+    },
+}
+
 # Task 2.3
 INTERNAL_IPS = [
     '127.0.0.1',
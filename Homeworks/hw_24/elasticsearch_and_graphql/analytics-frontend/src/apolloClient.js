@@ -1,4 +1,16 @@
 import { ApolloClient, InMemoryCache, HttpLink } from "@apollo/client";
+import { relayStylePagination } from "@apollo/client/utilities";
+
+// Cache whose connection field appends the pages loaded with fetchMore
+const paginatedCache = (field) => new InMemoryCache({
+    typePolicies: {
+        Query: {
+            fields: {
+                [field]: relayStylePagination(),
+            },
+        },
+    },
+});
 
 // Client for documents endpoint
 export const documentsClient = new ApolloClient({
@@ -8,7 +20,7 @@ export const documentsClient = new ApolloClient({
             method: "POST"
         },
     }),
-    cache: new InMemoryCache()
+    cache: paginatedCache("allDataDocuments")
 });
 
 // Client for clients endpoint
@@ -19,7 +31,7 @@ export const clientsClient = new ApolloClient({
             method: "POST"
         },
     }),
-    cache: new InMemoryCache()
+    cache: paginatedCache("allClients")
 });
 
 // Client for pets endpoint
@@ -30,5 +42,5 @@ export const petsClient = new ApolloClient({
             method: "POST"
         },
     }),
-    cache: new InMemoryCache()
+    cache: paginatedCache("allPets")
 });
@@ -2,18 +2,32 @@ import React from "react";
 import {useQuery, gql} from '@apollo/client';
 
 const GET_CLIENTS = gql`
-  query {
-    allClients {
-        firstName
-        lastName
-        email
-        isActive
-        registeredAt
+  query($first: Int!, $after: String) {
+    allClients(first: $first, after: $after) {
+        pageInfo {
+            hasNextPage
+            endCursor
+        }
+        edges {
+            cursor
+            node {
+                id
+                firstName
+                lastName
+                email
+                isActive
+                registeredAt
+            }
+        }
     }
 }
 `;
+const PAGE_SIZE = 100;
+
 const Clients = () => {
-    const {loading, error, data} = useQuery(GET_CLIENTS);
+    const {loading, error, data, fetchMore} = useQuery(GET_CLIENTS, {
+        variables: {first: PAGE_SIZE},
+    });
 
     if (loading) {
         return <p>Loading...</p>;
@@ -27,7 +41,7 @@ const Clients = () => {
         <div>
             <h1>Clients</h1>
             <ul>
-                {data.allClients.map((client) => (
+                {data.allClients.edges.map(({node: client}) => (
                     <li key={client.id}>
                         <h3>{client.firstName} {client.lastName}</h3>
                         <p>{client.email}</p>
@@ -36,6 +50,15 @@ const Clients = () => {
                     </li>
                 ))}
             </ul>
+            {data.allClients.pageInfo.hasNextPage && (
+                <button
+                    onClick={() => fetchMore({
+                        variables: {after: data.allClients.pageInfo.endCursor},
+                    })}
+                >
+                    Load more
+                </button>
+            )}
         </div>
     );
 };
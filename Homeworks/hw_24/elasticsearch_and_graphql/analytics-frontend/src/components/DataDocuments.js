@@ -2,15 +2,29 @@ import React from "react";
 import {useQuery, gql} from '@apollo/client';
 
 const GET_DATA_DOCUMENTS = gql`
-  query {
-    allDataDocuments {
-        title
-        description
+  query($first: Int!, $after: String) {
+    allDataDocuments(first: $first, after: $after) {
+        pageInfo {
+            hasNextPage
+            endCursor
+        }
+        edges {
+            cursor
+            node {
+                id
+                title
+                description
+            }
+        }
     }
 }
 `;
+const PAGE_SIZE = 100;
+
 const DataDocuments = () => {
-    const {loading, error, data} = useQuery(GET_DATA_DOCUMENTS);
+    const {loading, error, data, fetchMore} = useQuery(GET_DATA_DOCUMENTS, {
+        variables: {first: PAGE_SIZE},
+    });
 
     if (loading) {
         return <p>Loading...</p>;
@@ -24,13 +38,22 @@ const DataDocuments = () => {
         <div>
             <h1>Data Documents</h1>
             <ul>
-                {data.allDataDocuments.map((doc) => (
+                {data.allDataDocuments.edges.map(({node: doc}) => (
                     <li key={doc.id}>
                         <h3>{doc.title}</h3>
                         <p>{doc.description}</p>
                     </li>
                 ))}
             </ul>
+            {data.allDataDocuments.pageInfo.hasNextPage && (
+                <button
+                    onClick={() => fetchMore({
+                        variables: {after: data.allDataDocuments.pageInfo.endCursor},
+                    })}
+                >
+                    Load more
+                </button>
+            )}
         </div>
     );
 };
@@ -2,20 +2,34 @@ import React from "react";
 import {useQuery, gql} from '@apollo/client';
 
 const GET_PETS = gql`
-  query {
-    allPets {
-        name
-        species
-        breed
-        owner {
-            firstName
-            lastName
+  query($first: Int!, $after: String) {
+    allPets(first: $first, after: $after) {
+        pageInfo {
+            hasNextPage
+            endCursor
+        }
+        edges {
+            cursor
+            node {
+                id
+                name
+                species
+                breed
+                owner {
+                    firstName
+                    lastName
+                }
+            }
         }
     }
 }
 `;
+const PAGE_SIZE = 100;
+
 const Pets = () => {
-    const {loading, error, data} = useQuery(GET_PETS);
+    const {loading, error, data, fetchMore} = useQuery(GET_PETS, {
+        variables: {first: PAGE_SIZE},
+    });
 
     if (loading) {
         return <p>Loading...</p>;
@@ -29,7 +43,7 @@ const Pets = () => {
         <div>
             <h1>Pets</h1>
             <ul>
-                {data.allPets.map((pet) => (
+                {data.allPets.edges.map(({node: pet}) => (
                     <li key={pet.id}>
                         <h3>{pet.name}</h3>
                         <p>Species: {pet.species}</p>
@@ -38,6 +52,15 @@ const Pets = () => {
                     </li>
                 ))}
             </ul>
+            {data.allPets.pageInfo.hasNextPage && (
+                <button
+                    onClick={() => fetchMore({
+                        variables: {after: data.allPets.pageInfo.endCursor},
+                    })}
+                >
+                    Load more
+                </button>
+            )}
         </div>
     );
 };
@@ -133,6 +133,16 @@ ELASTICSEARCH_DSL = {
     }
 }
 
+GRAPHENE = {
+    # Largest page a connection field returns, also used when `first`/`last` is omitted
+    'RELAY_CONNECTION_MAX_LIMIT': 100,
+}
+
+# GraphQL query limits (see test_app.limits)
+GRAPHQL_MAX_DEPTH = 10
+GRAPHQL_MAX_COST = 20000
+GRAPHQL_LIST_SIZE = 20
+
 CORS_ALLOWED_ORIGINS = [
     'http://localhost:3001',
 ]
@@ -2,18 +2,44 @@ import graphene
 from graphene_django.types import DjangoObjectType
 
 from test_app.client.models import Client
+from test_app.loaders import BatchedConnectionField, get_loaders
 
 
 class ClientType(DjangoObjectType):
     """
     Represent the GraphQL type for the Client model.
 
-    The ClientType maps the Django Client model to a GraphQL type.
+    The ClientType maps the Django Client model to a GraphQL type. Pets
+    are fetched through the request's loaders, one query per page of clients.
     """
+    owners = graphene.List(graphene.NonNull('test_app.pet.schema.PetType'), required=True)
 
     class Meta:
         model = Client
         fields = '__all__'
+        use_connection = True
+
+    @classmethod
+    def prime_loaders(cls, info, clients):
+        """
+        Cache a page of clients and announce their pets, so they are fetched together.
+
+        :param info: GraphQL context info.
+        :param clients: The clients of the page.
+        """
+        loaders = get_loaders(info)
+        for client in clients:
+            loaders.client.prime(client.id, client)
+        loaders.pets_by_owner.expect(client.id for client in clients)
+
+    def resolve_owners(self, info):
+        """
+        Resolve the pets of the client through the pet loader.
+
+        :return: The client's pets.
+        :rtype: list[Pet]
+        """
+        return get_loaders(info).pets_by_owner.load(self.id)
 
 
 class CreateClient(graphene.Mutation):
@@ -63,18 +89,18 @@ class ClientQuery(graphene.ObjectType):
     """
     Define the queries related to Client.
 
-    Includes fetching all clients from the database.
+    Includes fetching clients from the database page by page.
     """
-    all_clients = graphene.List(ClientType)
+    all_clients = BatchedConnectionField(ClientType)
 
-    def resolve_all_clients(self, info):
+    def resolve_all_clients(self, info, **kwargs):
         """
         Resolve all clients query.
 
-        :return: List of all clients.
+        :return: All clients in a stable order for cursor pagination.
         :rtype: QuerySet[Client]
         """
-        return Client.objects.all()
+        return Client.objects.order_by('id')
 
 
 class ClientMutation(graphene.ObjectType):
@@ -2,6 +2,7 @@ import graphene
 from graphene_django.types import DjangoObjectType
 
 from test_app.data_document.models import DataDocument
+from test_app.loaders import BatchedConnectionField
 
 
 class DataDocumentType(DjangoObjectType):
@@ -14,6 +15,7 @@ class DataDocumentType(DjangoObjectType):
     class Meta:
         model = DataDocument
         fields = '__all__'
+        use_connection = True
 
 
 class CreateDataDocument(graphene.Mutation):
@@ -48,21 +50,21 @@ class DataDocumentQuery(graphene.ObjectType):
     """
     Define the queries related to DataDocument.
 
-    Includes fetching all DataDocument instances from the database.
+    Includes fetching DataDocument instances from the database page by page.
     """
-    all_data_documents = graphene.List(DataDocumentType)
+    all_data_documents = BatchedConnectionField(DataDocumentType)
 
     # def resolve_all_data(self, info):
     #     return data_document.search.execute()
 
-    def resolve_all_data_documents(self, info):
+    def resolve_all_data_documents(self, info, **kwargs):
         """
         Resolve all DataDocument query.
 
-        :return: List of all data documents.
+        :return: All data documents in a stable order for cursor pagination.
         :rtype: QuerySet[DataDocument]
         """
-        return DataDocument.objects.all()
+        return DataDocument.objects.order_by('id')
 
 
 class DataDocumentMutation(graphene.ObjectType):
@@ -0,0 +1,91 @@
+from django.conf import settings
+from graphene.validation import depth_limit_validator
+from graphene_django.settings import graphene_settings
+from graphql import GraphQLError, ValidationRule
+from graphql.language import FieldNode, FragmentSpreadNode, InlineFragmentNode, IntValueNode
+from graphql.type import get_named_type, get_nullable_type, is_list_type
+
+
+def query_cost_validator(max_cost, list_size):
+    """
+    Build a validation rule rejecting queries whose estimated cost is too high.
+
+    Every selected field costs one per object it is resolved for. Connection
+    fields multiply the cost of their selections by the requested page size
+    (`first`/`last`, or the connection limit when missing or passed as a
+    variable), plain list fields by `list_size`.
+
+    :param max_cost: The highest accepted cost of an operation.
+    :param list_size: The assumed length of list fields without pagination.
+    :return: The validation rule class.
+    """
+
+    class QueryCostValidator(ValidationRule):
+
+        def enter_operation_definition(self, node, *args):
+            root_type = self.context.schema.get_root_type(node.operation)
+            cost = self._selection_cost(node.selection_set, root_type, 1, set())
+            if cost > max_cost:
+                self.report_error(GraphQLError(
+                    f"Query cost {cost} exceeds the maximum cost of {max_cost}.", node,
+                ))
+
+        def _selection_cost(self, selection_set, parent_type, multiplier, fragments_seen):
+            cost = 0
+            for selection in selection_set.selections:
+                if isinstance(selection, FieldNode):
+                    cost += self._field_cost(selection, parent_type, multiplier, fragments_seen)
+                elif isinstance(selection, InlineFragmentNode):
+                    fragment_type = parent_type
+                    if selection.type_condition:
+                        fragment_type = self.context.schema.get_type(selection.type_condition.name.value)
+                    cost += self._selection_cost(selection.selection_set, fragment_type, multiplier, fragments_seen)
+                elif isinstance(selection, FragmentSpreadNode):
+                    name = selection.name.value
+                    fragment = self.context.get_fragment(name)
+                    if fragment is None or name in fragments_seen:
+                        continue
+                    fragment_type = self.context.schema.get_type(fragment.type_condition.name.value)
+                    cost += self._selection_cost(
+                        fragment.selection_set, fragment_type, multiplier, fragments_seen | {name},
+                    )
+            return cost
+
+        def _field_cost(self, node, parent_type, multiplier, fragments_seen):
+            field = getattr(parent_type, 'fields', {}).get(node.name.value)
+            if field is None:
+                # Introspection and unknown fields; the latter are reported by other rules
+                return 0
+            if not node.selection_set:
+                return multiplier
+
+            field_type = get_nullable_type(field.type)
+            named_type = get_named_type(field.type)
+            child_multiplier = multiplier
+            if named_type.name.endswith('Connection'):
+                child_multiplier *= self._page_size(node)
+            elif is_list_type(field_type) and not parent_type.name.endswith('Connection'):
+                # Connection edges are already counted by the page size
+                child_multiplier *= list_size
+            return multiplier + self._selection_cost(node.selection_set, named_type, child_multiplier, fragments_seen)
+
+        @staticmethod
+        def _page_size(node):
+            for argument in node.arguments:
+                if argument.name.value in ('first', 'last') and isinstance(argument.value, IntValueNode):
+                    return int(argument.value.value)
+            return graphene_settings.RELAY_CONNECTION_MAX_LIMIT
+
+    return QueryCostValidator
+
+
+def validation_rules():
+    """
+    Return the query limits applied to every GraphQL endpoint.
+
+    :return: A list of validation rule classes.
+    """
+    return [
+        depth_limit_validator(max_depth=settings.GRAPHQL_MAX_DEPTH),
+        query_cost_validator(max_cost=settings.GRAPHQL_MAX_COST, list_size=settings.GRAPHQL_LIST_SIZE),
+    ]
@@ -0,0 +1,144 @@
+from collections import defaultdict
+
+from graphene_django.fields import DjangoConnectionField
+
+from test_app.client.models import Client
+from test_app.pet.models import Pet
+
+
+class BatchLoader:
+    """
+    Load objects by key with one query per batch of keys, DataLoader style.
+
+    GraphQL resolves list items one after another, so resolvers cannot wait
+    for their siblings. Instead, the field that produced a page of objects
+    announces the keys their children will ask for (`expect`); the first
+    `load` then fetches all announced keys at once. Objects a batch returns
+    announce their own relations through `on_load`, so batching carries on
+    at every level of the query. Results are cached for the lifetime of the
+    loader, i.e. one request.
+
+    :var batch_load_fn: Callable taking a list of keys and returning a dict
+        of key to value.
+    :var default: Callable producing the value of keys missing from the result.
+    :var on_load: Callable receiving the values of each fetched batch, or None.
+    """
+
+    def __init__(self, batch_load_fn, default=lambda: None, on_load=None):
+        self.batch_load_fn = batch_load_fn
+        self.default = default
+        self.on_load = on_load
+        self._cache = {}
+        self._pending = set()
+
+    def expect(self, keys):
+        """
+        Announce keys that are about to be loaded, so they join the next batch.
+
+        :param keys: The keys.
+        """
+        self._pending.update(key for key in keys if key is not None and key not in self._cache)
+
+    def prime(self, key, value):
+        """
+        Put an already fetched value into the cache.
+
+        :param key: The key.
+        :param value: The value.
+        """
+        self._cache[key] = value
+        self._pending.discard(key)
+
+    def load(self, key):
+        """
+        Return the value of a key, fetching it together with all pending keys.
+
+        :param key: The key.
+        :return: The loaded value.
+        """
+        if key not in self._cache:
+            keys = self._pending | {key}
+            self._pending = set()
+            values = self.batch_load_fn(list(keys))
+            for batch_key in keys:
+                self._cache[batch_key] = values[batch_key] if batch_key in values else self.default()
+            if self.on_load is not None:
+                self.on_load(list(values.values()))
+        return self._cache[key]
+
+
+# ---- Batch Functions ----
+def load_clients(ids):
+    """
+    Fetch clients by id.
+
+    :param ids: The client ids.
+    :return: Dict of id to client.
+    """
+    return Client.objects.in_bulk(ids)
+
+
+def load_pets_by_owner(owner_ids):
+    """
+    Fetch the pets of several owners.
+
+    :param owner_ids: The client ids.
+    :return: Dict of owner id to list of pets.
+    """
+    pets = defaultdict(list)
+    for pet in Pet.objects.filter(owner_id__in=owner_ids).order_by('id'):
+        pets[pet.owner_id].append(pet)
+    return pets
+
+
+class Loaders:
+    """
+    The loaders of one request.
+    """
+
+    def __init__(self):
+        self.client = BatchLoader(load_clients, on_load=self._clients_loaded)
+        self.pets_by_owner = BatchLoader(load_pets_by_owner, default=list, on_load=self._pets_loaded)
+
+    def _clients_loaded(self, clients):
+        self.pets_by_owner.expect(client.id for client in clients)
+
+    def _pets_loaded(self, pet_lists):
+        self.client.expect(pet.owner_id for pets in pet_lists for pet in pets)
+
+
+def get_loaders(info):
+    """
+    Return the loaders of the current request, creating them on first use.
+
+    :param info: GraphQL resolve info; its context is the request.
+    :return: The request's loaders.
+    :rtype: Loaders
+    """
+    loaders = getattr(info.context, 'loaders', None)
+    if loaders is None:
+        loaders = Loaders()
+        info.context.loaders = loaders
+    return loaders
+
+
+class BatchedConnectionField(DjangoConnectionField):
+    """
+    Connection field that lets the node type prepare its loaders for the page.
+
+    After a page is sliced, `prime_loaders(info, nodes)` of the node type, if
+    defined, is called with the objects of the page, so relations of the whole
+    page are fetched with one query each.
+    """
+
+    @classmethod
+    def connection_resolver(cls, resolver, connection, default_manager, queryset_resolver,
+                            max_limit, enforce_first_or_last, root, info, **args):
+        result = super().connection_resolver(
+            resolver, connection, default_manager, queryset_resolver,
+            max_limit, enforce_first_or_last, root, info, **args,
+        )
+        prime_loaders = getattr(connection._meta.node, 'prime_loaders', None)
+        if prime_loaders is not None:
+            prime_loaders(info, [edge.node for edge in result.edges])
+        return result
@@ -1,6 +1,7 @@
 import graphene
 from graphene_django.types import DjangoObjectType
 
+from test_app.loaders import BatchedConnectionField, get_loaders
 from test_app.pet.models import Pet
 from test_app.client.models import Client
 
@@ -9,12 +10,35 @@ class PetType(DjangoObjectType):
     """
     Represent the GraphQL type for the Pet model.
 
-    The PetType maps the Django Pet model to a GraphQL type.
+    The PetType maps the Django Pet model to a GraphQL type. Owners are
+    fetched through the request's loaders, one query per page of pets.
     """
 
     class Meta:
         model = Pet
         fields = '__all__'
+        use_connection = True
+
+    @classmethod
+    def prime_loaders(cls, info, pets):
+        """
+        Announce the owners of a page of pets, so they are fetched together.
+
+        :param info: GraphQL context info.
+        :param pets: The pets of the page.
+        """
+        get_loaders(info).client.expect(pet.owner_id for pet in pets)
+
+    def resolve_owner(self, info):
+        """
+        Resolve the owner of the pet through the client loader.
+
+        :return: The owner, or None.
+        :rtype: Client
+        """
+        if self.owner_id is None:
+            return None
+        return get_loaders(info).client.load(self.owner_id)
 
 
 class CreatePet(graphene.Mutation):
@@ -69,18 +93,18 @@ class PetQuery(graphene.ObjectType):
     """
     Define the queries related to Pet.
 
-    Includes fetching all Pet instances from the database.
+    Includes fetching Pet instances from the database page by page.
     """
-    all_pets = graphene.List(PetType)
+    all_pets = BatchedConnectionField(PetType)
 
-    def resolve_all_pets(self, info):
+    def resolve_all_pets(self, info, **kwargs):
         """
         Resolve all_pets query.
 
-        :return: List of all pets.
+        :return: All pets in a stable order for cursor pagination.
         :rtype: QuerySet[Pet]
         """
-        return Pet.objects.all()
+        return Pet.objects.order_by('id')
 
 
 class PetMutation(graphene.ObjectType):
@@ -0,0 +1,75 @@
+import json
+
+from django.test import TestCase
+
+from test_app.client.models import Client
+from test_app.pet.models import Pet
+
+
+class GraphQLBatchingTests(TestCase):
+    def setUp(self):
+        for number in range(5):
+            client = Client.objects.create(first_name=f"First{number}", last_name=f"Last{number}")
+            for pet_number in range(3):
+                Pet.objects.create(name=f"Pet{number}-{pet_number}", species="dog", breed="mixed", owner=client)
+
+    def query(self, path, query):
+        response = self.client.post(path, json.dumps({'query': query}), content_type='application/json')
+        return response.json()
+
+    def test_pet_owners_load_in_one_query(self):
+        # count, page, owners
+        with self.assertNumQueries(3):
+            result = self.query('/pets/', '{ allPets { edges { node { name owner { firstName } } } } }')
+        edges = result['data']['allPets']['edges']
+        self.assertEqual(len(edges), 15)
+        self.assertEqual(edges[0]['node']['owner']['firstName'], 'First0')
+
+    def test_client_pets_load_in_one_query(self):
+        # count, page, pets; owners come from the page of clients
+        with self.assertNumQueries(3):
+            result = self.query(
+                '/clients/', '{ allClients { edges { node { firstName owners { name owner { lastName } } } } } }',
+            )
+        edges = result['data']['allClients']['edges']
+        self.assertEqual([len(edge['node']['owners']) for edge in edges], [3] * 5)
+        self.assertEqual(edges[1]['node']['owners'][0]['owner']['lastName'], 'Last1')
+
+    def test_nested_relations_load_in_one_query_per_level(self):
+        # count, page, owners, owners' pets
+        with self.assertNumQueries(4):
+            result = self.query('/pets/', '{ allPets { edges { node { owner { owners { name } } } } } }')
+        edges = result['data']['allPets']['edges']
+        self.assertEqual([len(edge['node']['owner']['owners']) for edge in edges], [3] * 15)
+
+    def test_cursor_pagination(self):
+        page = self.query('/pets/', '{ allPets(first: 10) { pageInfo { hasNextPage endCursor } edges { node { name } } } }')
+        page_info = page['data']['allPets']['pageInfo']
+        self.assertTrue(page_info['hasNextPage'])
+
+        rest = self.query('/pets/', '{ allPets(first: 10, after: "%s") { edges { node { name } } } }' % page_info['endCursor'])
+        self.assertEqual(len(rest['data']['allPets']['edges']), 5)
+
+    def test_paginated_frontend_query(self):
+        query = (
+            'query($first: Int!, $after: String) { allPets(first: $first, after: $after) { '
+            'pageInfo { hasNextPage endCursor } edges { cursor node { name owner { firstName } } } } }'
+        )
+        response = self.client.post(
+            '/pets/', json.dumps({'query': query, 'variables': {'first': 10}}), content_type='application/json',
+        )
+        page = response.json()['data']['allPets']
+        self.assertTrue(page['pageInfo']['hasNextPage'])
+
+        response = self.client.post(
+            '/pets/',
+            json.dumps({'query': query, 'variables': {'first': 10, 'after': page['pageInfo']['endCursor']}}),
+            content_type='application/json',
+        )
+        self.assertEqual(len(response.json()['data']['allPets']['edges']), 5)
+
+    def test_query_cost_limit(self):
+        result = self.query(
+            '/clients/', '{ allClients(first: 100) { edges { node { owners { owner { owners { name } } } } } } }',
+        )
+        self.assertIn('exceeds the maximum cost', result['errors'][0]['message'])
@@ -4,10 +4,11 @@ from test_app.data_document.schema import schema
 from test_app.client.schema import schema as client_schema
 from test_app.pet.schema import pet_schema
 from django.views.decorators.csrf import csrf_exempt
+from test_app.limits import validation_rules
 
 urlpatterns = [
-    path('documents/', csrf_exempt(GraphQLView.as_view(schema=schema))),
-    path('clients/', csrf_exempt(GraphQLView.as_view(graphiql=False, schema=client_schema))),
-    path('pets/', csrf_exempt(GraphQLView.as_view(graphiql=False, schema=pet_schema))),
+    path('documents/', csrf_exempt(GraphQLView.as_view(schema=schema, validation_rules=validation_rules()))),
+    path('clients/', csrf_exempt(GraphQLView.as_view(graphiql=False, schema=client_schema, validation_rules=validation_rules()))),
+    path('pets/', csrf_exempt(GraphQLView.as_view(graphiql=False, schema=pet_schema, validation_rules=validation_rules()))),
 
 ]
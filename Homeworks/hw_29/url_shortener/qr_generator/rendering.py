@@ -0,0 +1,102 @@
+import hashlib
+from io import BytesIO
+
+import qrcode
+import qrcode.image.svg
+from django.core.cache import caches
+
+
+QR_CACHE_ALIAS = 'qr'
+QR_CACHE_TIMEOUT = 60 * 60 * 24 * 30
+QR_BORDER = 4
+
+# format -> content type
+QR_FORMATS = {
+    'png': 'image/png',
+    'svg': 'image/svg+xml',
+}
+QR_ERROR_CORRECTION = {
+    'L': qrcode.constants.ERROR_CORRECT_L,
+    'M': qrcode.constants.ERROR_CORRECT_M,
+    'Q': qrcode.constants.ERROR_CORRECT_Q,
+    'H': qrcode.constants.ERROR_CORRECT_H,
+}
+QR_DEFAULT_SIZE = 10
+QR_MAX_SIZE = 40
+
+
+def qr_digest(data, size, fmt, error_correction):
+    """
+    Digest identifying one rendering of a QR code.
+
+    :param data: The encoded text.
+    :type data: str
+    :param size: Box size in pixels.
+    :type size: int
+    :param fmt: Output format, a key of QR_FORMATS.
+    :type fmt: str
+    :param error_correction: Error-correction level, a key of QR_ERROR_CORRECTION.
+    :type error_correction: str
+    :return: Hex digest used as cache key and ETag.
+    :rtype: str
+    """
+    key = f"{data}\0{size}\0{fmt}\0{error_correction}\0{QR_BORDER}"
+    return hashlib.sha256(key.encode()).hexdigest()
+
+
+def render_qr(data, size, fmt, error_correction):
+    """
+    Render a QR code image.
+
+    :param data: The encoded text.
+    :type data: str
+    :param size: Box size in pixels.
+    :type size: int
+    :param fmt: Output format, a key of QR_FORMATS.
+    :type fmt: str
+    :param error_correction: Error-correction level, a key of QR_ERROR_CORRECTION.
+    :type error_correction: str
+    :return: The encoded image.
+    :rtype: bytes
+    """
+    qr = qrcode.QRCode(
+        version=1,
+        error_correction=QR_ERROR_CORRECTION[error_correction],
+        box_size=size,
+        border=QR_BORDER,
+    )
+    qr.add_data(data)
+    qr.make(fit=True)
+
+    buffer = BytesIO()
+    if fmt == 'svg':
+        img = qr.make_image(image_factory=qrcode.image.svg.SvgPathImage)
+        img.save(buffer)
+    else:
+        img = qr.make_image(fill_color="black", back_color="white")
+        img.save(buffer, format="PNG")
+    return buffer.getvalue()
+
+
+def get_qr(data, size, fmt, error_correction):
+    """
+    Return a QR code image from the artifact cache, rendering it on a miss.
+
+    :param data: The encoded text.
+    :type data: str
+    :param size: Box size in pixels.
+    :type size: int
+    :param fmt: Output format, a key of QR_FORMATS.
+    :type fmt: str
+    :param error_correction: Error-correction level, a key of QR_ERROR_CORRECTION.
+    :type error_correction: str
+    :return: The encoded image.
+    :rtype: bytes
+    """
+    cache = caches[QR_CACHE_ALIAS]
+    key = f"qr:{qr_digest(data, size, fmt, error_correction)}"
+    content = cache.get(key)
+    if content is None:
+        content = render_qr(data, size, fmt, error_correction)
+        cache.set(key, content, QR_CACHE_TIMEOUT)
+    return content
@@ -1,3 +1,31 @@
-from django.test import TestCase
+from django.contrib.auth.models import User
+from django.conf import settings
+from django.test import TestCase, override_settings
 
-# Create your tests here.
+from shortener.models import URL
+
+
+@override_settings(CACHES={
+    **settings.CACHES,
+    'qr': {'BACKEND': 'django.core.cache.backends.locmem.LocMemCache'},
+})
+class GenerateQRTests(TestCase):
+    def setUp(self):
+        user = User.objects.create_user(username="qruser", password="testpassword")
+        self.url = URL.objects.create(original_url="https://example.com", created_by=user)
+
+    def test_svg_with_validators(self):
+        response = self.client.get(f"/qr/{self.url.short_url}/", {'format': 'svg', 'ec': 'H'})
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response['Content-Type'], 'image/svg+xml')
+        self.assertIn('public', response['Cache-Control'])
+
+        response = self.client.get(
+            f"/qr/{self.url.short_url}/", {'format': 'svg', 'ec': 'H'},
+            HTTP_IF_NONE_MATCH=response['ETag'],
+        )
+        self.assertEqual(response.status_code, 304)
+
+    def test_invalid_parameters(self):
+        response = self.client.get(f"/qr/{self.url.short_url}/", {'size': '500'})
+        self.assertEqual(response.status_code, 400)
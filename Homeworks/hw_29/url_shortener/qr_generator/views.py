@@ -1,44 +1,55 @@
-from django.shortcuts import render, get_object_or_404
-from django.http import HttpResponse
-import qrcode
-from io import BytesIO
+from django.http import Http404, HttpResponse, HttpResponseBadRequest
+from django.utils.cache import get_conditional_response, patch_cache_control
 
-from shortener.models import URL
+from qr_generator.rendering import (
+    QR_DEFAULT_SIZE, QR_ERROR_CORRECTION, QR_FORMATS, QR_MAX_SIZE, get_qr, qr_digest,
+)
+from shortener.clicks import resolve_short_url
+
+
+QR_MAX_AGE = 60 * 60 * 24
 
 
 def generate_qr(request, short_url):
     """
     Generate a QR code for the provided short URL.
 
-    This view retrieves the original URL associated with the provided short URL
-    from the database and generates a QR code for it. The QR code image is
-    returned as a PNG response.
+    This view resolves the original URL associated with the provided short
+    URL and returns a QR code for it. Renderings are kept in the QR artifact
+    cache keyed by their content and parameters, and carry an ETag so that
+    clients and proxies can revalidate instead of downloading them again.
+
+    Query parameters: ``size`` (box size in pixels, 1-40), ``format``
+    (png or svg) and ``ec`` (error correction level L, M, Q or H).
 
     :param request: The HTTP request object.
     :type request: HttpRequest
     :param short_url: The short URL string to resolve to the original URL.
     :type short_url: str
-    :return: An HTTP response containing the QR code image as a PNG.
+    :return: An HTTP response containing the QR code image.
     :rtype: HttpResponse
     """
-    # Retrieve the URL object from the database
-    url_obj = get_object_or_404(URL, short_url=short_url)
-
-    # Generate QR code
-    qr = qrcode.QRCode(
-        version=1,
-        error_correction=qrcode.constants.ERROR_CORRECT_L,
-        box_size=10,
-        border=4,
-    )
-    qr.add_data(url_obj.original_url)
-    qr.make(fit=True)
-    img = qr.make_image(fill_color="black", back_color="white")
-
-    # Save QR code image to buffer
-    buffer = BytesIO()
-    img.save(buffer, format="PNG")
-    buffer.seek(0)
-
-    # Return the QR code image as an HTTP response
-    return HttpResponse(buffer.getvalue(), content_type="image/png")
+    fmt = request.GET.get('format', 'png').lower()
+    error_correction = request.GET.get('ec', 'L').upper()
+    try:
+        size = int(request.GET.get('size', QR_DEFAULT_SIZE))
+    except ValueError:
+        size = 0
+    if fmt not in QR_FORMATS or error_correction not in QR_ERROR_CORRECTION or not 1 <= size <= QR_MAX_SIZE:
+        return HttpResponseBadRequest("Invalid QR code parameters.")
+
+    # Resolve the URL through the redirect cache
+    target = resolve_short_url(short_url)
+    if target is None:
+        raise Http404("No URL matches the given short URL.")
+    _url_id, original_url = target
+
+    etag = f'"{qr_digest(original_url, size, fmt, error_correction)}"'
+
+    response = get_conditional_response(request, etag=etag)
+    if response is None:
+        content = get_qr(original_url, size, fmt, error_correction)
+        response = HttpResponse(content, content_type=QR_FORMATS[fmt])
+    response['ETag'] = etag
+    patch_cache_control(response, public=True, max_age=QR_MAX_AGE)
+    return response
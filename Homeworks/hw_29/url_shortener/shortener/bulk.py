@@ -0,0 +1,169 @@
+import codecs
+import csv
+import json
+from itertools import islice
+
+from django.core.exceptions import ValidationError
+from django.core.validators import URLValidator
+from django.db import IntegrityError, transaction
+
+from shortener.codes import CODE_COLLISION_ATTEMPTS, code_allocator
+from shortener.models import URL
+
+
+BULK_CHUNK_SIZE = 1000
+RESULT_HEADER = ('original_url', 'short_url', 'created', 'error')
+
+_validate_url = URLValidator()
+_max_url_length = URL._meta.get_field('original_url').max_length
+
+
+def read_csv_urls(stream, encoding='utf-8'):
+    """
+    Yield original URLs from the first column of a CSV byte stream, one row
+    at a time. A leading ``original_url`` header row is skipped.
+
+    :param stream: An iterable of bytes lines (a file, or the request itself).
+    :type stream: Iterable[bytes]
+    :param encoding: The text encoding of the stream.
+    :type encoding: str
+    :return: The URLs in input order.
+    :rtype: Iterator[str]
+    """
+    for line_number, row in enumerate(csv.reader(codecs.iterdecode(stream, encoding))):
+        if not row:
+            continue
+        value = row[0].strip()
+        if line_number == 0 and value == 'original_url':
+            continue
+        yield value
+
+
+def read_json_urls(stream, encoding='utf-8'):
+    """
+    Yield original URLs from JSON: either an array of strings / objects with
+    an ``original_url`` key, or JSON Lines with one such item per line.
+
+    :param stream: An iterable of bytes lines (a file, or the request itself).
+    :type stream: Iterable[bytes]
+    :param encoding: The text encoding of the stream.
+    :type encoding: str
+    :return: The URLs in input order.
+    :rtype: Iterator[str]
+    """
+    lines = codecs.iterdecode(stream, encoding)
+    first = ''
+    for first in lines:
+        if first.strip():
+            break
+
+    if first.lstrip().startswith('['):
+        items = json.loads(first + ''.join(lines))
+    else:
+        items = (json.loads(line) for line in _non_blank(first, lines))
+
+    for item in items:
+        if isinstance(item, dict):
+            item = item.get('original_url', '')
+        yield str(item).strip()
+
+
+def _non_blank(first, lines):
+    if first.strip():
+        yield first
+    for line in lines:
+        if line.strip():
+            yield line
+
+
+def _check_url(value):
+    if not value:
+        return "Empty URL"
+    if len(value) > _max_url_length:
+        return f"URL is longer than {_max_url_length} characters"
+    try:
+        _validate_url(value)
+    except ValidationError:
+        return "Enter a valid URL"
+    return None
+
+
+def _shorten_chunk(chunk, user):
+    """
+    Resolve one chunk of original URLs: one IN query for existing links,
+    one block of codes and one bulk INSERT for the rest.
+    """
+    errors = {value: _check_url(value) for value in chunk}
+    valid = {value for value, error in errors.items() if error is None}
+    existing = dict(
+        URL.objects.filter(original_url__in=valid).values_list('original_url', 'short_url')
+    )
+
+    new_urls = [value for value in dict.fromkeys(chunk) if value in valid and value not in existing]
+    created = {}
+    if new_urls:
+        links = [
+            URL(original_url=value, short_url=code, created_by=user)
+            for value, code in zip(new_urls, code_allocator.allocate_many(len(new_urls)))
+        ]
+        try:
+            with transaction.atomic():
+                URL.objects.bulk_create(links)
+            created = {link.original_url: link.short_url for link in links}
+        except IntegrityError:
+            # Some links were created concurrently (keep theirs) or a code was
+            # already taken (give those links fresh codes)
+            for _attempt in range(CODE_COLLISION_ATTEMPTS):
+                URL.objects.bulk_create(links, ignore_conflicts=True)
+                codes = {link.original_url: link.short_url for link in links}
+                for value, short_url in URL.objects.filter(
+                    original_url__in=codes
+                ).values_list('original_url', 'short_url'):
+                    if codes[value] == short_url:
+                        created[value] = short_url
+                    else:
+                        existing[value] = short_url
+                missing = [value for value in codes if value not in created and value not in existing]
+                links = [
+                    URL(original_url=value, short_url=code, created_by=user)
+                    for value, code in zip(missing, code_allocator.allocate_many(len(missing)))
+                ]
+                if not links:
+                    break
+            for link in links:
+                errors[link.original_url] = "Could not allocate a short code"
+
+    reported = set()
+    for value in chunk:
+        if errors[value]:
+            yield value, '', False, errors[value]
+        elif value in created and value not in reported:
+            reported.add(value)
+            yield value, created[value], True, ''
+        else:
+            yield value, created.get(value) or existing[value], False, ''
+
+
+def shorten_urls(original_urls, user, chunk_size=BULK_CHUNK_SIZE):
+    """
+    Create short links for a stream of original URLs in chunks.
+
+    URLs that already have a link keep it; invalid ones are reported with an
+    error instead of aborting the import. Results are yielded in input order
+    as soon as their chunk is written, so callers can stream them back.
+
+    :param original_urls: The URLs to shorten.
+    :type original_urls: Iterable[str]
+    :param user: The owner of the created links.
+    :type user: User
+    :param chunk_size: Number of URLs written per query batch.
+    :type chunk_size: int
+    :return: (original_url, short_url, created, error) per input URL.
+    :rtype: Iterator[tuple]
+    """
+    iterator = iter(original_urls)
+    while True:
+        chunk = list(islice(iterator, chunk_size))
+        if not chunk:
+            break
+        yield from _shorten_chunk(chunk, user)
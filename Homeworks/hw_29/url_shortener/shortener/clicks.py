@@ -0,0 +1,251 @@
+import atexit
+import logging
+import threading
+from collections import deque
+from functools import lru_cache
+
+from django.contrib.auth.models import User
+from django.core.cache import cache
+from django.db import IntegrityError, close_old_connections, transaction
+from django.utils import timezone
+from user_agents import parse
+
+from shortener.models import URL, URLClick
+from stats.rollups import record_clicks
+
+
+logger = logging.getLogger(__name__)
+
+URL_CACHE_TIMEOUT = 60 * 60
+CLICK_FLUSH_INTERVAL = 2.0
+CLICK_FLUSH_BATCH_SIZE = 500
+CLICK_BUFFER_LIMIT = 100_000
+CLICK_FLUSH_MAX_ATTEMPTS = 5
+
+
+def _url_cache_key(short_url):
+    return f"short_url:{short_url}"
+
+
+def resolve_short_url(short_url):
+    """
+    Resolve a short code to ``(url_id, original_url)``, hitting the database
+    only on a cache miss.
+
+    :param short_url: The short URL slug to resolve.
+    :type short_url: str
+    :return: The URL id and original URL, or None if the code does not exist.
+    :rtype: tuple | None
+    """
+    key = _url_cache_key(short_url)
+    target = cache.get(key)
+    if target is None:
+        row = URL.objects.filter(short_url=short_url).values_list('id', 'original_url').first()
+        if row is None:
+            return None
+        target = tuple(row)
+        cache.set(key, target, URL_CACHE_TIMEOUT)
+    return target
+
+
+def forget_short_url(short_url):
+    """
+    Drop a short code from the redirect cache.
+
+    :param short_url: The short URL slug to drop.
+    :type short_url: str
+    """
+    cache.delete(_url_cache_key(short_url))
+
+
+@lru_cache(maxsize=4096)
+def classify_device(user_agent_string):
+    """
+    Classify a user-agent string as Mobile, Tablet, Desktop or Unknown.
+
+    User-agent strings repeat heavily, so results are memoized.
+
+    :param user_agent_string: The raw User-Agent header.
+    :type user_agent_string: str
+    :return: The device type.
+    :rtype: str
+    """
+    user_agent = parse(user_agent_string)
+    if user_agent.is_mobile:
+        return 'Mobile'
+    elif user_agent.is_tablet:
+        return 'Tablet'
+    elif user_agent.is_pc:
+        return 'Desktop'
+    return 'Unknown'
+
+
+_geoip = None
+_geoip_lock = threading.Lock()
+
+
+def _get_geoip():
+    """
+    Return the process-wide GeoIP2 reader, opening it on first use.
+
+    :return: The shared reader, or None if the GeoIP database is unavailable.
+    :rtype: GeoIP2 | None
+    """
+    global _geoip
+    if _geoip is None:
+        with _geoip_lock:
+            if _geoip is None:
+                try:
+                    from django.contrib.gis.geoip2 import GeoIP2
+                    _geoip = GeoIP2()
+                except Exception:
+                    logger.warning("GeoIP2 database is not available, countries will be 'Unknown'")
+                    _geoip = False
+    return _geoip or None
+
+
+@lru_cache(maxsize=16384)
+def lookup_country(ip_address):
+    """
+    Look up the country name of an IP address.
+
+    :param ip_address: The client IP address.
+    :type ip_address: str
+    :return: The country name, or 'Unknown'.
+    :rtype: str
+    """
+    geo = _get_geoip()
+    if geo is None or not ip_address:
+        return 'Unknown'
+    try:
+        return geo.country_name(ip_address) or 'Unknown'
+    except Exception:
+        return 'Unknown'
+
+
+class ClickBuffer:
+    """
+    Collect raw click events in memory and persist them from a background
+    thread in batches.
+
+    Events are enriched (device type, country) on the flusher thread, so the
+    redirect only pays for appending a tuple to a deque. Each batch also
+    updates the hourly rollups the statistics page reads. A batch that keeps
+    failing is dropped after ``max_attempts`` tries instead of blocking the
+    buffer forever.
+    """
+
+    def __init__(self, flush_interval=CLICK_FLUSH_INTERVAL, batch_size=CLICK_FLUSH_BATCH_SIZE,
+                 limit=CLICK_BUFFER_LIMIT, max_attempts=CLICK_FLUSH_MAX_ATTEMPTS):
+        self.flush_interval = flush_interval
+        self.batch_size = batch_size
+        self.max_attempts = max_attempts
+        self._failed_attempts = 0
+        self._events = deque(maxlen=limit)
+        self._wakeup = threading.Event()
+        self._flush_lock = threading.Lock()
+        self._thread = None
+        self._start_lock = threading.Lock()
+
+    def enqueue(self, url_id, user_id, user_agent, ip_address):
+        """
+        Record a click without touching the database.
+
+        :param url_id: Id of the clicked URL.
+        :type url_id: int
+        :param user_id: Id of the authenticated user, if any.
+        :type user_id: int | None
+        :param user_agent: The raw User-Agent header.
+        :type user_agent: str
+        :param ip_address: The client IP address.
+        :type ip_address: str
+        """
+        self._ensure_started()
+        self._events.append((url_id, user_id, user_agent, ip_address, timezone.now()))
+        if len(self._events) >= self.batch_size:
+            self._wakeup.set()
+
+    def flush(self):
+        """
+        Enrich and persist every buffered event.
+
+        :return: Number of clicks written.
+        :rtype: int
+        """
+        written = 0
+        with self._flush_lock:
+            while self._events:
+                batch = []
+                while self._events and len(batch) < self.batch_size:
+                    batch.append(self._events.popleft())
+                try:
+                    written += self._persist(batch)
+                except Exception:
+                    self._failed_attempts += 1
+                    if self._failed_attempts >= self.max_attempts:
+                        self._failed_attempts = 0
+                        logger.exception("Dropping %d clicks after %d failed attempts", len(batch), self.max_attempts)
+                        continue
+                    # Keep the events for the next attempt
+                    self._events.extendleft(reversed(batch))
+                    raise
+                self._failed_attempts = 0
+        return written
+
+    @staticmethod
+    def _persist(batch):
+        clicks = [
+            URLClick(
+                url_id=url_id,
+                user_id=user_id,
+                device_type=classify_device(user_agent),
+                country=lookup_country(ip_address),
+                clicked_at=clicked_at,
+            )
+            for url_id, user_id, user_agent, ip_address, clicked_at in batch
+        ]
+        try:
+            with transaction.atomic():
+                URLClick.objects.bulk_create(clicks)
+                record_clicks(clicks)
+        except IntegrityError:
+            # A URL or user was deleted after its clicks were buffered, drop those
+            existing_urls = set(
+                URL.objects.filter(id__in={c.url_id for c in clicks}).values_list('id', flat=True)
+            )
+            existing_users = set(
+                User.objects.filter(id__in={c.user_id for c in clicks if c.user_id}).values_list('id', flat=True)
+            )
+            clicks = [
+                c for c in clicks
+                if c.url_id in existing_urls and (c.user_id is None or c.user_id in existing_users)
+            ]
+            with transaction.atomic():
+                URLClick.objects.bulk_create(clicks)
+                record_clicks(clicks)
+        return len(clicks)
+
+    def _ensure_started(self):
+        if self._thread is not None:
+            return
+        with self._start_lock:
+            if self._thread is None:
+                self._thread = threading.Thread(
+                    target=self._run, name='click-flusher', daemon=True
+                )
+                self._thread.start()
+                atexit.register(self.flush)
+
+    def _run(self):
+        while True:
+            self._wakeup.wait(self.flush_interval)
+            self._wakeup.clear()
+            try:
+                self.flush()
+            except Exception:
+                logger.exception("Failed to persist buffered clicks")
+            finally:
+                close_old_connections()
+
+
+click_buffer = ClickBuffer()
@@ -0,0 +1,144 @@
+import os
+import string
+import threading
+
+from django.conf import settings
+from django.db import DEFAULT_DB_ALIAS, connection, connections, transaction
+
+
+ALPHABET = string.digits + string.ascii_letters
+CODE_LENGTH = 7
+CODE_SPACE = len(ALPHABET) ** CODE_LENGTH
+# Coprime with 62, so n -> (n * MULTIPLIER + OFFSET) mod CODE_SPACE is a
+# bijection: distinct sequence values always give distinct codes.
+CODE_MULTIPLIER = 1_580_030_173_373
+CODE_OFFSET = 1_234_567_890_123
+SEQUENCE_NAME = 'url'
+# Attempts at storing a link whose fresh code turned out to be taken
+CODE_COLLISION_ATTEMPTS = 3
+
+
+def encode_code(value):
+    """
+    Turn a sequence value into a 7-character base62 short code.
+
+    Values are scrambled before encoding so consecutive links do not get
+    visibly sequential codes. Legacy random codes are 8 characters long,
+    so allocated codes never clash with them.
+
+    :param value: The sequence value, 0 <= value < CODE_SPACE.
+    :type value: int
+    :return: The short code.
+    :rtype: str
+    """
+    if not 0 <= value < CODE_SPACE:
+        raise ValueError("Short code sequence is exhausted")
+    n = (value * CODE_MULTIPLIER + CODE_OFFSET) % CODE_SPACE
+    chars = []
+    for _ in range(CODE_LENGTH):
+        n, rem = divmod(n, len(ALPHABET))
+        chars.append(ALPHABET[rem])
+    return ''.join(reversed(chars))
+
+
+def _reserve(conn, size):
+    """
+    Move the shared sequence forward by ``size`` and return the first value
+    of the reserved range. The UPDATE locks the row (the whole database on
+    SQLite) until commit, so concurrent reservations never overlap.
+    """
+    from shortener.models import ShortCodeSequence
+
+    table = conn.ops.quote_name(ShortCodeSequence._meta.db_table)
+    with conn.cursor() as cursor:
+        cursor.execute(
+            f"UPDATE {table} SET next_value = next_value + %s WHERE name = %s",
+            [size, SEQUENCE_NAME],
+        )
+        cursor.execute(f"SELECT next_value FROM {table} WHERE name = %s", [SEQUENCE_NAME])
+        end = cursor.fetchone()[0]
+    return end - size
+
+
+class CodeAllocator:
+    """
+    Hand out unique short codes from blocks of the shared sequence.
+
+    Each process reserves a block of sequence values with one UPDATE and then
+    serves codes from memory, so creating a link needs no existence check.
+    Values of a block left unused when a process exits are simply skipped.
+
+    On SQLite a reservation made inside the caller's transaction is undone
+    when that transaction rolls back, so such reservations are never kept
+    as a block: only the codes needed right now are reserved.
+    """
+
+    def __init__(self, block_size=None):
+        self.block_size = block_size or getattr(settings, 'SHORT_CODE_BLOCK_SIZE', 1000)
+        self._lock = threading.Lock()
+        self._next = 0
+        self._end = 0
+        self._pid = None
+
+    def allocate(self):
+        """
+        Return one fresh short code.
+
+        :return: The short code.
+        :rtype: str
+        """
+        return self.allocate_many(1)[0]
+
+    def allocate_many(self, count):
+        """
+        Return ``count`` fresh short codes, reserving at most one extra block.
+
+        :param count: Number of codes needed.
+        :type count: int
+        :return: The short codes.
+        :rtype: list[str]
+        """
+        codes = []
+        with self._lock:
+            if self._pid != os.getpid():
+                # A block inherited through fork() is shared with the parent
+                self._next = self._end = 0
+                self._pid = os.getpid()
+
+            while len(codes) < count:
+                if self._next >= self._end:
+                    if connection.vendor == 'sqlite' and connection.in_atomic_block:
+                        # Rolled back with the caller, so it must not outlive the call
+                        missing = count - len(codes)
+                        start = self._claim_block(missing)
+                        codes.extend(encode_code(v) for v in range(start, start + missing))
+                        break
+                    size = max(self.block_size, count - len(codes))
+                    self._next = self._claim_block(size)
+                    self._end = self._next + size
+                take = min(count - len(codes), self._end - self._next)
+                codes.extend(encode_code(v) for v in range(self._next, self._next + take))
+                self._next += take
+        return codes
+
+    @staticmethod
+    def _claim_block(size):
+        # SQLite allows a single writer, a second connection would wait on the
+        # caller's own transaction, so it always reserves inline.
+        if connection.vendor == 'sqlite' or not connection.in_atomic_block:
+            with transaction.atomic():
+                return _reserve(connection, size)
+
+        # Reserve on a separate connection, so a rollback of the caller's
+        # transaction cannot hand the same block to another process.
+        conn = connections.create_connection(DEFAULT_DB_ALIAS)
+        try:
+            conn.set_autocommit(False)
+            start = _reserve(conn, size)
+            conn.commit()
+            return start
+        finally:
+            conn.close()
+
+
+code_allocator = CodeAllocator()
@@ -0,0 +1,47 @@
+import csv
+import sys
+
+from django.contrib.auth.models import User
+from django.core.management.base import BaseCommand, CommandError
+
+from shortener.bulk import BULK_CHUNK_SIZE, RESULT_HEADER, read_csv_urls, read_json_urls, shorten_urls
+
+
+class Command(BaseCommand):
+    help = "Create short links for URLs from a CSV or JSON file and write the mapping as CSV"
+
+    def add_arguments(self, parser):
+        parser.add_argument('path', help="Input file, or - for standard input")
+        parser.add_argument('--user', required=True, help="Username that will own the links")
+        parser.add_argument('--format', choices=('csv', 'json'), default=None,
+                            help="Input format (default: guessed from the file extension)")
+        parser.add_argument('--output', default=None, help="Output CSV file (default: standard output)")
+        parser.add_argument('--chunk-size', type=int, default=BULK_CHUNK_SIZE)
+
+    def handle(self, *args, **options):
+        try:
+            user = User.objects.get(username=options['user'])
+        except User.DoesNotExist:
+            raise CommandError(f"User '{options['user']}' does not exist")
+
+        path = options['path']
+        fmt = options['format'] or ('json' if path.endswith(('.json', '.jsonl', '.ndjson')) else 'csv')
+        reader = read_json_urls if fmt == 'json' else read_csv_urls
+
+        source = sys.stdin.buffer if path == '-' else open(path, 'rb')
+        target = open(options['output'], 'w', newline='') if options['output'] else self.stdout
+        created = total = 0
+        try:
+            writer = csv.writer(target)
+            writer.writerow(RESULT_HEADER)
+            for row in shorten_urls(reader(source), user, options['chunk_size']):
+                writer.writerow(row[:2] + (int(row[2]),) + row[3:])
+                total += 1
+                created += row[2]
+        finally:
+            if source is not sys.stdin.buffer:
+                source.close()
+            if target is not self.stdout:
+                target.close()
+
+        self.stderr.write(f"Processed {total} URLs, created {created} links.")
@@ -0,0 +1,19 @@
+# Generated by Django 5.1.4 on 2026-10-18 10:00
+
+import django.utils.timezone
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('shortener', '0003_url_custom_name'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='urlclick',
+            name='clicked_at',
+            field=models.DateTimeField(default=django.utils.timezone.now),
+        ),
+    ]
@@ -0,0 +1,17 @@
+# Generated by Django 5.1.4 on 2026-10-18 10:00
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('shortener', '0004_alter_urlclick_clicked_at'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='urlclick',
+            index=models.Index(fields=['url', 'clicked_at'], name='urlclick_url_clicked_idx'),
+        ),
+    ]
@@ -0,0 +1,26 @@
+# Generated by Django 5.1.4 on 2026-10-18 10:00
+
+from django.db import migrations, models
+
+
+def create_url_sequence(apps, schema_editor):
+    ShortCodeSequence = apps.get_model('shortener', 'ShortCodeSequence')
+    ShortCodeSequence.objects.get_or_create(name='url', defaults={'next_value': 0})
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('shortener', '0005_urlclick_urlclick_url_clicked_idx'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='ShortCodeSequence',
+            fields=[
+                ('name', models.CharField(max_length=50, primary_key=True, serialize=False)),
+                ('next_value', models.BigIntegerField(default=0)),
+            ],
+        ),
+        migrations.RunPython(create_url_sequence, migrations.RunPython.noop),
+    ]
@@ -1,19 +1,32 @@
 from django.contrib.auth.models import User
-from django.db import models
-import random
-import string
+from django.db import IntegrityError, models, transaction
+from django.utils import timezone
 
+from shortener.codes import CODE_COLLISION_ATTEMPTS, code_allocator
 
-def generate_short_url():
+
+class ShortCodeSequence(models.Model):
     """
-    Generate a random short URL string.
+    Represent a shared counter that short codes are allocated from.
 
-    The generated string consists of 8 random characters from ASCII letters and digits.
+    Processes reserve blocks of values by moving ``next_value`` forward.
 
-    :return: A randomly generated short URL string.
-    :rtype: str
+    :var name: The name of the sequence.
+    :type name: CharField
+    :var next_value: The first value not reserved yet.
+    :type next_value: BigIntegerField
     """
-    return ''.join(random.choices(string.ascii_letters + string.digits, k=8))
+    name = models.CharField(max_length=50, primary_key=True)
+    next_value = models.BigIntegerField(default=0)
+
+    def __str__(self):
+        """
+        Return a string representation of the ShortCodeSequence instance.
+
+        :return: The sequence name and its next value.
+        :rtype: str
+        """
+        return f"{self.name} - {self.next_value}"
 
 
 class URL(models.Model):
@@ -41,15 +54,28 @@ class URL(models.Model):
         """
         Override the save method to auto-generate a short URL if not provided.
 
+        Codes come from the process-local block of the code allocator, so no
+        existence check is needed up front. Should a generated code be taken
+        anyway (e.g. by a legacy or manually set link), a fresh one is tried.
+
         :param args: Positional arguments for the save method.
         :param kwargs: Keyword arguments for the save method.
         """
-        if not self.short_url:
-            candidate = generate_short_url()
-            while URL.objects.filter(short_url=candidate).exists():
-                candidate = generate_short_url()
-            self.short_url = candidate
-        super().save(*args, **kwargs)
+        if self.short_url:
+            super().save(*args, **kwargs)
+            return
+
+        for attempt in range(CODE_COLLISION_ATTEMPTS):
+            self.short_url = code_allocator.allocate()
+            try:
+                with transaction.atomic():
+                    super().save(*args, **kwargs)
+                return
+            except IntegrityError:
+                taken = URL.objects.filter(short_url=self.short_url).exists()
+                self.short_url = None
+                if not taken or attempt == CODE_COLLISION_ATTEMPTS - 1:
+                    raise
 
 
 class URLClick(models.Model):
@@ -69,10 +95,15 @@ class URLClick(models.Model):
     """
     url = models.ForeignKey(URL, on_delete=models.CASCADE, related_name='clicks')
     user = models.ForeignKey(User, on_delete=models.CASCADE, null=True, blank=True)
-    clicked_at = models.DateTimeField(auto_now_add=True)
+    clicked_at = models.DateTimeField(default=timezone.now)
     device_type = models.CharField(max_length=50, default='Unknown')
     country = models.CharField(max_length=100, null=True, blank=True)
 
+    class Meta:
+        indexes = [
+            models.Index(fields=['url', 'clicked_at'], name='urlclick_url_clicked_idx'),
+        ]
+
     def __str__(self):
         """
         Return a string representation of the URLClick instance.
@@ -0,0 +1,19 @@
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from shortener.clicks import forget_short_url
+from shortener.models import URL
+
+
+@receiver(post_save, sender=URL)
+@receiver(post_delete, sender=URL)
+def forget_cached_redirect(sender, instance, **kwargs):
+    """
+    Drop the cached redirect target whenever a URL changes or is deleted.
+
+    :param sender: The model class.
+    :type sender: type
+    :param instance: The saved or deleted URL.
+    :type instance: URL
+    """
+    forget_short_url(instance.short_url)
@@ -1,5 +1,11 @@
+from unittest import mock
+
 from django.contrib.auth.models import User
+from django.db import transaction
 from django.test import TestCase
+from .bulk import shorten_urls
+from .clicks import ClickBuffer
+from .codes import CODE_LENGTH, CodeAllocator, encode_code
 from .models import URL
 
 
@@ -19,3 +25,64 @@ class URLModelTests(TestCase):
         self.client.login(username="testuser", password="testpassword")
         response = self.client.get("/")
         self.assertEqual(response.status_code, 200)
+
+
+class CodeAllocatorTests(TestCase):
+    def test_encoded_codes_are_unique(self):
+        codes = {encode_code(value) for value in range(10000)}
+        self.assertEqual(len(codes), 10000)
+        self.assertTrue(all(len(code) == CODE_LENGTH for code in codes))
+
+    def test_allocators_never_share_codes(self):
+        first = CodeAllocator(block_size=10)
+        second = CodeAllocator(block_size=10)
+        codes = first.allocate_many(15) + second.allocate_many(15) + first.allocate_many(5)
+        self.assertEqual(len(set(codes)), len(codes))
+
+    def test_block_is_not_kept_from_a_transaction(self):
+        allocator = CodeAllocator(block_size=10)
+        with transaction.atomic():
+            allocator.allocate()
+        self.assertEqual(allocator._end, 0)
+
+    def test_save_retries_a_taken_code(self):
+        user = User.objects.create_user(username="codeuser", password="testpassword")
+        with mock.patch('shortener.models.code_allocator.allocate', side_effect=['taken01', 'fresh01']):
+            URL.objects.create(original_url="https://example.com/taken", short_url='taken01', created_by=user)
+            url = URL.objects.create(original_url="https://example.com/fresh", created_by=user)
+        self.assertEqual(url.short_url, 'fresh01')
+
+
+class BulkShortenTests(TestCase):
+    def setUp(self):
+        self.user = User.objects.create_user(username="bulkuser", password="testpassword")
+        self.existing = URL.objects.create(original_url="https://example.com/old", created_by=self.user)
+
+    def test_shorten_urls(self):
+        rows = list(shorten_urls(
+            ["https://example.com/a", "https://example.com/old", "not a url", "https://example.com/a"],
+            self.user,
+            chunk_size=3,
+        ))
+
+        self.assertTrue(rows[0][2])
+        self.assertEqual(rows[1], ("https://example.com/old", self.existing.short_url, False, ''))
+        self.assertEqual(rows[2][1], '')
+        self.assertTrue(rows[2][3])
+        self.assertEqual(rows[3][1], rows[0][1])
+        self.assertFalse(rows[3][2])
+        self.assertEqual(URL.objects.count(), 2)
+
+
+class ClickBufferTests(TestCase):
+    def test_failing_batch_is_dropped_after_max_attempts(self):
+        buffer = ClickBuffer(batch_size=10, max_attempts=3)
+        buffer._events.append((1, None, '', '', None))
+
+        with mock.patch.object(ClickBuffer, '_persist', side_effect=RuntimeError):
+            for _ in range(2):
+                with self.assertRaises(RuntimeError):
+                    buffer.flush()
+                self.assertEqual(len(buffer._events), 1)
+            self.assertEqual(buffer.flush(), 0)
+        self.assertEqual(len(buffer._events), 0)
@@ -4,6 +4,7 @@ from django.contrib.auth.views import LoginView, LogoutView
 
 urlpatterns = [
     path('', views.home, name="home"),
+    path('bulk/', views.bulk_shorten, name='bulk_shorten'),
     path('login/', LoginView.as_view(template_name='shortener/login.html'), name='login'),
     path('logout/', views.logout_user, name='logout'),
     path('register/', views.register, name='register'),
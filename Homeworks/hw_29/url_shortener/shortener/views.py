@@ -1,11 +1,15 @@
-from django.shortcuts import render, redirect, get_object_or_404
+import csv
+
+from django.shortcuts import render, redirect
 from django.contrib.auth.decorators import login_required
 from django.contrib.auth import login, logout
-from user_agents import parse
-from django.contrib.gis.geoip2 import GeoIP2
+from django.http import Http404, HttpResponseBadRequest, StreamingHttpResponse
+from django.urls import reverse
+from django.views.decorators.http import require_POST
 
+from shortener.bulk import RESULT_HEADER, read_csv_urls, read_json_urls, shorten_urls
+from shortener.clicks import click_buffer, resolve_short_url
 from shortener.forms import URLForm, RegistrationForm
-from shortener.models import URL, URLClick
 
 
 @login_required(login_url='login')
@@ -24,14 +28,12 @@ def home(request):
     if request.method == 'POST':
         form = URLForm(request.POST)
         if form.is_valid():
-            original_url = form.cleaned_data['original_url']
-            url, created = URL.objects.get_or_create(
-                original_url=original_url,
-                created_by=request.user if request.user.is_authenticated else None
-            )
-            if created:
-                url.save()
-            clicks = url.clicks.count()
+            # The form rejects URLs that already exist, so this is always a new
+            # link and has no clicks yet
+            url = form.save(commit=False)
+            url.created_by = request.user
+            url.save()
+            clicks = 0
             return render(
                 request,
                 'shortener/home.html',
@@ -46,11 +48,58 @@ def home(request):
     return render(request, 'shortener/home.html', {'form': form})
 
 
+class _Echo:
+    """File-like object whose write() returns the value, for streaming CSV."""
+
+    def write(self, value):
+        return value
+
+
+@login_required(login_url='login')
+@require_POST
+def bulk_shorten(request):
+    """
+    Create short links for many URLs at once.
+
+    The request body is a CSV file (original URL in the first column) or a
+    JSON array / JSON Lines document, selected by the Content-Type header.
+    Links are created in chunks and the mapping is streamed back as CSV while
+    the import runs. The CSRF token goes in the X-CSRFToken header.
+
+    :param request: The HTTP request object.
+    :type request: HttpRequest
+    :return: Streaming CSV with one row per submitted URL.
+    :rtype: StreamingHttpResponse
+    """
+    if request.content_type == 'text/csv':
+        original_urls = read_csv_urls(request)
+    elif request.content_type in ('application/json', 'application/x-ndjson'):
+        original_urls = read_json_urls(request)
+    else:
+        return HttpResponseBadRequest("Send text/csv or application/json.")
+
+    # Resolve the redirect prefix once instead of reversing it for every row
+    redirect_base = request.build_absolute_uri(reverse('redirect_to_url', args=['x']))[:-len('x/')]
+
+    def rows():
+        writer = csv.writer(_Echo())
+        yield writer.writerow(RESULT_HEADER + ('link',))
+        for original_url, short_url, created, error in shorten_urls(original_urls, request.user):
+            link = f"{redirect_base}{short_url}/" if short_url else ''
+            yield writer.writerow((original_url, short_url, int(created), error, link))
+
+    response = StreamingHttpResponse(rows(), content_type='text/csv')
+    response['Content-Disposition'] = 'attachment; filename="short_links.csv"'
+    return response
+
+
 def redirect_to_url(request, short_url):
     """
     Redirect to the original URL associated with the provided short URL.
 
-    This view logs the click details, including device type, country, and user.
+    The target is resolved through the redirect cache and the click is handed
+    to the in-memory click buffer, which enriches it (device type, country)
+    and persists it in batches off the request path.
 
     :param request: The HTTP request object.
     :type request: HttpRequest
@@ -59,33 +108,19 @@ def redirect_to_url(request, short_url):
     :return: A redirect response to the original URL.
     :rtype: HttpResponseRedirect
     """
-    url = get_object_or_404(URL, short_url=short_url)
-
-    user_agent = parse(request.META.get('HTTP_USER_AGENT', ''))
-    if user_agent.is_mobile:
-        device_type = 'Mobile'
-    elif user_agent.is_tablet:
-        device_type = 'Tablet'
-    elif user_agent.is_pc:
-        device_type = 'Desktop'
-    else:
-        device_type = 'Unknown'
-
-    ip_address = get_client_ip(request)
-    try:
-        geo = GeoIP2()
-        country = geo.country_name(ip_address)
-    except:
-        country = 'Unknown'
-
-    URLClick.objects.create(
-        url=url,
-        user=request.user if request.user.is_authenticated else None,
-        device_type=device_type,
-        country=country
+    target = resolve_short_url(short_url)
+    if target is None:
+        raise Http404("No URL matches the given short URL.")
+    url_id, original_url = target
+
+    click_buffer.enqueue(
+        url_id=url_id,
+        user_id=request.user.id if request.user.is_authenticated else None,
+        user_agent=request.META.get('HTTP_USER_AGENT', ''),
+        ip_address=get_client_ip(request),
     )
 
-    return redirect(url.original_url)
+    return redirect(original_url)
 
 
 def get_client_ip(request):
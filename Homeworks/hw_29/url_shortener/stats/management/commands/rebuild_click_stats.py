@@ -0,0 +1,24 @@
+from django.core.management.base import BaseCommand
+
+from shortener.models import URL
+from stats.rollups import rebuild_rollups
+
+
+class Command(BaseCommand):
+    help = "Recompute hourly click statistics from the raw click table"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            'short_urls', nargs='*',
+            help="Short codes to rebuild (default: all URLs)",
+        )
+
+    def handle(self, *args, **options):
+        url_ids = None
+        if options['short_urls']:
+            url_ids = list(
+                URL.objects.filter(short_url__in=options['short_urls']).values_list('id', flat=True)
+            )
+
+        buckets = rebuild_rollups(url_ids)
+        self.stdout.write(f"Rebuilt {buckets} hourly click buckets.")
@@ -0,0 +1,30 @@
+# Generated by Django 5.1.4 on 2026-10-18 10:00
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    initial = True
+
+    dependencies = [
+        ('shortener', '0005_urlclick_urlclick_url_clicked_idx'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='HourlyClickStat',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('hour', models.DateTimeField()),
+                ('device_type', models.CharField(default='Unknown', max_length=50)),
+                ('country', models.CharField(default='Unknown', max_length=100)),
+                ('clicks', models.PositiveIntegerField(default=0)),
+                ('url', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='hourly_stats', to='shortener.url')),
+            ],
+            options={
+                'constraints': [models.UniqueConstraint(fields=('url', 'hour', 'device_type', 'country'), name='hourly_click_stat_bucket_uniq')],
+            },
+        ),
+    ]
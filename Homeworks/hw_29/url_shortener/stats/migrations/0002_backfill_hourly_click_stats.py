@@ -0,0 +1,23 @@
+# Generated by Django 5.1.4 on 2026-10-18 10:00
+
+from django.db import migrations
+
+
+def backfill_hourly_click_stats(apps, schema_editor):
+    from stats.rollups import rebuild_rollups
+
+    rebuild_rollups(
+        click_model=apps.get_model('shortener', 'URLClick'),
+        stat_model=apps.get_model('stats', 'HourlyClickStat'),
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('stats', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.RunPython(backfill_hourly_click_stats, migrations.RunPython.noop),
+    ]
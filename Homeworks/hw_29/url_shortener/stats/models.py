@@ -1,3 +1,46 @@
 from django.db import models
 
-# Create your models here.
+from shortener.models import URL
+
+
+class HourlyClickStat(models.Model):
+    """
+    Represent the number of clicks a URL received within one hour from one
+    device type and country.
+
+    Rows are incremented as buffered clicks are written, so statistics are
+    read by summing a handful of buckets instead of scanning raw clicks.
+
+    :var url: The associated URL instance.
+    :type url: ForeignKey
+    :var hour: Start of the hour bucket (UTC).
+    :type hour: DateTimeField
+    :var device_type: The type of device used to click the URL.
+    :type device_type: CharField
+    :var country: The country from which the URL was clicked.
+    :type country: CharField
+    :var clicks: The number of clicks in the bucket.
+    :type clicks: PositiveIntegerField
+    """
+    url = models.ForeignKey(URL, on_delete=models.CASCADE, related_name='hourly_stats')
+    hour = models.DateTimeField()
+    device_type = models.CharField(max_length=50, default='Unknown')
+    country = models.CharField(max_length=100, default='Unknown')
+    clicks = models.PositiveIntegerField(default=0)
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(
+                fields=['url', 'hour', 'device_type', 'country'],
+                name='hourly_click_stat_bucket_uniq',
+            ),
+        ]
+
+    def __str__(self):
+        """
+        Return a string representation of the HourlyClickStat instance.
+
+        :return: A string combining the URL, hour bucket and click count.
+        :rtype: str
+        """
+        return f"{self.url} - {self.hour} - {self.clicks}"
@@ -0,0 +1,151 @@
+from collections import Counter
+from datetime import timedelta, timezone
+
+from django.db import connection, transaction
+from django.db.models import Count, Sum
+from django.db.models.functions import TruncHour
+
+from shortener.models import URLClick
+from stats.models import HourlyClickStat
+
+
+def hour_bucket(moment):
+    """
+    Truncate a datetime to the start of its UTC hour.
+
+    :param moment: The datetime to truncate.
+    :type moment: datetime
+    :return: The start of the hour.
+    :rtype: datetime
+    """
+    return moment.astimezone(timezone.utc).replace(minute=0, second=0, microsecond=0)
+
+
+def _upsert(counts):
+    """
+    Add click counts to their hourly buckets with batched
+    INSERT ... ON CONFLICT DO UPDATE statements.
+
+    :param counts: Click counts keyed by (url_id, hour, device_type, country).
+    :type counts: dict
+    """
+    if not counts:
+        return
+    table = HourlyClickStat._meta.db_table
+    qn = connection.ops.quote_name
+    columns = ', '.join(qn(c) for c in ('url_id', 'hour', 'device_type', 'country', 'clicks'))
+    conflict = ', '.join(qn(c) for c in ('url_id', 'hour', 'device_type', 'country'))
+    hour_field = HourlyClickStat._meta.get_field('hour')
+
+    items = list(counts.items())
+    batch_size = connection.ops.bulk_batch_size(['url_id', 'hour', 'device_type', 'country', 'clicks'], items)
+    with connection.cursor() as cursor:
+        for start in range(0, len(items), batch_size):
+            batch = items[start:start + batch_size]
+            params = []
+            for (url_id, hour, device_type, country), clicks in batch:
+                params += [url_id, hour_field.get_db_prep_value(hour, connection), device_type, country, clicks]
+            values = ', '.join(['(%s, %s, %s, %s, %s)'] * len(batch))
+            cursor.execute(
+                f"INSERT INTO {qn(table)} ({columns}) VALUES {values} "
+                f"ON CONFLICT ({conflict}) DO UPDATE "
+                f"SET {qn('clicks')} = {qn(table)}.{qn('clicks')} + excluded.{qn('clicks')}",
+                params,
+            )
+
+
+def record_clicks(clicks):
+    """
+    Add freshly written clicks to the hourly rollups.
+
+    Call in the same transaction that inserts the clicks, so both stay in step.
+
+    :param clicks: The click instances that were written.
+    :type clicks: list[URLClick]
+    """
+    counts = Counter(
+        (c.url_id, hour_bucket(c.clicked_at), c.device_type, c.country or 'Unknown')
+        for c in clicks
+    )
+    _upsert(counts)
+
+
+def rebuild_rollups(url_ids=None, click_model=URLClick, stat_model=HourlyClickStat):
+    """
+    Recompute hourly rollups from the raw click table.
+
+    Used to backfill clicks recorded before rollups existed and to repair
+    buckets after raw clicks were removed by hand. Clicks flushed while the
+    rebuild runs may be missed, so run it when traffic is low.
+
+    :param url_ids: Limit the rebuild to these URLs, or None for all of them.
+    :type url_ids: Iterable[int] | None
+    :param click_model: The raw click model; migrations pass the historical one.
+    :param stat_model: The rollup model; migrations pass the historical one.
+    :return: Number of buckets written.
+    :rtype: int
+    """
+    clicks_qs = click_model.objects.all()
+    stats_qs = stat_model.objects.all()
+    if url_ids is not None:
+        clicks_qs = clicks_qs.filter(url_id__in=url_ids)
+        stats_qs = stats_qs.filter(url_id__in=url_ids)
+
+    rows = (
+        clicks_qs
+        .annotate(hour=TruncHour('clicked_at', tzinfo=timezone.utc))
+        .values('url_id', 'hour', 'device_type', 'country')
+        .annotate(num_clicks=Count('id'))
+        .order_by()
+    )
+    counts = Counter()
+    for row in rows.iterator():
+        counts[(row['url_id'], row['hour'], row['device_type'], row['country'] or 'Unknown')] += row['num_clicks']
+
+    with transaction.atomic():
+        stats_qs.delete()
+        stat_model.objects.bulk_create(
+            [
+                stat_model(url_id=url_id, hour=hour, device_type=device_type,
+                                country=country, clicks=clicks)
+                for (url_id, hour, device_type, country), clicks in counts.items()
+            ],
+            batch_size=1000,
+        )
+    return len(counts)
+
+
+def click_breakdown(url_obj, since=None):
+    """
+    Count clicks of a URL by device type and by country.
+
+    Whole hours are summed from the rollups; the partial hour at the start of
+    the window, if any, is counted from raw clicks (at most one hour of them).
+
+    :param url_obj: The URL to report on.
+    :type url_obj: URL
+    :param since: Start of the window, or None for all time.
+    :type since: datetime | None
+    :return: Total clicks, clicks per device type, clicks per country.
+    :rtype: tuple[int, Counter, Counter]
+    """
+    devices = Counter()
+    countries = Counter()
+
+    stats_qs = HourlyClickStat.objects.filter(url=url_obj)
+    if since is not None:
+        first_full_hour = hour_bucket(since)
+        if first_full_hour < since:
+            first_full_hour += timedelta(hours=1)
+        stats_qs = stats_qs.filter(hour__gte=first_full_hour)
+
+        head_qs = url_obj.clicks.filter(clicked_at__gte=since, clicked_at__lt=first_full_hour)
+        for row in head_qs.values('device_type', 'country').annotate(num_clicks=Count('id')).order_by():
+            devices[row['device_type']] += row['num_clicks']
+            countries[row['country'] or 'Unknown'] += row['num_clicks']
+
+    for row in stats_qs.values('device_type', 'country').annotate(num_clicks=Sum('clicks')).order_by():
+        devices[row['device_type']] += row['num_clicks']
+        countries[row['country']] += row['num_clicks']
+
+    return sum(devices.values()), devices, countries
@@ -1,3 +1,46 @@
+from datetime import timedelta
+
+from django.contrib.auth.models import User
 from django.test import TestCase
+from django.utils import timezone
+
+from shortener.clicks import ClickBuffer
+from shortener.models import URL
+from .rollups import click_breakdown, rebuild_rollups
+
+
+class ClickRollupTests(TestCase):
+    def setUp(self):
+        self.user = User.objects.create_user(username="testuser", password="testpassword")
+        self.url = URL.objects.create(original_url="https://example.com", created_by=self.user)
+
+    def test_flush_updates_rollups(self):
+        buffer = ClickBuffer()
+        now = timezone.now()
+        buffer._persist([
+            (self.url.id, None, 'Mozilla/5.0 (X11; Linux x86_64)', '', now),
+            (self.url.id, None, 'Mozilla/5.0 (X11; Linux x86_64)', '', now),
+        ])
+        buffer._persist([
+            (self.url.id, None, 'Mozilla/5.0 (X11; Linux x86_64)', '', now - timedelta(days=2)),
+        ])
+
+        total, devices, countries = click_breakdown(self.url)
+        self.assertEqual(total, 3)
+        self.assertEqual(countries['Unknown'], 3)
+
+        total, _devices, _countries = click_breakdown(self.url, now - timedelta(days=1))
+        self.assertEqual(total, 2)
+
+    def test_rebuild_matches_raw_clicks(self):
+        now = timezone.now()
+        self.url.clicks.create(clicked_at=now, device_type='Mobile', country='Ukraine')
+        self.url.clicks.create(clicked_at=now, device_type='Desktop')
+
+        rebuild_rollups()
 
-# Create your tests here.
+        total, devices, countries = click_breakdown(self.url)
+        self.assertEqual(total, 2)
+        self.assertEqual(devices['Mobile'], 1)
+        self.assertEqual(countries['Ukraine'], 1)
+        self.assertEqual(countries['Unknown'], 1)
@@ -1,10 +1,10 @@
 from django.shortcuts import render, get_object_or_404, redirect
 from django.contrib.auth.decorators import login_required
-from django.db.models import Count
 from django.utils import timezone
 from datetime import timedelta
 
 from shortener.models import URL
+from stats.rollups import click_breakdown
 
 
 @login_required
@@ -66,58 +66,44 @@ def url_detail(request, short_url):
     url_obj = get_object_or_404(URL, short_url=short_url, created_by=request.user)
     full_short_url = request.build_absolute_uri(f'/go/{url_obj.short_url}')
 
-    clicks_qs = url_obj.clicks.all()
-
     # Filter clicks based on the selected time period
     selected_period = request.GET.get('period', 'all')
 
+    since = None
     if selected_period == 'hour':
         # Last 1 hour
-        cutoff = timezone.now() - timedelta(hours=1)
-        clicks_qs = clicks_qs.filter(clicked_at__gte=cutoff)
+        since = timezone.now() - timedelta(hours=1)
     elif selected_period == 'day':
         # Last 24 hours
-        cutoff = timezone.now() - timedelta(days=1)
-        clicks_qs = clicks_qs.filter(clicked_at__gte=cutoff)
+        since = timezone.now() - timedelta(days=1)
     elif selected_period == 'month':
         # Last 30 days
-        cutoff = timezone.now() - timedelta(days=30)
-        clicks_qs = clicks_qs.filter(clicked_at__gte=cutoff)
+        since = timezone.now() - timedelta(days=30)
 
-    clicks_count = clicks_qs.count()
+    # Summed from hourly rollups, so the cost does not grow with the clicks
+    clicks_count, device_counts, country_counts = click_breakdown(url_obj, since)
 
     # Calculate device type statistics
-    device_rows = (
-        clicks_qs
-        .values('device_type')
-        .annotate(num_clicks=Count('device_type'))
-    )
     device_stats = []
-    for row in device_rows:
+    for device_type, num_clicks in device_counts.items():
         pct = 0
         if clicks_count > 0:
-            pct = (row['num_clicks'] / clicks_count) * 100
+            pct = (num_clicks / clicks_count) * 100
         device_stats.append({
-            'device_type': row['device_type'],
-            'num_clicks': row['num_clicks'],
+            'device_type': device_type,
+            'num_clicks': num_clicks,
             'percentage': pct
         })
 
     # Calculate country statistics
-    country_rows = (
-        clicks_qs
-        .values('country')
-        .annotate(num_clicks=Count('country'))
-        .order_by('-num_clicks')
-    )
     country_stats = []
-    for row in country_rows:
+    for country, num_clicks in country_counts.most_common():
         pct = 0
         if clicks_count > 0:
-            pct = (row['num_clicks'] / clicks_count) * 100
+            pct = (num_clicks / clicks_count) * 100
         country_stats.append({
-            'country': row['country'],
-            'num_clicks': row['num_clicks'],
+            'country': country,
+            'num_clicks': num_clicks,
             'percentage': pct
         })
 
@@ -10,6 +10,8 @@ For the full list of settings and their values, see
 https://docs.djangoproject.com/en/5.1/ref/settings/
 """
 
+import os
+import tempfile
 from pathlib import Path
 
 # Build paths inside the project like this: BASE_DIR / 'subdir'.
@@ -85,6 +87,36 @@ DATABASES = {
 }
 
 
+# Cache
+# Holds short_url -> original_url for redirects; swap for Redis to share it
+# between processes.
+
+CACHES = {
+    'default': {
+        'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+        'OPTIONS': {
+            'MAX_ENTRIES': 100000,
+        },
+    },
+    # Rendered QR codes, shared between processes and kept across restarts;
+    # outside the source tree unless QR_CACHE_DIR says otherwise
+    'qr': {
+        'BACKEND': 'django.core.cache.backends.filebased.FileBasedCache',
+        'LOCATION': os.environ.get('QR_CACHE_DIR', os.path.join(tempfile.gettempdir(), 'url_shortener_qr')),
+        'TIMEOUT': 60 * 60 * 24 * 30,
+        'OPTIONS': {
+            'MAX_ENTRIES': 50000,
+        },
+    },
+}
+
+
+# Short codes
+# Sequence values each process reserves at once for new short codes.
+
+SHORT_CODE_BLOCK_SIZE = 1000
+
+
 # Password validation
 # https://docs.djangoproject.com/en/5.1/ref/settings/#auth-password-validators
 
@@ -1,30 +1,39 @@
+from dotenv import load_dotenv
+
+# Config reads the environment at import time, so .env must be loaded first
+load_dotenv()
+
 from flask import Flask
 from app.extensions import db, migrate
 from app.models import Film, Director
 from app.routes import main
 from app.config import Config
+from app.database import init_engine
 from flask_jwt_extended import JWTManager
 from app.auth import auth_bp
-from dotenv import load_dotenv
+from app.security import init_auth
 import os
 
 
-load_dotenv()
-
-def create_app():
+def create_app(config_class=Config):
     app = Flask(__name__)
 
     # app.config['SQLALCHEMY_DATABASE_URI'] = 'sqlite:///film_library.db'
     # app.config['SQLALCHEMY_TRACK_MODIFICATIONS'] = False
-    app.config.from_object(Config)
+    app.config.from_object(config_class)
 
     db.init_app(app)
     migrate.init_app(app, db)
     jwt = JWTManager(app)
+    init_auth(app)
     app.register_blueprint(main)
     app.register_blueprint(auth_bp, url_prefix='/auth')
 
     with app.app_context():
+        init_engine(db.engine, app.config['DB_PROFILE'])
         db.create_all()
+        # Under gunicorn --preload this runs in the master; forked workers
+        # must open their own connections instead of sharing these
+        db.engine.dispose()
 
     return app
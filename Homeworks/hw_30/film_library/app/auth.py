@@ -2,13 +2,31 @@
 from flask import Blueprint, request, jsonify
 from app.extensions import db
 from app.models import User
+from app import security
 from flask_jwt_extended import create_access_token
+from werkzeug.security import check_password_hash
 
 
 # ---- Define Blueprint ----
 auth_bp = Blueprint('auth', __name__)
 
 
+# ---- Helpers ----
+def _has_credentials(data):
+    """
+    Check that a request payload carries a non-empty username and password.
+
+    :param data: The decoded JSON payload.
+    :return: True if both are non-empty strings.
+    :rtype: bool
+    """
+    return (
+        isinstance(data, dict)
+        and isinstance(data.get('username'), str) and bool(data['username'])
+        and isinstance(data.get('password'), str) and bool(data['password'])
+    )
+
+
 # ---- Endpoints ----
 @auth_bp.route('/register', methods=['POST'])
 def register():
@@ -21,8 +39,8 @@ def register():
     :return: A JSON response indicating success or an error message with appropriate HTTP status.
     :rtype: flask.Response
     """
-    data = request.get_json()
-    if not data or not data.get('username') or not data.get('password'):
+    data = request.get_json(silent=True)
+    if not _has_credentials(data):
         return jsonify({"error": "username and password required"}), 400
 
     existing_user = User.query.filter_by(username=data['username']).first()
@@ -46,16 +64,32 @@ def login():
     This endpoint authenticates a user by accepting a JSON payload with 'username' and 'password'.
     If authentication succeeds, it generates a JWT access token for the user.
 
+    Clients, and usernames tried from a client, over their attempt limits are
+    rejected with 429 before any password is hashed. Hashes made with an outdated method or cost are
+    replaced after a successful login.
+
     :return: A JSON response with the access token or an error message with appropriate HTTP status.
     :rtype: flask.Response
     """
-    data = request.get_json()
-    if not data or not data.get('username') or not data.get('password'):
+    data = request.get_json(silent=True)
+    if not _has_credentials(data):
         return jsonify({"error": "username and password required"}), 400
 
-    user = User.query.filter_by(username=data['username']).first()
-    if not user or not user.check_password(data['password']):
+    username = data['username']
+    retry_after = security.login_retry_after(username)
+    if retry_after:
+        response = jsonify({"error": "too many login attempts, try again later"})
+        response.headers['Retry-After'] = str(retry_after)
+        return response, 429
+
+    credentials = security.get_credentials(username)
+    valid = credentials is not None and check_password_hash(credentials.password_hash, data['password'])
+    security.record_login_attempt(username, valid)
+    if not valid:
         return jsonify({"error": "invalid username or password"}), 401
 
-    access_token = create_access_token(identity=str(user.id))
+    if security.needs_rehash(credentials.password_hash):
+        security.rehash_password(credentials, data['password'])
+
+    access_token = create_access_token(identity=str(credentials.id))
     return jsonify({"access_token": access_token}), 200
@@ -0,0 +1,182 @@
+# ---- Import Statements ----
+from sqlalchemy import delete, insert, select, update
+from app.extensions import db
+from app.models import Director, Film
+
+
+# ---- Settings ----
+UNKNOWN_DIRECTOR_NAME = 'unknown'
+
+# Columns accepted in batch requests and the type each value is converted to
+FILM_FIELDS = {
+    'title': str,
+    'release_year': int,
+    'rating': float,
+    'poster': str,
+    'description': str,
+    'director_id': int,
+}
+
+# Columns a new film cannot be created without
+REQUIRED_FILM_FIELDS = ('title', 'release_year', 'rating', 'poster', 'description', 'director_id')
+
+
+# ---- Sentinel Director ----
+def get_unknown_director_id():
+    """
+    Return the id of the 'unknown' director that orphaned films move to.
+
+    The id is looked up in the current transaction every time rather than
+    cached: another worker may have created the director meanwhile, and a
+    cached id would outlive a rollback of the transaction that created it.
+    A missing director is created inside the current transaction.
+
+    :return: The id of the 'unknown' director.
+    :rtype: int
+    """
+    director_id = db.session.scalar(select(Director.id).where(Director.name == UNKNOWN_DIRECTOR_NAME))
+    if director_id is not None:
+        return director_id
+
+    director = Director(name=UNKNOWN_DIRECTOR_NAME)
+    db.session.add(director)
+    db.session.flush()
+    return director.id
+
+
+# ---- Set-Based Operations ----
+def reassign_films(from_director_id, to_director_id):
+    """
+    Move every film of one director to another with a single UPDATE.
+
+    :param from_director_id: The ID of the current director.
+    :type from_director_id: int
+    :param to_director_id: The ID of the new director.
+    :type to_director_id: int
+    :return: The number of films moved.
+    :rtype: int
+    """
+    result = db.session.execute(
+        update(Film)
+        .where(Film.director_id == from_director_id)
+        .values(director_id=to_director_id)
+        .execution_options(synchronize_session=False)
+    )
+    return result.rowcount
+
+
+def delete_director(director_id):
+    """
+    Delete a director after moving their films to the 'unknown' director.
+
+    Runs one UPDATE and one DELETE; the caller commits.
+
+    :param director_id: The ID of the director to delete.
+    :type director_id: int
+    :return: The number of films moved, or None if the director does not exist.
+    :rtype: int
+    :raises ValueError: If the director is the 'unknown' director itself.
+    """
+    unknown_id = get_unknown_director_id()
+    if director_id == unknown_id:
+        raise ValueError("the 'unknown' director cannot be deleted")
+
+    moved = reassign_films(director_id, unknown_id)
+    result = db.session.execute(
+        delete(Director)
+        .where(Director.id == director_id)
+        .execution_options(synchronize_session=False)
+    )
+    if not result.rowcount:
+        return None
+    return moved
+
+
+# ---- Batch Validation ----
+def parse_film_rows(items, required=(), with_id=False):
+    """
+    Validate a JSON array of films and convert its values to column types.
+
+    :param items: The decoded JSON payload.
+    :type items: list
+    :param required: Fields every item must contain.
+    :type required: tuple
+    :param with_id: Whether every item must carry the film 'id'.
+    :type with_id: bool
+    :return: A list of dictionaries ready for bulk statements.
+    :rtype: list
+    :raises ValueError: If the payload or one of its items is invalid.
+    """
+    if not isinstance(items, list) or not items:
+        raise ValueError("a non-empty JSON array is required")
+
+    rows = []
+    for number, item in enumerate(items):
+        if not isinstance(item, dict):
+            raise ValueError(f"item {number}: an object is required")
+        missing = [field for field in required if item.get(field) in (None, '')]
+        if missing:
+            raise ValueError(f"item {number}: missing {', '.join(missing)}")
+        try:
+            row = {field: convert(item[field]) for field, convert in FILM_FIELDS.items() if field in item}
+            if with_id:
+                row['id'] = int(item['id'])
+        except KeyError:
+            raise ValueError(f"item {number}: id is required")
+        except (TypeError, ValueError):
+            raise ValueError(f"item {number}: invalid value")
+        rows.append(row)
+    return rows
+
+
+def missing_ids(model, ids):
+    """
+    Return the ids that have no row in a table, checked with one query.
+
+    :param model: The model to check.
+    :param ids: The ids to look for.
+    :type ids: set
+    :return: The sorted ids that do not exist.
+    :rtype: list
+    """
+    found = set(db.session.scalars(select(model.id).where(model.id.in_(ids))))
+    return sorted(set(ids) - found)
+
+
+# ---- Batch Operations ----
+def import_films(rows):
+    """
+    Insert films with one multi-row INSERT; the caller commits.
+
+    :param rows: Rows from `parse_film_rows`.
+    :type rows: list
+    :return: The ids of the new films, in input order.
+    :rtype: list
+    """
+    return list(db.session.scalars(insert(Film).returning(Film.id, sort_by_parameter_order=True), rows))
+
+
+def update_films(rows):
+    """
+    Update films by primary key with executemany UPDATE statements; the
+    caller commits.
+
+    :param rows: Rows from `parse_film_rows` carrying an 'id'.
+    :type rows: list
+    """
+    db.session.execute(update(Film), rows)
+
+
+def delete_films(ids):
+    """
+    Delete films with one DELETE; the caller commits.
+
+    :param ids: The ids of the films.
+    :type ids: list
+    :return: The number of films deleted.
+    :rtype: int
+    """
+    result = db.session.execute(
+        delete(Film).where(Film.id.in_(ids)).execution_options(synchronize_session=False)
+    )
+    return result.rowcount
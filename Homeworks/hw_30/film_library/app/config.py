@@ -1,5 +1,6 @@
 # ---- Import Statements ----
 import os
+from app.database import default_profile, engine_options
 
 
 # ---- Configuration Class ----
@@ -11,6 +12,25 @@ class Config:
     database connection settings, security keys, and other global options.
     """
     SECRET_KEY = os.environ.get('SECRET_KEY')
-    SQLALCHEMY_DATABASE_URI = 'sqlite:///film_library.db'
+    SQLALCHEMY_DATABASE_URI = os.environ.get('SQLALCHEMY_DATABASE_URI', 'sqlite:///film_library.db')
     SQLALCHEMY_TRACK_MODIFICATIONS = False
+
+    # Engine profile (see app.database.ENGINE_PROFILES), chosen from the URI by default
+    DB_PROFILE = os.environ.get('DB_PROFILE') or default_profile(SQLALCHEMY_DATABASE_URI)
+    SQLALCHEMY_ENGINE_OPTIONS = engine_options(DB_PROFILE)
     JWT_SECRET_KEY = os.environ.get('JWT_SECRET_KEY')
+
+    # Password hashing method and cost; older hashes are replaced on login
+    PASSWORD_HASH_METHOD = os.environ.get('PASSWORD_HASH_METHOD', 'scrypt:32768:8:1')
+
+    # Seconds decoded tokens and resolved users stay in the in-process cache
+    AUTH_CACHE_TTL = int(os.environ.get('AUTH_CACHE_TTL', 60))
+    AUTH_CACHE_MAX_SIZE = 10000
+
+    # Login attempts allowed per client address and failed attempts allowed
+    # per username and client address within LOGIN_RATE_WINDOW seconds. The
+    # counters are kept per process: with 4 gunicorn workers a client can
+    # make up to 4 times as many attempts.
+    LOGIN_RATE_LIMIT = int(os.environ.get('LOGIN_RATE_LIMIT', 20))
+    LOGIN_FAILURE_LIMIT = int(os.environ.get('LOGIN_FAILURE_LIMIT', 5))
+    LOGIN_RATE_WINDOW = int(os.environ.get('LOGIN_RATE_WINDOW', 60))
@@ -0,0 +1,107 @@
+# ---- Import Statements ----
+import os
+from sqlalchemy import event
+
+
+# ---- Engine Profiles ----
+ENGINE_PROFILES = {
+    # SQLite as it behaves out of the box: rollback journal, full fsync
+    'sqlite-rollback': {
+        'pragmas': {},
+    },
+    # SQLite with a write-ahead log: readers no longer block the writer and
+    # writers wait for the lock instead of failing with "database is locked"
+    'sqlite-wal': {
+        'pragmas': {
+            'journal_mode': 'WAL',
+            'synchronous': 'NORMAL',
+            'busy_timeout': 10000,
+            'foreign_keys': 'ON',
+            'temp_store': 'MEMORY',
+        },
+    },
+    # Server databases (PostgreSQL, MySQL): a connection pool per worker process
+    'server': {
+        'pool': {
+            'pool_pre_ping': True,
+            'pool_recycle': 1800,
+            'pool_timeout': 30,
+        },
+    },
+}
+
+
+def default_profile(database_uri):
+    """
+    Pick the engine profile for a database URI.
+
+    :param database_uri: The SQLAlchemy database URI.
+    :type database_uri: str
+    :return: 'sqlite-wal' for SQLite, otherwise 'server'.
+    :rtype: str
+    """
+    return 'sqlite-wal' if database_uri.startswith('sqlite') else 'server'
+
+
+def pool_size():
+    """
+    Return the number of pooled connections for one worker process.
+
+    Each gunicorn worker holds its own pool, so the size follows the number
+    of threads a worker serves requests with (`GUNICORN_THREADS`) unless
+    `DB_POOL_SIZE` sets it explicitly. Keep workers * (pool size + overflow)
+    below the server's connection limit.
+
+    :return: The pool size.
+    :rtype: int
+    """
+    return int(os.environ.get('DB_POOL_SIZE') or os.environ.get('GUNICORN_THREADS') or 5)
+
+
+def engine_options(profile):
+    """
+    Build `SQLALCHEMY_ENGINE_OPTIONS` for an engine profile.
+
+    SQLite pragmas are not engine options; `init_engine` applies them to
+    every new connection.
+
+    :param profile: The name of a profile in `ENGINE_PROFILES`.
+    :type profile: str
+    :return: Keyword arguments for `sqlalchemy.create_engine`.
+    :rtype: dict
+    """
+    settings = ENGINE_PROFILES[profile]
+    if 'pool' in settings:
+        return {
+            **settings['pool'],
+            'pool_size': pool_size(),
+            'max_overflow': int(os.environ.get('DB_MAX_OVERFLOW', 10)),
+        }
+
+    busy_timeout = settings['pragmas'].get('busy_timeout')
+    if busy_timeout is None:
+        return {}
+    # The driver's own lock wait, in seconds, matches the pragma
+    return {'connect_args': {'timeout': busy_timeout / 1000}}
+
+
+# ---- Engine Setup ----
+def init_engine(engine, profile):
+    """
+    Apply the connection settings of a profile to an engine.
+
+    :param engine: The SQLAlchemy engine.
+    :type engine: sqlalchemy.engine.Engine
+    :param profile: The name of a profile in `ENGINE_PROFILES`.
+    :type profile: str
+    """
+    pragmas = ENGINE_PROFILES[profile].get('pragmas')
+    if not pragmas:
+        return
+
+    @event.listens_for(engine, 'connect')
+    def set_sqlite_pragmas(dbapi_connection, connection_record):
+        cursor = dbapi_connection.cursor()
+        for name, value in pragmas.items():
+            cursor.execute(f'PRAGMA {name} = {value}')
+        cursor.close()
@@ -1,4 +1,5 @@
 # ---- Import Statements ----
+from flask import current_app
 from app.extensions import db
 from werkzeug.security import generate_password_hash, check_password_hash
 
@@ -24,12 +25,12 @@ class User(db.Model):
 
     def set_password(self, password):
         """
-        Hash and set the user's password.
+        Hash and set the user's password with the configured method and cost.
 
         :param password: The plaintext password to hash.
         :type password: str
         """
-        self.password_hash = generate_password_hash(password)
+        self.password_hash = generate_password_hash(password, method=current_app.config['PASSWORD_HASH_METHOD'])
 
     def check_password(self, password):
         """
@@ -102,13 +103,17 @@ class Film(db.Model):
     :type director: Director
     """
     __tablename__ = 'films'
+    __table_args__ = (
+        # Keyset pagination of listings sorted by rating
+        db.Index('ix_films_rating_id', 'rating', 'id'),
+    )
     id = db.Column(db.Integer, primary_key=True)
     title = db.Column(db.String(80), unique=True, nullable=False)
-    release_year = db.Column(db.Integer, nullable=False)
+    release_year = db.Column(db.Integer, nullable=False, index=True)
     rating = db.Column(db.Float, nullable=False, default=0.0)
     poster = db.Column(db.String(80), unique=True, nullable=False)
     description = db.Column(db.Text, unique=True, nullable=False)
-    director_id = db.Column(db.Integer, db.ForeignKey('directors.id'), nullable=False)
+    director_id = db.Column(db.Integer, db.ForeignKey('directors.id'), nullable=False, index=True)
     director = db.relationship('Director', backref='films', lazy=True)
 
     def __repr__(self):
@@ -0,0 +1,103 @@
+# ---- Import Statements ----
+import base64
+import json
+
+from sqlalchemy import or_
+
+
+# ---- Settings ----
+DEFAULT_PAGE_SIZE = 50
+MAX_PAGE_SIZE = 500
+
+
+# ---- Cursors ----
+def encode_cursor(values):
+    """
+    Encode the sort key of the last row of a page as an opaque cursor.
+
+    :param values: The sort key values, e.g. ``[rating, id]``.
+    :type values: list
+    :return: A URL-safe cursor string.
+    :rtype: str
+    """
+    raw = json.dumps(values, separators=(',', ':')).encode()
+    return base64.urlsafe_b64encode(raw).decode().rstrip('=')
+
+
+def _accepted_types(column):
+    """
+    Return the JSON value types a cursor may hold for a sort column.
+
+    Integer columns take ints, float columns ints or floats. bool is a
+    subclass of int, so it is rejected separately.
+    """
+    python_type = column.type.python_type
+    if python_type is float:
+        return (int, float)
+    return (python_type,)
+
+
+def decode_cursor(cursor, columns):
+    """
+    Decode a cursor produced by `encode_cursor`.
+
+    :param cursor: The cursor string from the request.
+    :type cursor: str
+    :param columns: The sort columns the cursor must hold a value for.
+    :type columns: list
+    :return: The sort key values.
+    :rtype: list
+    :raises ValueError: If the cursor is malformed or a value does not fit its column.
+    """
+    try:
+        raw = base64.urlsafe_b64decode(cursor + '=' * (-len(cursor) % 4))
+        values = json.loads(raw)
+    except (ValueError, TypeError):
+        raise ValueError("invalid cursor")
+    if not isinstance(values, list) or len(values) != len(columns):
+        raise ValueError("invalid cursor")
+    for column, value in zip(columns, values):
+        if isinstance(value, bool) or not isinstance(value, _accepted_types(column)):
+            raise ValueError("invalid cursor")
+    return values
+
+
+# ---- Keyset Filtering ----
+def after_key(columns, values, descending=False):
+    """
+    Build a filter selecting the rows that come after a sort key.
+
+    The comparison is spelled out as ``a > x OR (a = x AND b > y)`` so an
+    index on the sort columns can serve it on every database.
+
+    :param columns: The sort columns, most significant first.
+    :type columns: list
+    :param values: The sort key of the last row already returned.
+    :type values: list
+    :param descending: Whether the listing is sorted in descending order.
+    :type descending: bool
+    :return: A SQLAlchemy filter expression.
+    """
+    column, value = columns[0], values[0]
+    beyond = column < value if descending else column > value
+    if len(columns) == 1:
+        return beyond
+    return or_(beyond, (column == value) & after_key(columns[1:], values[1:], descending))
+
+
+def page_size(raw_limit):
+    """
+    Parse the requested page size.
+
+    :param raw_limit: The ``limit`` query parameter, or None.
+    :type raw_limit: str
+    :return: The page size, capped at `MAX_PAGE_SIZE`.
+    :rtype: int
+    :raises ValueError: If the limit is not a positive integer.
+    """
+    if raw_limit is None:
+        return DEFAULT_PAGE_SIZE
+    limit = int(raw_limit)
+    if limit <= 0:
+        raise ValueError("limit must be a positive integer")
+    return min(limit, MAX_PAGE_SIZE)
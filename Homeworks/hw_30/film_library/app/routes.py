@@ -1,14 +1,30 @@
 # ---- Import Statements ----
-from flask import Blueprint, request, jsonify
+import json
+from flask import Blueprint, Response, request, jsonify, stream_with_context
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import joinedload
 from app.models import Film, Director
 from app.extensions import db
-from flask_jwt_extended import jwt_required
+from app import bulk
+from app.pagination import after_key, decode_cursor, encode_cursor, page_size
+from app.security import auth_required
 
 
 # ---- Define Blueprint ----
 main = Blueprint('main', __name__)
 
 
+# ---- Film Listing Settings ----
+# Sort columns (most significant first) and direction of each listing order
+FILM_SORTS = {
+    'id': ([Film.id], False),
+    'rating': ([Film.rating, Film.id], True),
+}
+
+# Rows fetched from the database cursor at a time while streaming
+FILM_STREAM_BATCH_SIZE = 100
+
+
 # ---- Index Route ----
 @main.route('/')
 def index():
@@ -24,7 +40,7 @@ def index():
 # ---- Director Routes ----
 
 @main.route('/add-director', methods=['POST'])
-@jwt_required()
+@auth_required()
 def add_director():
     """
     Add a new director.
@@ -41,7 +57,11 @@ def add_director():
 
     director = Director(name=name)
     db.session.add(director)
-    db.session.commit()
+    try:
+        db.session.commit()
+    except IntegrityError:
+        db.session.rollback()
+        return jsonify({"error": "a director with this name already exists"}), 400
     return jsonify({"id": director.id, "name": director.name}), 201
 
 
@@ -59,7 +79,7 @@ def get_directors():
 
 
 @main.route('/update-director/<int:director_id>', methods=['PUT'])
-@jwt_required()
+@auth_required()
 def update_director(director_id):
     """
     Update an existing director's name.
@@ -72,46 +92,50 @@ def update_director(director_id):
     director = Director.query.get_or_404(director_id)
     data = request.get_json()
     name = data.get('name')
-    if name:
+    if name and name != director.name:
+        # Films of deleted directors are found through this name
+        if bulk.UNKNOWN_DIRECTOR_NAME in (name, director.name):
+            return jsonify({"error": "the 'unknown' director cannot be renamed to or from"}), 400
         director.name = name
-    db.session.commit()
+    try:
+        db.session.commit()
+    except IntegrityError:
+        db.session.rollback()
+        return jsonify({"error": "a director with this name already exists"}), 400
     return jsonify({"message": "director updated successfully"}), 200
 
 
 @main.route('/director-delete/<int:director_id>', methods=['DELETE'])
-@jwt_required()
+@auth_required()
 def delete_director(director_id):
     """
     Delete a director and reassign their films to 'unknown'.
 
+    The films are moved with a single UPDATE and everything is committed
+    at once.
+
     :param director_id: The ID of the director to delete.
     :type director_id: int
     :return: A JSON response indicating success or failure.
     :rtype: dict
     """
-    director = Director.query.get(director_id)
-    if not director:
+    try:
+        moved = bulk.delete_director(director_id)
+    except ValueError as e:
+        db.session.rollback()
+        return jsonify({"error": str(e)}), 400
+    if moved is None:
+        db.session.rollback()
         return jsonify({"error": "director not found"}), 404
 
-    unknown = Director.query.filter_by(name="unknown").first()
-    if not unknown:
-        unknown = Director(name="unknown")
-        db.session.add(unknown)
-        db.session.commit()
-
-    for film in director.films:
-        film.director_id = unknown.id
-        db.session.add(film)
-
-    db.session.delete(director)
     db.session.commit()
-    return jsonify({"message": "director deleted successfully"}), 200
+    return jsonify({"message": "director deleted successfully", "films_reassigned": moved}), 200
 
 
 # ---- Film Routes ----
 
 @main.route('/films', methods=['POST'])
-@jwt_required()
+@auth_required()
 def add_films():
     """
     Add a new film.
@@ -142,24 +166,72 @@ def add_films():
 @main.route('/films-list', methods=['GET'])
 def get_films():
     """
-    Retrieve a list of all films.
-
-    :return: A JSON response containing a list of films with their details.
-    :rtype: list
+    Retrieve one page of films.
+
+    Pages are selected with keyset pagination: the response carries a
+    `next_cursor` that encodes the sort key of its last film, and the next
+    page is requested by passing it back as `cursor`. Directors are loaded
+    in the same query and the JSON is streamed row by row.
+
+    Query parameters:
+        sort: 'id' (ascending, default) or 'rating' (best rated first).
+        limit: Films per page (default 50, at most 500).
+        cursor: The `next_cursor` of the previous page.
+        year: Only films released in this year.
+        min_rating, max_rating: Only films rated within this range.
+        director_id: Only films by this director.
+
+    :return: A streamed JSON response with the films and the next cursor.
+    :rtype: flask.Response
     """
-    films = Film.query.all()
-    result = [{
-        "id": f.id,
-        "title": f.title,
-        "release_year": f.release_year,
-        "rating": f.rating,
-        "director": f.director.name,
-    } for f in films]
-    return jsonify(result), 200
+    sort = request.args.get('sort', 'id')
+    if sort not in FILM_SORTS:
+        return jsonify({"error": f"sort must be one of: {', '.join(FILM_SORTS)}"}), 400
+    columns, descending = FILM_SORTS[sort]
+
+    query = Film.query.options(joinedload(Film.director))
+    try:
+        limit = page_size(request.args.get('limit'))
+        if 'year' in request.args:
+            query = query.filter(Film.release_year == int(request.args['year']))
+        if 'min_rating' in request.args:
+            query = query.filter(Film.rating >= float(request.args['min_rating']))
+        if 'max_rating' in request.args:
+            query = query.filter(Film.rating <= float(request.args['max_rating']))
+        if 'director_id' in request.args:
+            query = query.filter(Film.director_id == int(request.args['director_id']))
+        if 'cursor' in request.args:
+            query = query.filter(after_key(columns, decode_cursor(request.args['cursor'], columns), descending))
+    except ValueError as e:
+        return jsonify({"error": str(e)}), 400
+
+    query = query.order_by(*(column.desc() if descending else column for column in columns))
+
+    def generate():
+        # One extra row tells whether another page follows
+        films = query.limit(limit + 1).yield_per(FILM_STREAM_BATCH_SIZE)
+        next_cursor = None
+        last = None
+        yield '{"films":['
+        for number, film in enumerate(films):
+            if number == limit:
+                next_cursor = encode_cursor([getattr(last, column.key) for column in columns])
+                break
+            yield (',' if number else '') + json.dumps({
+                "id": film.id,
+                "title": film.title,
+                "release_year": film.release_year,
+                "rating": film.rating,
+                "director": film.director.name,
+            })
+            last = film
+        yield '],"next_cursor":' + json.dumps(next_cursor) + '}'
+
+    return Response(stream_with_context(generate()), mimetype='application/json'), 200
 
 
 @main.route('/delete-film/<int:film_id>', methods=['DELETE'])
-@jwt_required()
+@auth_required()
 def delete_film(film_id):
     """
     Delete a film by its ID.
@@ -182,7 +254,7 @@ def delete_film(film_id):
 
 
 @main.route('/update-film/<int:film_id>', methods=['PUT', 'PATCH'])
-@jwt_required()
+@auth_required()
 def update_film(film_id):
     """
     Update an existing film's details.
@@ -229,3 +301,90 @@ def update_film(film_id):
         return jsonify({"error": str(e)}), 400
     except Exception as e:
         return jsonify({"error": str(e)}), 500
+
+
+# ---- Batch Film Routes ----
+
+@main.route('/films/batch', methods=['POST'])
+@auth_required()
+def import_films():
+    """
+    Add films from a JSON array in one transaction.
+
+    Every item needs title, release_year, rating, poster, description and
+    director_id. Nothing is saved if any item is invalid.
+
+    :return: A JSON response with the ids of the new films or an error message.
+    :rtype: dict
+    """
+    try:
+        rows = bulk.parse_film_rows(request.get_json(silent=True), required=bulk.REQUIRED_FILM_FIELDS)
+    except ValueError as e:
+        return jsonify({"error": str(e)}), 400
+
+    unknown_directors = bulk.missing_ids(Director, {row['director_id'] for row in rows})
+    if unknown_directors:
+        return jsonify({"error": "director not found", "director_ids": unknown_directors}), 404
+
+    try:
+        ids = bulk.import_films(rows)
+        db.session.commit()
+    except IntegrityError as e:
+        db.session.rollback()
+        return jsonify({"error": str(e.orig)}), 400
+    return jsonify({"message": "films created successfully", "ids": ids}), 201
+
+
+@main.route('/films/batch', methods=['PATCH'])
+@auth_required()
+def update_films():
+    """
+    Update films from a JSON array in one transaction.
+
+    Every item needs the film 'id' plus the fields to change. Nothing is
+    saved if any item is invalid or refers to a missing film or director.
+
+    :return: A JSON response with the number of updated films or an error message.
+    :rtype: dict
+    """
+    try:
+        rows = bulk.parse_film_rows(request.get_json(silent=True), with_id=True)
+    except ValueError as e:
+        return jsonify({"error": str(e)}), 400
+
+    unknown_films = bulk.missing_ids(Film, {row['id'] for row in rows})
+    if unknown_films:
+        return jsonify({"error": "film not found", "ids": unknown_films}), 404
+    unknown_directors = bulk.missing_ids(Director, {row['director_id'] for row in rows if 'director_id' in row})
+    if unknown_directors:
+        return jsonify({"error": "director not found", "director_ids": unknown_directors}), 404
+
+    try:
+        bulk.update_films(rows)
+        db.session.commit()
+    except IntegrityError as e:
+        db.session.rollback()
+        return jsonify({"error": str(e.orig)}), 400
+    return jsonify({"message": "films updated successfully", "updated": len(rows)}), 200
+
+
+@main.route('/films/batch', methods=['DELETE'])
+@auth_required()
+def delete_films():
+    """
+    Delete films given as a JSON array of ids with a single statement.
+
+    :return: A JSON response with the number of deleted films or an error message.
+    :rtype: dict
+    """
+    ids = request.get_json(silent=True)
+    if not isinstance(ids, list) or not ids:
+        return jsonify({"error": "a non-empty JSON array of ids is required"}), 400
+    try:
+        ids = [int(film_id) for film_id in ids]
+    except (TypeError, ValueError):
+        return jsonify({"error": "ids must be integers"}), 400
+
+    deleted = bulk.delete_films(ids)
+    db.session.commit()
+    return jsonify({"message": "films deleted successfully", "deleted": deleted}), 200
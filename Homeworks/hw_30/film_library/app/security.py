@@ -0,0 +1,351 @@
+# ---- Import Statements ----
+import threading
+import time
+from collections import OrderedDict, namedtuple
+from functools import lru_cache, wraps
+from flask import current_app, g, jsonify, request
+from flask_jwt_extended import decode_token
+from flask_jwt_extended.exceptions import JWTExtendedException
+from jwt.exceptions import PyJWTError
+from werkzeug.security import generate_password_hash
+from app.extensions import db
+from app.models import User
+
+
+# ---- Cached Records ----
+CachedUser = namedtuple('CachedUser', ['id', 'username'])
+"""
+A user resolved from a token identity, detached from any database session.
+"""
+
+Credentials = namedtuple('Credentials', ['id', 'username', 'password_hash'])
+"""
+The stored credentials of a user, as needed to check a login.
+"""
+
+
+# ---- In-Process Caches ----
+class TTLCache:
+    """
+    Keep a bounded number of values in memory for a limited time.
+
+    Entries expire after their time to live; when the cache is full the
+    least recently used entry is dropped. Safe to share between threads.
+
+    :var max_size: The maximum number of entries.
+    :type max_size: int
+    """
+
+    def __init__(self, max_size):
+        self.max_size = max_size
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key):
+        """
+        Return a cached value, or None if it is missing or expired.
+
+        :param key: The cache key.
+        :return: The cached value or None.
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            value, expires_at = entry
+            if expires_at <= time.monotonic():
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            return value
+
+    def set(self, key, value, ttl):
+        """
+        Store a value for `ttl` seconds.
+
+        :param key: The cache key.
+        :param value: The value to store.
+        :param ttl: Seconds the value stays valid; nothing is stored if not positive.
+        :type ttl: float
+        """
+        if ttl <= 0:
+            return
+        with self._lock:
+            self._entries[key] = (value, time.monotonic() + ttl)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+
+    def delete(self, key):
+        """
+        Drop a cached value.
+
+        :param key: The cache key.
+        """
+        with self._lock:
+            self._entries.pop(key, None)
+
+
+class RateLimiter:
+    """
+    Count attempts per key in fixed time windows.
+
+    Counters live in the memory of one process, so with several gunicorn
+    workers a client gets up to `limit` attempts per worker.
+
+    :var limit: The number of attempts allowed per window.
+    :type limit: int
+    :var window: The window length in seconds.
+    :type window: int
+    """
+
+    def __init__(self, limit, window, max_keys):
+        self.limit = limit
+        self.window = window
+        self._counters = TTLCache(max_keys)
+
+    def retry_after(self, key):
+        """
+        Tell whether a key has used up its attempts.
+
+        :param key: The client or account key.
+        :return: Seconds until the next attempt is allowed, or 0 if allowed now.
+        :rtype: int
+        """
+        counter = self._counters.get(key)
+        if counter is None or counter[1] < self.limit:
+            return 0
+        return max(1, int(counter[0] + self.window - time.monotonic()) + 1)
+
+    def hit(self, key):
+        """
+        Count one attempt for a key.
+
+        :param key: The client or account key.
+        """
+        now = time.monotonic()
+        counter = self._counters.get(key)
+        if counter is None:
+            self._counters.set(key, (now, 1), self.window)
+        else:
+            started, count = counter
+            self._counters.set(key, (started, count + 1), started + self.window - now)
+
+    def reset(self, key):
+        """
+        Forget the attempts of a key.
+
+        :param key: The client or account key.
+        """
+        self._counters.delete(key)
+
+
+# ---- Setup ----
+def init_auth(app):
+    """
+    Create the auth caches and rate limiters of an application.
+
+    :param app: The Flask application.
+    :type app: flask.Flask
+    """
+    size = app.config['AUTH_CACHE_MAX_SIZE']
+    app.extensions['film_library_auth'] = {
+        'claims': TTLCache(size),
+        'users': TTLCache(size),
+        'credentials': TTLCache(size),
+        'client_limiter': RateLimiter(app.config['LOGIN_RATE_LIMIT'], app.config['LOGIN_RATE_WINDOW'], size),
+        'account_limiter': RateLimiter(app.config['LOGIN_FAILURE_LIMIT'], app.config['LOGIN_RATE_WINDOW'], size),
+    }
+
+
+def _state():
+    return current_app.extensions['film_library_auth']
+
+
+# ---- Passwords ----
+def hash_password(password):
+    """
+    Hash a password with the configured method and cost.
+
+    :param password: The plaintext password.
+    :type password: str
+    :return: The password hash.
+    :rtype: str
+    """
+    return generate_password_hash(password, method=current_app.config['PASSWORD_HASH_METHOD'])
+
+
+@lru_cache(maxsize=None)
+def _hash_prefix(method):
+    # Werkzeug fills in default parameters, e.g. 'pbkdf2:sha256' -> 'pbkdf2:sha256:1000000'
+    return generate_password_hash('', method=method).split('$', 1)[0]
+
+
+def needs_rehash(password_hash):
+    """
+    Tell whether a hash was made with another method or cost than configured.
+
+    :param password_hash: The stored password hash.
+    :type password_hash: str
+    :return: True if the hash should be replaced on the next login.
+    :rtype: bool
+    """
+    return password_hash.split('$', 1)[0] != _hash_prefix(current_app.config['PASSWORD_HASH_METHOD'])
+
+
+# ---- User Lookups ----
+def get_credentials(username):
+    """
+    Return the credentials of a user, cached for a short time.
+
+    Unknown usernames are not cached, so new users can log in at once.
+
+    :param username: The username.
+    :type username: str
+    :return: The credentials, or None if the user does not exist.
+    :rtype: Credentials
+    """
+    cache = _state()['credentials']
+    credentials = cache.get(username)
+    if credentials is None:
+        row = db.session.query(User.id, User.username, User.password_hash).filter_by(username=username).first()
+        if row is None:
+            return None
+        credentials = Credentials(*row)
+        cache.set(username, credentials, current_app.config['AUTH_CACHE_TTL'])
+    return credentials
+
+
+def rehash_password(credentials, password):
+    """
+    Store a new hash of a password made with the configured method and cost.
+
+    :param credentials: The credentials of the user.
+    :type credentials: Credentials
+    :param password: The plaintext password, already verified.
+    :type password: str
+    """
+    password_hash = hash_password(password)
+    User.query.filter_by(id=credentials.id).update({'password_hash': password_hash})
+    db.session.commit()
+    _state()['credentials'].set(
+        credentials.username,
+        credentials._replace(password_hash=password_hash),
+        current_app.config['AUTH_CACHE_TTL'],
+    )
+
+
+def get_user(identity):
+    """
+    Resolve a token identity to a user, cached for a short time.
+
+    :param identity: The 'sub' claim of a token.
+    :type identity: str
+    :return: The user, or None if it does not exist.
+    :rtype: CachedUser
+    """
+    cache = _state()['users']
+    user = cache.get(identity)
+    if user is None:
+        try:
+            user_id = int(identity)
+        except (TypeError, ValueError):
+            return None
+        row = db.session.query(User.id, User.username).filter_by(id=user_id).first()
+        if row is None:
+            return None
+        user = CachedUser(*row)
+        cache.set(identity, user, current_app.config['AUTH_CACHE_TTL'])
+    return user
+
+
+# ---- Login Rate Limiting ----
+def login_retry_after(username):
+    """
+    Tell whether the current client, or the current client on this account,
+    is out of login attempts.
+
+    Checked before any password is hashed. Failures are counted per username
+    and client address, so nobody can lock an account by failing to log in
+    to it from elsewhere.
+
+    :param username: The username being logged in to.
+    :type username: str
+    :return: Seconds until the next attempt is allowed, or 0 if allowed now.
+    :rtype: int
+    """
+    state = _state()
+    return max(
+        state['client_limiter'].retry_after(request.remote_addr),
+        state['account_limiter'].retry_after((username, request.remote_addr)),
+    )
+
+
+def record_login_attempt(username, success):
+    """
+    Count a login attempt against the client and, if it failed, the account
+    as seen from this client.
+
+    :param username: The username being logged in to.
+    :type username: str
+    :param success: Whether the password was correct.
+    :type success: bool
+    """
+    state = _state()
+    state['client_limiter'].hit(request.remote_addr)
+    if success:
+        state['account_limiter'].reset((username, request.remote_addr))
+    else:
+        state['account_limiter'].hit((username, request.remote_addr))
+
+
+# ---- Token Verification ----
+def _decode(token):
+    """
+    Decode and verify an access token, caching its claims until the cache
+    TTL or the token expiry, whichever comes first.
+    """
+    cache = _state()['claims']
+    claims = cache.get(token)
+    if claims is None:
+        claims = decode_token(token)
+        ttl = current_app.config['AUTH_CACHE_TTL']
+        if 'exp' in claims:
+            ttl = min(ttl, claims['exp'] - time.time())
+        cache.set(token, claims, ttl)
+    return claims
+
+
+def auth_required():
+    """
+    Protect a view with a bearer access token.
+
+    Works like `flask_jwt_extended.jwt_required`, but reuses decoded claims
+    and resolved users from short-lived in-process caches. The claims are
+    available as `g.jwt_claims` and the user as `g.current_user`.
+
+    :return: The view decorator.
+    """
+    def decorator(fn):
+        @wraps(fn)
+        def wrapper(*args, **kwargs):
+            header = request.headers.get('Authorization', '')
+            scheme, _, token = header.partition(' ')
+            if scheme != 'Bearer' or not token:
+                return jsonify({"msg": "Missing Authorization Header"}), 401
+            try:
+                claims = _decode(token)
+            except (JWTExtendedException, PyJWTError) as e:
+                return jsonify({"msg": str(e)}), 401
+            if claims.get('type') != 'access':
+                return jsonify({"msg": "Only access tokens are allowed"}), 401
+
+            user = get_user(claims.get('sub'))
+            if user is None:
+                return jsonify({"msg": "user not found"}), 401
+
+            g.jwt_claims = claims
+            g.current_user = user
+            return fn(*args, **kwargs)
+        return wrapper
+    return decorator
@@ -14,6 +14,7 @@ import os
 import certifi
 from dotenv import load_dotenv
 from pathlib import Path
+from django.core.exceptions import ImproperlyConfigured
 from django.utils.translation import gettext_lazy as _
 
 # Build paths inside the project like this: BASE_DIR / 'subdir'.
@@ -99,6 +100,9 @@ if USE_POSTGRES:
             'PASSWORD': os.getenv("POSTGRES_PASSWORD"),
             'HOST': os.getenv("POSTGRES_HOST"),
             'PORT': os.getenv("POSTGRES_PORT"),
+            # Keep connections open between requests and bot handler calls
+            'CONN_MAX_AGE': int(os.getenv("POSTGRES_CONN_MAX_AGE", "60")),
+            'CONN_HEALTH_CHECKS': True,
         }
     }
 else:
@@ -188,6 +192,25 @@ if not DEBUG:
 CRISPY_ALLOWED_TEMPLATE_PACKS = ("bootstrap5",)
 CRISPY_TEMPLATE_PACK = "bootstrap5"
 
+# Shared Redis cache when configured, per-process memory cache otherwise.
+# Cache invalidation (e.g. the pet list) only reaches the process it runs in,
+# so more than one web worker (WEB_CONCURRENCY) requires CACHE_REDIS_URL.
+if os.getenv("CACHE_REDIS_URL"):
+    CACHES = {
+        'default': {
+            'BACKEND': 'django.core.cache.backends.redis.RedisCache',
+            'LOCATION': os.getenv("CACHE_REDIS_URL"),
+        }
+    }
+else:
+    CACHES = {
+        'default': {
+            'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+        }
+    }
+    if int(os.getenv("WEB_CONCURRENCY", "1")) > 1:
+        raise ImproperlyConfigured("CACHE_REDIS_URL must be set when running more than one web worker.")
+
 CELERY_BROKER_URL = 'redis://localhost:6379/0'
 CELERY_RESULT_BACKEND = 'redis://localhost:6379/0'
 
@@ -0,0 +1,110 @@
+import fcntl
+import hashlib
+import os
+import tempfile
+import threading
+from contextlib import contextmanager
+
+from django.conf import settings
+
+from pets.thumbnails import delete_thumbnails
+
+
+_held_locks = threading.local()
+
+
+@contextmanager
+def blob_lock(name):
+    """
+    Hold an exclusive, cross-process lock on the shard directory of a stored
+    name. Reusing a blob and dropping it both happen under this lock, so a
+    blob cannot be deleted between being reused and being referenced.
+    Reentrant within a thread; take one lock at a time to avoid deadlocks.
+    """
+    lock_dir = os.path.dirname(os.path.join(settings.MEDIA_ROOT, name))
+    lock_path = os.path.join(lock_dir, '.lock')
+    held = getattr(_held_locks, 'paths', None)
+    if held is None:
+        held = _held_locks.paths = set()
+    if lock_path in held:
+        yield
+        return
+
+    os.makedirs(lock_dir, exist_ok=True)
+    with open(lock_path, 'a') as lock_file:
+        fcntl.flock(lock_file, fcntl.LOCK_EX)
+        held.add(lock_path)
+        try:
+            yield
+        finally:
+            held.discard(lock_path)
+            fcntl.flock(lock_file, fcntl.LOCK_UN)
+
+
+@contextmanager
+def store_upload(uploaded_file, directory):
+    """
+    Write an upload into content-addressed storage, hashing it chunk by chunk
+    while it is written. Yields (storage name, SHA-256 hex digest); when the
+    same content is already stored the existing file is reused.
+
+    The blob stays locked for the duration of the block: save the row that
+    references it inside, so release_files cannot drop it in between.
+    """
+    upload_dir = os.path.join(settings.MEDIA_ROOT, directory)
+    os.makedirs(upload_dir, exist_ok=True)
+
+    digest = hashlib.sha256()
+    fd, tmp_path = tempfile.mkstemp(dir=upload_dir, suffix='.part')
+    try:
+        with os.fdopen(fd, 'wb') as tmp:
+            for chunk in uploaded_file.chunks():
+                digest.update(chunk)
+                tmp.write(chunk)
+
+        content_hash = digest.hexdigest()
+        ext = os.path.splitext(uploaded_file.name)[1].lower()
+        name = os.path.join(directory, content_hash[:2], content_hash + ext)
+        final_path = os.path.join(settings.MEDIA_ROOT, name)
+
+        with blob_lock(name):
+            if os.path.exists(final_path):
+                os.remove(tmp_path)
+            else:
+                os.chmod(tmp_path, settings.FILE_UPLOAD_PERMISSIONS or 0o644)
+                os.replace(tmp_path, final_path)
+            yield name, content_hash
+    finally:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+
+
+def release_files(model, field_name, names):
+    """
+    Drop stored files that no live row of `model` references any more.
+
+    Blobs are shared between rows with identical content, so the number of
+    rows with deleted_at IS NULL pointing at a name is its reference count.
+    Thumbnails of a model that has them go with the last row of their content.
+    Call after the releasing rows were soft-deleted or repointed.
+    """
+    names = {n for n in names if n}
+    if not names:
+        return
+
+    live = model.objects.filter(deleted_at__isnull=True)
+    still_used = set(
+        live.filter(**{f'{field_name}__in': names}).values_list(field_name, flat=True)
+    )
+    storage = model._meta.get_field(field_name).storage
+    for name in names - still_used:
+        with blob_lock(name):
+            # An upload of the same content may have reused the blob meanwhile
+            if live.filter(**{field_name: name}).exists():
+                continue
+            storage.delete(name)
+            if hasattr(model, 'thumbnails_ready'):
+                # Stored names are "<sha256><ext>", derivatives are keyed by the digest
+                content_hash = os.path.splitext(os.path.basename(name))[0]
+                if not live.filter(content_hash=content_hash).exists():
+                    delete_thumbnails(content_hash)
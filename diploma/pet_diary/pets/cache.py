@@ -0,0 +1,37 @@
+import time
+
+from django.core.cache import cache
+
+
+PET_LIST_CACHE_TIMEOUT = 60 * 15
+
+
+def _pet_list_version_key(user_id):
+    return f"pet_list:version:{user_id}"
+
+
+def get_pet_list_version(user_id):
+    version = cache.get(_pet_list_version_key(user_id))
+    if version is None:
+        # Start from the clock so an evicted version never reuses old page keys
+        cache.add(_pet_list_version_key(user_id), time.time_ns(), None)
+        version = cache.get(_pet_list_version_key(user_id))
+    return version
+
+
+def pet_list_cache_key(user_id, view_mode, per_page, page_number):
+    """
+    Key for one page of a user's pet list. It embeds the user's list version,
+    so bumping the version drops every cached page of that user at once.
+    """
+    version = get_pet_list_version(user_id)
+    return f"pet_list:{user_id}:v{version}:{view_mode}:{per_page}:{page_number}"
+
+
+def invalidate_pet_list(*user_ids):
+    for user_id in {u for u in user_ids if u}:
+        try:
+            cache.incr(_pet_list_version_key(user_id))
+        except ValueError:
+            # No version stored yet, nothing has been cached for this user
+            pass
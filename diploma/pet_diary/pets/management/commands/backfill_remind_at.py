@@ -0,0 +1,31 @@
+from django.core.management.base import BaseCommand
+
+from pets.models import Task
+
+
+BATCH_SIZE = 1000
+
+
+class Command(BaseCommand):
+    help = "Fill Task.remind_at for tasks saved before the column existed"
+
+    def handle(self, *args, **options):
+        tasks_qs = Task.objects.filter(
+            remind_me=True,
+            remind_at__isnull=True,
+            due_datetime__isnull=False,
+        ).order_by('id')
+
+        updated = 0
+        last_id = 0
+        while True:
+            batch = list(tasks_qs.filter(id__gt=last_id)[:BATCH_SIZE])
+            if not batch:
+                break
+            for t in batch:
+                t.remind_at = t.get_remind_at()
+            Task.objects.bulk_update(batch, ['remind_at'])
+            updated += len(batch)
+            last_id = batch[-1].id
+
+        self.stdout.write(f"Updated remind_at for {updated} tasks.")
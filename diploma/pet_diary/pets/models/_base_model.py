@@ -4,6 +4,21 @@ from django.utils import timezone
 from django.utils.translation import gettext_lazy as _
 
 
+class BaseQuerySet(models.QuerySet):
+    """
+    Set-based counterparts of the BaseModel mark_as_* helpers. Each call is
+    a single UPDATE and, like QuerySet.update(), sends no model signals.
+    """
+
+    def mark_as_edited(self, user):
+        now = timezone.now()
+        return self.update(edited_at=now, edited_by=user, updated_at=now)
+
+    def mark_as_deleted(self, user, **fields):
+        now = timezone.now()
+        return self.update(deleted_at=now, deleted_by=user, updated_at=now, **fields)
+
+
 class BaseModel(models.Model):
     created_at = models.DateTimeField(
         auto_now_add=True,
@@ -42,6 +57,8 @@ class BaseModel(models.Model):
         verbose_name=_("Deleted by")
     )
 
+    objects = BaseQuerySet.as_manager()
+
     class Meta:
         abstract = True
 
@@ -47,6 +47,13 @@ class PetDocument(BaseModel):
         blank=True,
         verbose_name=_("Description")
     )
+    content_hash = models.CharField(
+        max_length=64,
+        blank=True,
+        editable=False,
+        db_index=True,
+        verbose_name=_("Content SHA-256")
+    )
 
     def __str__(self):
         return f"{self.get_doc_type_display()} ({self.pet.name})"
@@ -55,3 +62,7 @@ class PetDocument(BaseModel):
         verbose_name = _("Pet Document")
         verbose_name_plural = _("Pet Documents")
         ordering = ['-doc_date', '-created_at']
+        indexes = [
+            # Reference lookups for shared files (pets.blobs.release_files)
+            models.Index(fields=['doc_file'], name='petdocument_file_idx'),
+        ]
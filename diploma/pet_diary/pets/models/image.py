@@ -34,6 +34,18 @@ class PetImage(BaseModel):
         blank=True,
         verbose_name=_("Notes")
     )
+    content_hash = models.CharField(
+        max_length=64,
+        blank=True,
+        editable=False,
+        db_index=True,
+        verbose_name=_("Content SHA-256")
+    )
+    thumbnails_ready = models.BooleanField(
+        default=False,
+        editable=False,
+        verbose_name=_("Thumbnails ready")
+    )
 
     def __str__(self):
         return f"{self.pet.name} (id={self.id})"
@@ -41,3 +53,7 @@ class PetImage(BaseModel):
     class Meta:
         verbose_name = _("Pet Image")
         verbose_name_plural = _("Pet Images")
+        indexes = [
+            # Reference lookups for shared files (pets.blobs.release_files)
+            models.Index(fields=['path'], name='petimage_path_idx'),
+        ]
@@ -46,3 +46,16 @@ class Pet(BaseModel):
     class Meta:
         verbose_name = _("Pet")
         verbose_name_plural = _("Pets")
+        indexes = [
+            # pet_list: (owner = u OR caregiver = u) AND deleted_at IS NULL ORDER BY name
+            models.Index(
+                fields=['owner', 'name'],
+                name='pet_owner_active_idx',
+                condition=models.Q(deleted_at__isnull=True),
+            ),
+            models.Index(
+                fields=['caregiver', 'name'],
+                name='pet_caregiver_active_idx',
+                condition=models.Q(deleted_at__isnull=True),
+            ),
+        ]
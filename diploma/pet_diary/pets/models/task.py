@@ -1,12 +1,38 @@
+from datetime import timedelta
+
 from django.conf import settings
 from django.db import models
 from django.utils import timezone
 from django.utils.translation import gettext_lazy as _
 
-from pets.models._base_model import BaseModel
+from pets.models._base_model import BaseModel, BaseQuerySet
 from pets.models.pet import Pet
 
 
+class TaskQuerySet(BaseQuerySet):
+    def mark_as_done(self, user):
+        now = timezone.now()
+        return self.update(
+            status=Task.TaskStatus.DONE,
+            completed_at=now,
+            completed_by=user,
+            edited_at=now,
+            edited_by=user,
+            updated_at=now,
+        )
+
+    def mark_as_skipped(self, user):
+        now = timezone.now()
+        return self.update(
+            status=Task.TaskStatus.SKIPPED,
+            skipped_at=now,
+            skipped_by=user,
+            edited_at=now,
+            edited_by=user,
+            updated_at=now,
+        )
+
+
 class Task(BaseModel):
 
     class TaskStatus(models.TextChoices):
@@ -25,6 +51,17 @@ class Task(BaseModel):
         ('1_week', _("1 week")),
     ]
 
+    REMIND_BEFORE_OFFSETS = {
+        '15_min': timedelta(minutes=15),
+        '1_hour': timedelta(hours=1),
+        '4_hours': timedelta(hours=4),
+        '12_hours': timedelta(hours=12),
+        '1_day': timedelta(days=1),
+        '3_days': timedelta(days=3),
+        '1_week': timedelta(weeks=1),
+    }
+    MAX_REMIND_OFFSET = max(REMIND_BEFORE_OFFSETS.values())
+
     pet = models.ForeignKey(
         Pet,
         on_delete=models.CASCADE,
@@ -51,6 +88,12 @@ class Task(BaseModel):
         blank=True,
         verbose_name=_("Remind Before")
     )
+    # Precomputed due_datetime - remind_before, kept in sync by save()
+    remind_at = models.DateTimeField(
+        null=True, blank=True,
+        editable=False,
+        verbose_name=_("Remind at")
+    )
     status = models.CharField(
         max_length=10,
         choices=TaskStatus.choices,
@@ -96,12 +139,27 @@ class Task(BaseModel):
         verbose_name=_("Completed By")
     )
 
+    objects = TaskQuerySet.as_manager()
+
     # def mark_as_edited(self, user):
     #     super().mark_as_edited(user)
 
     # def mark_as_deleted(self, user):
     #     super().mark_as_deleted(user)
 
+    def get_remind_at(self):
+        if not (self.remind_me and self.due_datetime):
+            return None
+        offset = self.REMIND_BEFORE_OFFSETS.get(self.remind_before, timedelta(0))
+        return self.due_datetime - offset
+
+    def save(self, *args, **kwargs):
+        self.remind_at = self.get_remind_at()
+        update_fields = kwargs.get('update_fields')
+        if update_fields is not None and {'due_datetime', 'remind_me', 'remind_before'} & set(update_fields):
+            kwargs['update_fields'] = {*update_fields, 'remind_at'}
+        super().save(*args, **kwargs)
+
     def mark_as_skipped(self, user):
         self.status = self.TaskStatus.SKIPPED
         self.skipped_at = timezone.now()
@@ -128,3 +186,16 @@ class Task(BaseModel):
     class Meta:
         verbose_name = _("Task")
         verbose_name_plural = _("Tasks")
+        indexes = [
+            # Only rows still waiting for a reminder stay in the index,
+            # so the beat scan does not grow with the task history.
+            models.Index(
+                fields=['remind_at', 'id'],
+                name='task_pending_reminder_idx',
+                condition=models.Q(
+                    remind_me=True,
+                    reminder_sent=False,
+                    deleted_at__isnull=True,
+                ),
+            ),
+        ]
@@ -1,12 +1,49 @@
-from django.core.mail import send_mail
+import logging
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import NamedTuple
+
+from django.core.mail import EmailMessage, get_connection, send_mail
 from django.conf import settings
 from django.utils.translation import gettext as _
+from telegram import Bot, InlineKeyboardMarkup
 
 from pets.models import Task
 from pets.utils import send_telegram_message
 from accounts.models import CommunicationMethod
 
 
+logger = logging.getLogger(__name__)
+
+TELEGRAM_MAX_WORKERS = 8
+# Telegram allows about 30 messages per second per bot
+TELEGRAM_MESSAGES_PER_SECOND = 25
+
+
+class ReminderMessage(NamedTuple):
+    user: object
+    task: Task
+    subject: str
+    text: str
+    markup: InlineKeyboardMarkup
+
+
+class _RateLimiter:
+    def __init__(self, per_second):
+        self._interval = 1.0 / per_second
+        self._lock = threading.Lock()
+        self._next_slot = 0.0
+
+    def wait(self):
+        with self._lock:
+            now = time.monotonic()
+            slot = max(now, self._next_slot)
+            self._next_slot = slot + self._interval
+        if slot > now:
+            time.sleep(slot - now)
+
+
 def _notify_owner_about_result(task, new_status):
     owner = task.pet.owner
     caregiver = task.pet.caregiver
@@ -36,3 +73,120 @@ def _notify_owner_about_result(task, new_status):
             from_email=settings.DEFAULT_FROM_EMAIL,
             recipient_list=[owner.email],
         )
+
+
+def _notify_owner_about_results(pet, tasks, new_status):
+    owner = pet.owner
+    caregiver = pet.caregiver
+    if not caregiver or not tasks:
+        return
+
+    if len(tasks) == 1:
+        _notify_owner_about_result(tasks[0], new_status)
+        return
+
+    if new_status == Task.TaskStatus.DONE:
+        status_text = _("done")
+    else:
+        status_text = _("skipped")
+
+    message_text = _(
+        "{pet_name}'s caretaker {caretaker} has marked {count} tasks as {status}: {task_titles}."
+    ).format(
+        pet_name=pet.name,
+        caretaker=caregiver.first_name or caregiver.email,
+        count=len(tasks),
+        status=status_text,
+        task_titles=", ".join(f"'{t.title}'" for t in tasks),
+    )
+    if owner.communication_method == CommunicationMethod.TELEGRAM and owner.telegram_id:
+        send_telegram_message(owner, message_text)
+    else:
+        send_mail(
+            subject=_("Your caretaker updated tasks"),
+            message=message_text,
+            from_email=settings.DEFAULT_FROM_EMAIL,
+            recipient_list=[owner.email],
+        )
+
+
+def dispatch_reminders(messages, bot: Bot):
+    """
+    Send reminders grouped by channel and return the ones that went out.
+
+    Telegram messages are sent from a bounded, rate-limited thread pool;
+    emails share one SMTP connection on a separate worker. Sent tasks are
+    marked as reminded, saving them is left to the caller.
+    """
+    telegram_messages = []
+    email_messages = []
+    for m in messages:
+        if m.user.communication_method == CommunicationMethod.TELEGRAM and m.user.telegram_id:
+            telegram_messages.append(m)
+        else:
+            email_messages.append(m)
+
+    limiter = _RateLimiter(TELEGRAM_MESSAGES_PER_SECOND)
+    with ThreadPoolExecutor(max_workers=TELEGRAM_MAX_WORKERS + 1) as pool:
+        email_future = pool.submit(_send_reminder_emails, email_messages)
+        telegram_results = list(pool.map(
+            lambda m: _send_reminder_telegram(bot, limiter, m),
+            telegram_messages,
+        ))
+        email_sent = email_future.result()
+
+    sent = []
+    for m, ok in zip(telegram_messages, telegram_results):
+        if ok:
+            m.task.mark_as_reminded_via_telegram()
+            sent.append(m)
+    for m in email_sent:
+        m.task.mark_as_reminded_via_email()
+        sent.append(m)
+    return sent
+
+
+def _send_reminder_telegram(bot, limiter, message):
+    limiter.wait()
+    try:
+        bot.send_message(
+            chat_id=message.user.telegram_id,
+            text=message.text,
+            reply_markup=message.markup
+        )
+    except Exception:
+        logger.exception("Telegram reminder for task %s failed", message.task.id)
+        return False
+    return True
+
+
+def _send_reminder_emails(messages):
+    sent = []
+    if not messages:
+        return sent
+
+    try:
+        connection = get_connection()
+        connection.open()
+    except Exception:
+        # Must not keep the Telegram reminders of the batch from being marked
+        logger.exception("Could not connect to the mail server, %d email reminders postponed", len(messages))
+        return sent
+
+    try:
+        for m in messages:
+            email = EmailMessage(
+                subject=m.subject,
+                body=m.text,
+                from_email=settings.DEFAULT_FROM_EMAIL,
+                to=[m.user.email],
+                connection=connection,
+            )
+            try:
+                if connection.send_messages([email]):
+                    sent.append(m)
+            except Exception:
+                logger.exception("Email reminder for task %s failed", m.task.id)
+    finally:
+        connection.close()
+    return sent
@@ -0,0 +1,48 @@
+from datetime import timedelta
+
+from pets.models import Task
+
+
+RECURRENCE_BATCH_SIZE = 500
+
+
+def build_occurrences(task):
+    """
+    Build the unsaved follow-up tasks of a recurring task, one per day
+    after the original, up to `recurring_days` in total.
+    """
+    if not (task.recurring and task.recurring_days > 0 and task.due_datetime):
+        return []
+
+    occurrences = []
+    for i in range(1, task.recurring_days):
+        occurrence = Task(
+            pet=task.pet,
+            title=task.title,
+            due_datetime=task.due_datetime + timedelta(days=i),
+            remind_me=task.remind_me,
+            remind_before=task.remind_before,
+            status=task.status,
+            # Preventing infinite loop
+            recurring=False,
+            recurring_days=0,
+            created_by=task.created_by,
+        )
+        # bulk_create() bypasses Task.save()
+        occurrence.remind_at = occurrence.get_remind_at()
+        occurrences.append(occurrence)
+    return occurrences
+
+
+def expand_recurring_task(task):
+    """
+    Insert all occurrences of a recurring task with batched INSERTs.
+
+    Task post_save handlers ignore newly created rows, so skipping them
+    here does not change notification behaviour. Call inside the
+    transaction that saves the original task.
+    """
+    return Task.objects.bulk_create(
+        build_occurrences(task),
+        batch_size=RECURRENCE_BATCH_SIZE,
+    )
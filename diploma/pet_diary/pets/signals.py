@@ -1,10 +1,63 @@
+from django.contrib.auth import get_user_model
 from django.core.exceptions import ObjectDoesNotExist
-from django.db.models.signals import post_save
-from django.dispatch import receiver
+from django.db.models import Q
+from django.db.models.signals import post_delete, post_save, pre_save
+from django.dispatch import Signal, receiver
 from django.utils.translation import gettext_lazy as _
 
-from pets.models import Vaccination, Task
-from pets.notifications import _notify_owner_about_result
+from pets.cache import invalidate_pet_list
+from pets.models import Pet, Vaccination, Task
+from pets.notifications import _notify_owner_about_result, _notify_owner_about_results
+
+
+# Sent once per set-based status change, with `tasks`, `status` and `user`
+tasks_status_changed = Signal()
+
+
+@receiver(pre_save, sender=Pet)
+def remember_previous_pet_users(sender, instance, **kwargs):
+    instance._previous_user_ids = ()
+    if instance.pk:
+        instance._previous_user_ids = tuple(
+            Pet.objects.filter(pk=instance.pk).values_list('owner_id', 'caregiver_id').first() or ()
+        )
+
+
+@receiver(post_save, sender=Pet)
+@receiver(post_delete, sender=Pet)
+def invalidate_pet_list_cache(sender, instance, **kwargs):
+    invalidate_pet_list(
+        instance.owner_id,
+        instance.caregiver_id,
+        *getattr(instance, '_previous_user_ids', ()),
+    )
+
+
+@receiver(pre_save, sender=get_user_model())
+def remember_previous_user_name(sender, instance, update_fields=None, **kwargs):
+    instance._previous_name = None
+    if update_fields is not None and not {'first_name', 'last_name'} & set(update_fields):
+        # e.g. the last_login update on every login
+        return
+    if instance.pk:
+        instance._previous_name = sender.objects.filter(pk=instance.pk).values_list(
+            'first_name', 'last_name',
+        ).first()
+
+
+@receiver(post_save, sender=get_user_model())
+def invalidate_pet_list_cache_on_rename(sender, instance, created, **kwargs):
+    # Cached pet list pages show the names of owners and caregivers
+    previous_name = getattr(instance, '_previous_name', None)
+    if created or previous_name is None or previous_name == (instance.first_name, instance.last_name):
+        return
+
+    user_ids = {instance.pk}
+    for owner_id, caregiver_id in Pet.objects.filter(
+        Q(owner=instance) | Q(caregiver=instance),
+    ).values_list('owner_id', 'caregiver_id'):
+        user_ids.update((owner_id, caregiver_id))
+    invalidate_pet_list(*user_ids)
 
 
 @receiver(post_save, sender=Vaccination)
@@ -74,3 +127,15 @@ def notify_task_owner_if_caretaker_completed(sender, instance, created, **kwargs
         _notify_owner_about_result(instance, Task.TaskStatus.DONE)
     elif instance.status == Task.TaskStatus.SKIPPED and instance.skipped_by == caretaker:
         _notify_owner_about_result(instance, Task.TaskStatus.SKIPPED)
+
+
+@receiver(tasks_status_changed, sender=Task)
+def notify_task_owner_if_caretaker_completed_bulk(sender, tasks, status, user, **kwargs):
+    tasks_by_pet = {}
+    for t in tasks:
+        tasks_by_pet.setdefault(t.pet_id, []).append(t)
+
+    for pet_tasks in tasks_by_pet.values():
+        pet = pet_tasks[0].pet
+        if pet.caregiver and pet.caregiver == user:
+            _notify_owner_about_results(pet, pet_tasks, status)
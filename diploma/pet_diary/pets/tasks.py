@@ -1,15 +1,15 @@
 import os
 import pytz
-from datetime import timedelta
 from celery import shared_task
 from django.utils import timezone, translation
-from django.conf import settings
-from django.core.mail import send_mail
+from django.db.models import Q
 from django.utils.translation import gettext as _
 from telegram import Bot, InlineKeyboardButton, InlineKeyboardMarkup
+from telegram.utils.request import Request
 
-from pets.models import Task
-from accounts.models import CustomUser, CommunicationMethod
+from pets.models import PetImage, Task
+from pets.notifications import ReminderMessage, TELEGRAM_MAX_WORKERS, dispatch_reminders
+from pets.thumbnails import generate_thumbnails
 
 
 _bot = None
@@ -18,6 +18,8 @@ CD_NOTIFY_DONE = "NOTIFY_DONE"
 CD_NOTIFY_SKIP = "NOTIFY_SKIP"
 SEPARATOR = "|"
 
+REMINDER_BATCH_SIZE = 500
+
 
 def _activate_language(user):
     if user and user.preferred_language:
@@ -30,50 +32,77 @@ def get_bot() -> Bot:
     global _bot
     if _bot is None:
         token = os.getenv("TELEGRAM_BOT_TOKEN", "")
-        _bot = Bot(token=token)
+        # One pooled connection per dispatcher worker
+        _bot = Bot(token=token, request=Request(con_pool_size=TELEGRAM_MAX_WORKERS))
     return _bot
 
 
 @shared_task
 def check_tasks_for_reminders():
     now_utc = timezone.now()
+    for batch in _iter_due_reminders(now_utc):
+        messages = []
+        for t in batch:
+            user = t.pet.caregiver if t.pet.caregiver else t.pet.owner
+            if user:
+                messages.append(_build_task_reminder(user, t))
+
+        sent = dispatch_reminders(messages, get_bot())
+        Task.objects.bulk_update(
+            [m.task for m in sent],
+            ['reminder_sent', 'reminder_sent_at', 'reminder_sent_with'],
+        )
+
+
+@shared_task
+def generate_pet_image_thumbnails(image_id):
+    try:
+        pet_image = PetImage.objects.get(id=image_id, deleted_at__isnull=True)
+    except PetImage.DoesNotExist:
+        return
+    content_hash = generate_thumbnails(pet_image)
+    PetImage.objects.filter(id=image_id).update(
+        content_hash=content_hash,
+        thumbnails_ready=True,
+    )
+
+
+def _iter_due_reminders(now_utc):
+    """
+    Yield batches of tasks whose reminder window is open, walking the
+    pending-reminder index by keyset on (remind_at, id).
+
+    A window never stays open longer than Task.MAX_REMIND_OFFSET, which
+    bounds the scan from below; reminded rows leave the partial index.
+    """
     tasks_qs = Task.objects.filter(
         remind_me=True,
         status__in=[Task.TaskStatus.PLANNED, Task.TaskStatus.OVERDUE],
         reminder_sent=False,
-        due_datetime__isnull=False,
-        deleted_at__isnull=True
-    )
-    for t in tasks_qs:
-        offset = _parse_remind_before(t.remind_before)
-        remind_moment_utc = t.due_datetime - offset
-
-        if remind_moment_utc <= now_utc < t.due_datetime:
-            user = t.pet.caregiver if t.pet.caregiver else t.pet.owner
-            if user:
-                _send_task_reminder(user, t)
-            t.save()
-
-
-def _parse_remind_before(rb: str) -> timedelta:
-    if rb == '15_min':
-        return timedelta(minutes=15)
-    elif rb == '1_hour':
-        return timedelta(hours=1)
-    elif rb == '4_hours':
-        return timedelta(hours=4)
-    elif rb == '12_hours':
-        return timedelta(hours=12)
-    elif rb == '1_day':
-        return timedelta(days=1)
-    elif rb == '3_days':
-        return timedelta(days=3)
-    elif rb == '1_week':
-        return timedelta(weeks=1)
-    return timedelta(0)
-
-
-def _send_task_reminder(user, task):
+        deleted_at__isnull=True,
+        remind_at__gt=now_utc - Task.MAX_REMIND_OFFSET,
+        remind_at__lte=now_utc,
+        due_datetime__gt=now_utc,
+    ).select_related('pet__caregiver', 'pet__owner').order_by('remind_at', 'id')
+
+    last = None
+    while True:
+        page_qs = tasks_qs
+        if last is not None:
+            page_qs = page_qs.filter(
+                Q(remind_at__gt=last.remind_at)
+                | Q(remind_at=last.remind_at, id__gt=last.id)
+            )
+        batch = list(page_qs[:REMINDER_BATCH_SIZE])
+        if not batch:
+            return
+        yield batch
+        if len(batch) < REMINDER_BATCH_SIZE:
+            return
+        last = batch[-1]
+
+
+def _build_task_reminder(user, task):
     _activate_language(user)
     due_str = _format_datetime_for_user(task.due_datetime, user)
     msg_text = _(
@@ -94,22 +123,13 @@ def _send_task_reminder(user, task):
     ]
     markup = InlineKeyboardMarkup(keyboard)
 
-    if user.communication_method == CommunicationMethod.TELEGRAM and user.telegram_id:
-        bot = get_bot()
-        bot.send_message(
-            chat_id=user.telegram_id,
-            text=msg_text,
-            reply_markup=markup
-        )
-        task.mark_as_reminded_via_telegram()
-    else:
-        send_mail(
-            subject=_("Task Reminder"),
-            message=msg_text,
-            from_email=settings.DEFAULT_FROM_EMAIL,
-            recipient_list=[user.email],
-        )
-        task.mark_as_reminded_via_email()
+    return ReminderMessage(
+        user=user,
+        task=task,
+        subject=_("Task Reminder"),
+        text=msg_text,
+        markup=markup,
+    )
 
 
 def _format_datetime_for_user(dt, user):
@@ -1,3 +1,42 @@
+from datetime import timedelta
+from unittest import mock
+
+from django.contrib.auth import get_user_model
 from django.test import TestCase
+from django.utils import timezone
+
+from accounts.models import CommunicationMethod
+from pets.models import Pet, Task
+from pets.tasks import check_tasks_for_reminders
+
+
+class ReminderDispatchTests(TestCase):
+    def setUp(self):
+        User = get_user_model()
+        telegram_user = User.objects.create_user(
+            email="telegram@example.com", password="password",
+            communication_method=CommunicationMethod.TELEGRAM, telegram_id=123,
+        )
+        email_user = User.objects.create_user(
+            email="email@example.com", password="password",
+            communication_method=CommunicationMethod.EMAIL,
+        )
+        due = timezone.now() + timedelta(minutes=30)
+        self.tasks = {}
+        for user in (telegram_user, email_user):
+            pet = Pet.objects.create(owner=user, created_by=user, name="Rex", species="dog")
+            self.tasks[user.communication_method] = Task.objects.create(
+                pet=pet, created_by=user, title="Walk", due_datetime=due,
+                remind_me=True, remind_before='1_hour',
+            )
+
+    def test_telegram_reminders_are_marked_when_the_mail_server_is_down(self):
+        with mock.patch('pets.tasks.get_bot'), \
+                mock.patch('pets.notifications.get_connection', side_effect=OSError("connection refused")):
+            check_tasks_for_reminders()
 
-# Create your tests here.
+        telegram_task = Task.objects.get(pk=self.tasks[CommunicationMethod.TELEGRAM].pk)
+        email_task = Task.objects.get(pk=self.tasks[CommunicationMethod.EMAIL].pk)
+        self.assertTrue(telegram_task.reminder_sent)
+        self.assertEqual(telegram_task.reminder_sent_with, 'telegram')
+        self.assertFalse(email_task.reminder_sent)
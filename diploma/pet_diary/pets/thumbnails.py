@@ -0,0 +1,74 @@
+import os
+from io import BytesIO
+
+from django.conf import settings
+from django.core.files.base import ContentFile
+from django.core.files.storage import default_storage
+from PIL import Image, ImageOps
+
+from pets.utils import file_sha256
+
+
+# size name -> longest side in pixels
+THUMBNAIL_SIZES = {
+    'small': 200,
+    'medium': 600,
+    'large': 1200,
+}
+# format -> (Pillow format, extension, content type)
+THUMBNAIL_FORMATS = {
+    'webp': ('WEBP', 'webp', 'image/webp'),
+    'jpeg': ('JPEG', 'jpg', 'image/jpeg'),
+}
+THUMBNAIL_QUALITY = 80
+THUMBNAIL_CACHE_DIR = 'thumbnail_cache'
+
+
+def thumbnail_name(content_hash, size, fmt):
+    """
+    Storage name of a derivative. Derivatives are addressed by the digest of
+    the original, so identical uploads share them and they never go stale.
+    """
+    _pil_format, ext, _content_type = THUMBNAIL_FORMATS[fmt]
+    return os.path.join(THUMBNAIL_CACHE_DIR, content_hash[:2], f"{content_hash}_{size}.{ext}")
+
+
+def thumbnail_path(content_hash, size, fmt):
+    return os.path.join(settings.MEDIA_ROOT, thumbnail_name(content_hash, size, fmt))
+
+
+def delete_thumbnails(content_hash):
+    """Remove every derivative of an original; missing ones are skipped."""
+    for size in THUMBNAIL_SIZES:
+        for fmt in THUMBNAIL_FORMATS:
+            default_storage.delete(thumbnail_name(content_hash, size, fmt))
+
+
+def generate_thumbnails(pet_image):
+    """Render every size/format derivative of a PetImage that is not cached yet."""
+    if not pet_image.content_hash:
+        with pet_image.path.open('rb') as f:
+            pet_image.content_hash = file_sha256(f)
+
+    with pet_image.path.open('rb') as f:
+        original = ImageOps.exif_transpose(Image.open(f))
+        original.load()
+
+    for size, max_side in THUMBNAIL_SIZES.items():
+        resized = None
+        for fmt, (pil_format, _ext, _content_type) in THUMBNAIL_FORMATS.items():
+            name = thumbnail_name(pet_image.content_hash, size, fmt)
+            if default_storage.exists(name):
+                continue
+            if resized is None:
+                resized = original.copy()
+                resized.thumbnail((max_side, max_side), Image.LANCZOS)
+            image = resized
+            if pil_format == 'JPEG' or resized.mode not in ('RGB', 'RGBA'):
+                image = resized.convert('RGB')
+
+            buffer = BytesIO()
+            image.save(buffer, format=pil_format, quality=THUMBNAIL_QUALITY, optimize=True)
+            default_storage.save(name, ContentFile(buffer.getvalue()))
+
+    return pet_image.content_hash
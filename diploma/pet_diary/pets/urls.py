@@ -9,6 +9,7 @@ urlpatterns = [
     path('', pets.views.pet.pet_list, name='pet_list'),
     path('create/', pets.views.pet.create_pet, name='pet_create'),
     path('<int:pet_id>/', pets.views.pet.pet_detail, name='pet_detail'),
+    path('<int:pet_id>/tab/<str:tab>/', pets.views.pet.pet_detail_tab, name='pet_detail_tab'),
     path('<int:pet_id>/edit/', pets.views.pet.edit_pet, name='pet_update'),
     path('<int:pet_id>/delete/', pets.views.pet.delete_pet, name='pet_delete'),
 
@@ -1,3 +1,4 @@
+import hashlib
 import os
 from telegram import Bot
 
@@ -18,3 +19,10 @@ def send_telegram_message(user, text):
         _telegram_bot = Bot(token=token)
 
     _bot_send_message(_telegram_bot, user.telegram_id, text)
+
+
+def file_sha256(f, chunk_size=64 * 1024):
+    digest = hashlib.sha256()
+    for chunk in iter(lambda: f.read(chunk_size), b''):
+        digest.update(chunk)
+    return digest.hexdigest()
@@ -1,6 +1,6 @@
 from .document import upload_document, edit_document, delete_document, download_document
 from .image import upload_pet_image, edit_pet_image, delete_pet_image, download_pet_image
-from .pet import pet_list, pet_detail, create_pet, edit_pet, delete_pet
+from .pet import pet_list, pet_detail, pet_detail_tab, create_pet, edit_pet, delete_pet
 from .task import create_task, edit_task, bulk_update_task_status, delete_task
 from .vaccination import create_vaccination, edit_vaccination, delete_vaccination
 from .weight_record import create_weight_record, edit_weight_record, delete_weight_record
\ No newline at end of file
@@ -7,8 +7,10 @@ from django.contrib.auth.decorators import login_required
 from django.http import HttpResponseForbidden, FileResponse
 from django.shortcuts import get_object_or_404, redirect, render
 from django.urls import reverse
+from django.utils.http import content_disposition_header
 from django.utils.translation import gettext_lazy as _
 
+from pets.blobs import release_files, store_upload
 from pets.forms import PetDocumentForm
 from pets.models import Pet, PetDocument
 
@@ -23,10 +25,19 @@ def upload_document(request, pet_id):
             doc.pet = pet
             doc.doc_file_name = doc.doc_file.name
             doc.created_by = request.user
-            if PetDocument.objects.filter(pet=pet, doc_file=request.FILES['doc_file']).exists():
+            with store_upload(request.FILES['doc_file'], 'pet_documents') as (name, content_hash):
+                duplicate = PetDocument.objects.filter(
+                    pet=pet, content_hash=content_hash, deleted_at__isnull=True
+                ).exists()
+                if duplicate:
+                    release_files(PetDocument, 'doc_file', [name])
+                else:
+                    doc.doc_file = name
+                    doc.content_hash = content_hash
+                    doc.save()
+            if duplicate:
                 messages.error(request, "This document already exists.")
             else:
-                doc.save()
                 messages.success(request, _("Document uploaded successfully."))
                 return redirect(f"{reverse('pets:pet_detail', args=[pet_id])}?tab=documents")
         else:
@@ -47,11 +58,30 @@ def edit_document(request, doc_id):
     doc = get_object_or_404(PetDocument, id=doc_id, deleted_at__isnull=True)
     pet = doc.pet
     if request.method == 'POST':
+        old_name = doc.doc_file.name
         form = PetDocumentForm(request.POST, request.FILES, instance=doc)
         if form.is_valid():
             d = form.save(commit=False)
+            file_changed = 'doc_file' in form.changed_data
             d.mark_as_edited(request.user)
-            d.save()
+            if file_changed:
+                with store_upload(request.FILES['doc_file'], 'pet_documents') as (name, content_hash):
+                    duplicate = PetDocument.objects.filter(
+                        pet=pet, content_hash=content_hash, deleted_at__isnull=True
+                    ).exclude(id=doc_id).exists()
+                    if duplicate:
+                        release_files(PetDocument, 'doc_file', [name])
+                    else:
+                        d.doc_file = name
+                        d.content_hash = content_hash
+                        d.save()
+                if duplicate:
+                    messages.error(request, _("This document already exists."))
+                    return redirect(f"{reverse('pets:pet_detail', args=[pet.id])}?tab=documents")
+            else:
+                d.save()
+            if file_changed:
+                release_files(PetDocument, 'doc_file', [old_name])
             return redirect(f"{reverse('pets:pet_detail', args=[pet.id])}?tab=documents")
     else:
         form = PetDocumentForm(instance=doc)
@@ -74,10 +104,12 @@ def delete_document(request, pet_id, doc_id):
     pet_document = get_object_or_404(PetDocument, id=doc_id, pet=pet, deleted_at__isnull=True)
 
     if request.method == 'POST':
-        pet_document.doc_file.delete(save=False)
+        old_name = pet_document.doc_file.name
         pet_document.mark_as_deleted(request.user)
         pet_document.doc_file.name = 'pet_documents/deleted_document.pdf'
         pet_document.save()
+        # The file may be shared with other uploads of the same content
+        release_files(PetDocument, 'doc_file', [old_name])
         messages.success(request, _("Document has been successfully deleted."))
 
         return redirect(f"{reverse('pets:pet_detail', args=[pet_id])}?tab=documents")
@@ -110,10 +142,8 @@ def download_document(request, pet_id, doc_name):
 
     download = request.GET.get('download', '0')
 
-    if download == '1':
-        disposition = f'attachment; filename="{os.path.basename(file_path)}"'
-    else:
-        disposition = f'inline; filename="{os.path.basename(file_path)}"'
+    # Stored names are content digests, send the name the file was uploaded with
+    disposition = content_disposition_header(download == '1', document.doc_file_name)
 
     try:
         file_handle = open(file_path, 'rb')
@@ -4,13 +4,19 @@ import os
 from django.conf import settings
 from django.contrib import messages
 from django.contrib.auth.decorators import login_required
+from django.db import transaction
 from django.http import HttpResponseForbidden, FileResponse
 from django.shortcuts import get_object_or_404, redirect, render
 from django.urls import reverse
+from django.utils.cache import get_conditional_response, patch_vary_headers
+from django.utils.http import content_disposition_header, http_date
 from django.utils.translation import gettext_lazy as _
 
+from pets.blobs import release_files, store_upload
 from pets.forms import PetImageForm
 from pets.models import Pet, PetImage
+from pets.tasks import generate_pet_image_thumbnails
+from pets.thumbnails import THUMBNAIL_FORMATS, THUMBNAIL_SIZES, thumbnail_path
 
 
 @login_required
@@ -24,10 +30,20 @@ def upload_pet_image(request, pet_id):
             pet_image.pet = pet
             pet_image.image_name = pet_image.path.name
             pet_image.created_by = request.user
-            if PetImage.objects.filter(pet=pet, path=request.FILES['path']).exists():
+            with store_upload(request.FILES['path'], 'pet_images') as (name, content_hash):
+                duplicate = PetImage.objects.filter(
+                    pet=pet, content_hash=content_hash, deleted_at__isnull=True
+                ).exists()
+                if duplicate:
+                    release_files(PetImage, 'path', [name])
+                else:
+                    pet_image.path = name
+                    pet_image.content_hash = content_hash
+                    pet_image.save()
+            if duplicate:
                 messages.error(request, "Such image already exists.")
             else:
-                pet_image.save()
+                _schedule_thumbnails(pet_image)
                 messages.success(request, "Photo uploaded successfully.")
 
                 tab = request.POST.get('tab', 'photos')
@@ -58,13 +74,31 @@ def edit_pet_image(request, pet_id, image_id):
         return HttpResponseForbidden(_("You do not have permission to edit this image."))
 
     if request.method == 'POST':
+        old_name = pet_image.path.name
         form = PetImageForm(request.POST, request.FILES, instance=pet_image)
         if form.is_valid():
-            if 'path' in form.changed_data:
-                if PetImage.objects.filter(pet=pet, path=request.FILES.get('path')).exclude(id=image_id).exists():
+            file_changed = 'path' in form.changed_data
+            pet_image = form.save(commit=False)
+            if file_changed:
+                with store_upload(request.FILES['path'], 'pet_images') as (name, content_hash):
+                    duplicate = PetImage.objects.filter(
+                        pet=pet, content_hash=content_hash, deleted_at__isnull=True
+                    ).exclude(id=image_id).exists()
+                    if duplicate:
+                        release_files(PetImage, 'path', [name])
+                    else:
+                        pet_image.path = name
+                        pet_image.content_hash = content_hash
+                        pet_image.thumbnails_ready = False
+                        pet_image.save()
+                if duplicate:
                     messages.error(request, _("Such image already exists."))
                     return redirect(f"{reverse('pets:pet_detail', args=[pet_id])}?tab=photos&view_photos={request.POST.get('view_photos', 'gallery')}&per_page_photos={request.POST.get('per_page_photos', '12')}&page_photos={request.POST.get('page_photos', '1')}")
-            form.save()
+            else:
+                pet_image.save()
+            if file_changed:
+                release_files(PetImage, 'path', [old_name])
+                _schedule_thumbnails(pet_image)
             messages.success(request, _("Image has been successfully updated."))
 
             tab = request.POST.get('tab', 'photos')
@@ -112,26 +146,64 @@ def download_pet_image(request, pet_id, image_name):
     if not os.path.exists(file_path):
         return HttpResponseForbidden("File not found.")
 
-    mime_type, _ = mimetypes.guess_type(file_path)
+    download = request.GET.get('download', '0')
+    size = request.GET.get('size')
+    etag = f'"{image.content_hash}"' if image.content_hash else None
+
+    # Serve a cached derivative when one was requested and is ready
+    served_path = file_path
+    mime_type = None
+    cache_control = 'private, max-age=86400'
+    if download != '1' and size in THUMBNAIL_SIZES:
+        # Until the derivative exists the original stands in for it; make the
+        # browser revalidate so it picks up the thumbnail once it is rendered
+        cache_control = 'private, no-cache'
+    if download != '1' and size in THUMBNAIL_SIZES and image.thumbnails_ready:
+        fmt = 'webp' if 'image/webp' in request.headers.get('Accept', '') else 'jpeg'
+        derivative_path = thumbnail_path(image.content_hash, size, fmt)
+        if os.path.exists(derivative_path):
+            served_path = derivative_path
+            mime_type = THUMBNAIL_FORMATS[fmt][2]
+            etag = f'"{image.content_hash}-{size}-{fmt}"'
+            cache_control = 'private, max-age=86400'
+
+    if not mime_type:
+        mime_type, _encoding = mimetypes.guess_type(served_path)
     if not mime_type:
         mime_type = 'application/octet-stream'
 
-    download = request.GET.get('download', '0')
+    last_modified = os.path.getmtime(served_path)
+    not_modified = get_conditional_response(request, etag=etag, last_modified=int(last_modified))
+    if not_modified is not None:
+        _set_cache_headers(not_modified, etag, last_modified, cache_control)
+        return not_modified
 
-    if download == '1':
-        disposition = f'attachment; filename="{os.path.basename(file_path)}"'
-    else:
-        disposition = f'inline; filename="{os.path.basename(file_path)}"'
+    # Stored names are content digests, send the name the file was uploaded with
+    disposition = content_disposition_header(download == '1', image.image_name)
 
     try:
-        file_handle = open(file_path, 'rb')
+        file_handle = open(served_path, 'rb')
         response = FileResponse(file_handle, content_type=mime_type)
         response['Content-Disposition'] = disposition
+        _set_cache_headers(response, etag, last_modified, cache_control)
         return response
     except Exception as e:
         return HttpResponseForbidden("Error accessing the file.")
 
 
+def _set_cache_headers(response, etag, last_modified, cache_control):
+    if etag:
+        response['ETag'] = etag
+    response['Last-Modified'] = http_date(last_modified)
+    # Protected media: browsers may keep it, shared proxies must not
+    response['Cache-Control'] = cache_control
+    patch_vary_headers(response, ['Accept'])
+
+
+def _schedule_thumbnails(pet_image):
+    transaction.on_commit(lambda: generate_pet_image_thumbnails.delay(pet_image.id))
+
+
 @login_required
 def delete_pet_image(request, pet_id, image_id):
     pet = get_object_or_404(Pet, id=pet_id)
@@ -147,10 +219,12 @@ def delete_pet_image(request, pet_id, image_id):
     page_photos = request.GET.get('page_photos', '1') if request.method == 'GET' else request.POST.get('page_photos', '1')
 
     if request.method == 'POST':
-        pet_image.path.delete(save=False)
+        old_name = pet_image.path.name
         pet_image.mark_as_deleted(request.user)
         pet_image.path.name = 'pet_images/deleted_image.jpg'
         pet_image.save()
+        # The file may be shared with other uploads of the same content
+        release_files(PetImage, 'path', [old_name])
         messages.success(request, _("Image has been successfully deleted."))
 
         tab = request.POST.get('tab', 'photos')
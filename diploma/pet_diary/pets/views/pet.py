@@ -1,10 +1,16 @@
 from django.contrib.auth.decorators import login_required
 from django.core.exceptions import ValidationError
-from django.core.paginator import Paginator
-from django.db import models
+from django.core.cache import cache
+from django.core.paginator import Page, Paginator
+from django.db import models, transaction
+from django.db.models import Count, OuterRef, Subquery
+from django.db.models.functions import Coalesce
+from django.http import Http404
 from django.shortcuts import render, get_object_or_404, redirect
 from django.utils.translation import gettext_lazy as _
 
+from pets.blobs import release_files
+from pets.cache import PET_LIST_CACHE_TIMEOUT, pet_list_cache_key
 from pets.forms import PetImageForm, PetForm
 from pets.models import Pet, Task, WeightRecord, Vaccination, PetImage, PetDocument
 
@@ -25,12 +31,26 @@ def pet_list(request):
             per_page = '10'
 
     pets_qs = Pet.objects.filter(
-        models.Q(owner=request.user) | models.Q(caregiver=request.user)
-    ).order_by('name')
+        models.Q(owner=request.user) | models.Q(caregiver=request.user),
+        deleted_at__isnull=True,
+    ).select_related('owner', 'caregiver').order_by('name')
 
     paginator = Paginator(pets_qs, int(per_page))
     page_number = request.GET.get('page', '1')
-    page_obj = paginator.get_page(page_number)
+    cache_key = pet_list_cache_key(request.user.id, view_mode, per_page, page_number)
+
+    cached_page = cache.get(cache_key)
+    if cached_page is None:
+        page_obj = paginator.get_page(page_number)
+        cached_page = {
+            'pets': list(page_obj.object_list),
+            'number': page_obj.number,
+            'count': paginator.count,
+        }
+        cache.set(cache_key, cached_page, PET_LIST_CACHE_TIMEOUT)
+    else:
+        paginator.count = cached_page['count']
+        page_obj = Page(cached_page['pets'], cached_page['number'], paginator)
 
     context = {
         'pets': page_obj.object_list,
@@ -39,117 +59,181 @@ def pet_list(request):
         'view_mode': view_mode,
         'per_page': per_page,
         'per_page_options': per_page_options,
+        'pet_list_cache_key': cache_key,
+        'pet_list_cache_timeout': PET_LIST_CACHE_TIMEOUT,
     }
 
     return render(request, 'pets/pet_list.html', context)
 
 
-@login_required
-def pet_detail(request, pet_id):
-    pet = get_object_or_404(Pet, id=pet_id)
-    active_tab = request.GET.get('tab', 'tasks')
-
-    # ------------------------------
-    # Weight Logs Pagination (TAB=weight)
-    # ------------------------------
+def _paginate(request, qs, per_page, page_param, count=None):
+    paginator = Paginator(qs, int(per_page))
+    if count is not None:
+        # The tab badge count already covers this queryset, skip the COUNT(*)
+        paginator.count = count
+    return paginator.get_page(request.GET.get(page_param, '1'))
+
+
+def _active_count(model, **filters):
+    return Coalesce(
+        Subquery(
+            model.objects.filter(pet=OuterRef('pk'), deleted_at__isnull=True, **filters)
+            .order_by()
+            .values('pet')
+            .annotate(c=Count('id'))
+            .values('c')
+        ),
+        0,
+    )
+
+
+def _get_pet_with_tab_counts(pet_id):
+    """Fetch the pet, its owner/caregiver and every tab badge count in one query."""
+    pets_qs = Pet.objects.select_related('owner', 'caregiver').annotate(
+        tasks_count=_active_count(Task, status__in=['planned', 'overdue']),
+        weight_count=_active_count(WeightRecord),
+        vaccinations_count=_active_count(Vaccination),
+        documents_count=_active_count(PetDocument),
+        photos_count=_active_count(PetImage),
+    )
+    return get_object_or_404(pets_qs, id=pet_id)
+
+
+def _weight_tab_context(request, pet):
     per_page_weight = request.GET.get('per_page_weight', '10')
     if per_page_weight not in ['10', '25', '50']:
         per_page_weight = '10'
     weight_logs_qs = pet.weight_records.filter(deleted_at__isnull=True).order_by('-date')
-    paginator_weight = Paginator(weight_logs_qs, int(per_page_weight))
-    page_number_weight = request.GET.get('page_weight', '1')
-    page_obj_weight = paginator_weight.get_page(page_number_weight)
+    page_obj_weight = _paginate(
+        request, weight_logs_qs, per_page_weight, 'page_weight', pet.weight_count
+    )
+    return {
+        'weight_logs': page_obj_weight.object_list,
+        'page_obj_weight': page_obj_weight,
+        'per_page_weight': per_page_weight,
+    }
 
-    # ------------------------------
-    # Tasks Pagination (TAB=tasks)
-    # ------------------------------
+
+def _tasks_tab_context(request, pet):
     show_old = request.GET.get('show_old', '0')  # '0' or '1'
     per_page_tasks = request.GET.get('per_page_tasks', '10')  # '10', '25', '50'
     if per_page_tasks not in ['10', '25', '50']:
         per_page_tasks = '10'
 
     tasks_qs = pet.tasks.filter(deleted_at__isnull=True)
+    tasks_count = None
 
     # Hiding old tasks (done/skipped)
     if show_old != '1':
         tasks_qs = tasks_qs.filter(status__in=['planned', 'overdue'])
+        tasks_count = pet.tasks_count
 
     tasks_qs = tasks_qs.order_by('due_datetime', 'id')
-    paginator_tasks = Paginator(tasks_qs, int(per_page_tasks))
-    page_number_tasks = request.GET.get('page_tasks', '1')
-    page_obj_tasks = paginator_tasks.get_page(page_number_tasks)
+    page_obj_tasks = _paginate(request, tasks_qs, per_page_tasks, 'page_tasks', tasks_count)
+    return {
+        'tasks': page_obj_tasks.object_list,
+        'page_obj_tasks': page_obj_tasks,
+        'show_old': show_old,
+        'per_page_tasks': per_page_tasks,
+    }
 
-    # ------------------------------
-    # Vaccinations Pagination (TAB=vaccinations)
-    # ------------------------------
+
+def _vaccinations_tab_context(request, pet):
     per_page_vaccinations = request.GET.get('per_page_vaccinations', '10')
     if per_page_vaccinations not in ['10', '25', '50']:
         per_page_vaccinations = '10'
     vaccinations_qs = pet.vaccination.filter(deleted_at__isnull=True).order_by('-date_administered')
-    paginator_vaccinations = Paginator(vaccinations_qs, int(per_page_vaccinations))
-    page_number_vaccinations = request.GET.get('page_vaccinations', '1')
-    page_obj_vaccinations = paginator_vaccinations.get_page(page_number_vaccinations)
+    page_obj_vaccinations = _paginate(
+        request, vaccinations_qs, per_page_vaccinations, 'page_vaccinations', pet.vaccinations_count
+    )
+    return {
+        'vaccinations': page_obj_vaccinations.object_list,
+        'page_obj_vaccinations': page_obj_vaccinations,
+        'per_page_vaccinations': per_page_vaccinations,
+    }
 
-    # ------------------------------
-    # Documents Pagination (TAB=documents)
-    # ------------------------------
+
+def _documents_tab_context(request, pet):
     per_page_documents = request.GET.get('per_page_documents', '10')
     if per_page_documents not in ['10', '25', '50']:
         per_page_documents = '10'
     documents_qs = pet.documents.filter(deleted_at__isnull=True).order_by('-doc_date')
-    paginator_documents = Paginator(documents_qs, int(per_page_documents))
-    page_number_documents = request.GET.get('page_documents', '1')
-    page_obj_documents = paginator_documents.get_page(page_number_documents)
+    page_obj_documents = _paginate(
+        request, documents_qs, per_page_documents, 'page_documents', pet.documents_count
+    )
+    return {
+        'documents': page_obj_documents.object_list,
+        'page_obj_documents': page_obj_documents,
+        'per_page_documents': per_page_documents,
+    }
 
-    # ------------------------------
-    # Photos Pagination (TAB=photos)
-    # ------------------------------
+
+def _photos_tab_context(request, pet):
     view_mode_photos = request.GET.get('view_photos', 'gallery')  # 'gallery' или 'list'
     per_page_photos = request.GET.get('per_page_photos', '12')  # '12', '24', '48'
     if per_page_photos not in ['12', '24', '48']:
         per_page_photos = '12'
 
     photos_qs = pet.images.filter(deleted_at__isnull=True).order_by('-uploaded_at')
-
-    paginator_photos = Paginator(photos_qs, int(per_page_photos))
-    page_number_photos = request.GET.get('page_photos', '1')
-    page_obj_photos = paginator_photos.get_page(page_number_photos)
+    page_obj_photos = _paginate(
+        request, photos_qs, per_page_photos, 'page_photos', pet.photos_count
+    )
 
     # Determine view mode (gallery or list)
     if view_mode_photos not in ['gallery', 'list']:
         view_mode_photos = 'gallery'
 
-    # --Context--
-    context = {
-        'pet': pet,
-        'active_tab': active_tab,
-
-        # For other pet_detail_tabs
-        'weight_logs': page_obj_weight.object_list,
-        'page_obj_weight': page_obj_weight,
-        'vaccinations': page_obj_vaccinations.object_list,
-        'page_obj_vaccinations': page_obj_vaccinations,
-        'documents': page_obj_documents.object_list,
-        'page_obj_documents': page_obj_documents,
-
-        # For tasks tab
-        'tasks': page_obj_tasks.object_list,
-        'page_obj_tasks': page_obj_tasks,
-        'show_old': show_old,
-        'per_page_tasks': per_page_tasks,
-
-        # For photos tab
+    return {
         'photos': page_obj_photos.object_list,
         'page_obj_photos': page_obj_photos,
         'view_mode_photos': view_mode_photos,
         'per_page_photos': per_page_photos,
-
         'form': PetImageForm(),
     }
 
+
+# tab -> (context loader, fragment template)
+PET_DETAIL_TABS = {
+    'tasks': (_tasks_tab_context, 'pets/pet_detail_tabs/tasks.html'),
+    'weight': (_weight_tab_context, 'pets/pet_detail_tabs/weight_log.html'),
+    'photos': (_photos_tab_context, 'pets/pet_detail_tabs/photos.html'),
+    'vaccinations': (_vaccinations_tab_context, 'pets/pet_detail_tabs/vaccination_log.html'),
+    'documents': (_documents_tab_context, 'pets/pet_detail_tabs/documents.html'),
+}
+
+
+@login_required
+def pet_detail(request, pet_id):
+    pet = _get_pet_with_tab_counts(pet_id)
+    active_tab = request.GET.get('tab', 'tasks')
+
+    # Only the visible tab is queried, the others load through pet_detail_tab
+    context = {
+        'pet': pet,
+        'active_tab': active_tab,
+    }
+    if active_tab in PET_DETAIL_TABS:
+        load_tab_context, _template = PET_DETAIL_TABS[active_tab]
+        context.update(load_tab_context(request, pet))
+
     return render(request, 'pets/pet_detail.html', context)
 
 
+@login_required
+def pet_detail_tab(request, pet_id, tab):
+    if tab not in PET_DETAIL_TABS:
+        raise Http404
+    pet = _get_pet_with_tab_counts(pet_id)
+    load_tab_context, template_name = PET_DETAIL_TABS[tab]
+
+    context = {
+        'pet': pet,
+        'active_tab': tab,
+    }
+    context.update(load_tab_context(request, pet))
+    return render(request, template_name, context)
+
+
 # ------------------------------------------------
 #                PET CRUD
 # ------------------------------------------------
@@ -202,29 +286,24 @@ def edit_pet(request, pet_id):
 def delete_pet(request, pet_id):
     pet = get_object_or_404(Pet, id=pet_id)
     if request.method == 'POST':
-        pet.mark_as_deleted(request.user)
-        tasks = Task.objects.filter(pet=pet, deleted_at__isnull=True)
-        for t in tasks:
-            t.mark_as_deleted(request.user)
-        weight_records = WeightRecord.objects.filter(pet=pet, deleted_at__isnull=True)
-        for w in weight_records:
-            w.mark_as_deleted(request.user)
-        vaccinations = Vaccination.objects.filter(pet=pet, deleted_at__isnull=True)
-        for v in vaccinations:
-            v.mark_as_deleted(request.user)
-        images = PetImage.objects.filter(pet=pet, deleted_at__isnull=True)
-        for i in images:
-            i.path.delete(save=False)
-            i.mark_as_deleted(request.user)
-            i.path.name = 'pet_images/deleted_image.jpg'
-            i.save()
-        documents = PetDocument.objects.filter(pet=pet, deleted_at__isnull=True)
-        for d in documents:
-            d.doc_file.delete(save=False)
-            d.mark_as_deleted(request.user)
-            d.doc_file.name = 'pet_documents/deleted_document.pdf'
-            d.save()
-
-        pet.save()
+        with transaction.atomic():
+            pet.mark_as_deleted(request.user)
+            Task.objects.filter(pet=pet, deleted_at__isnull=True).mark_as_deleted(request.user)
+            WeightRecord.objects.filter(pet=pet, deleted_at__isnull=True).mark_as_deleted(request.user)
+            Vaccination.objects.filter(pet=pet, deleted_at__isnull=True).mark_as_deleted(request.user)
+
+            images = PetImage.objects.filter(pet=pet, deleted_at__isnull=True)
+            image_names = list(images.values_list('path', flat=True))
+            images.mark_as_deleted(request.user, path='pet_images/deleted_image.jpg')
+
+            documents = PetDocument.objects.filter(pet=pet, deleted_at__isnull=True)
+            document_names = list(documents.values_list('doc_file', flat=True))
+            documents.mark_as_deleted(request.user, doc_file='pet_documents/deleted_document.pdf')
+
+            pet.save()
+
+        # Files may be shared with other pets' uploads of the same content
+        release_files(PetImage, 'path', image_names)
+        release_files(PetDocument, 'doc_file', document_names)
         return redirect('pets:pet_list')
     return render(request, 'pets/pet_confirm_delete.html', {'pet': pet})
@@ -1,6 +1,7 @@
-from datetime import datetime, timedelta
+from datetime import datetime
 
 from django.contrib.auth.decorators import login_required
+from django.db import transaction
 from django.http import HttpResponseForbidden
 from django.shortcuts import get_object_or_404, redirect, render
 from django.urls import reverse
@@ -9,6 +10,8 @@ from django.utils.translation import gettext_lazy as _
 
 from pets.forms import TaskCreateForm, TaskEditForm
 from pets.models import Pet, Task
+from pets.recurrence import expand_recurring_task
+from pets.signals import tasks_status_changed
 
 
 @login_required
@@ -25,27 +28,9 @@ def create_task(request, pet_id):
             print("cleaned_data:", form.cleaned_data.get('due_datetime'))
             print(timezone.get_current_timezone())
             print(datetime.now(), datetime.utcnow())
-            original_task.save()
-
-            if (
-                original_task.recurring
-                and original_task.recurring_days > 0
-                and original_task.due_datetime
-            ):
-                for i in range(1, original_task.recurring_days):  # +1
-                    new_dt = original_task.due_datetime + timedelta(days=i)
-                    Task.objects.create(
-                        pet=pet,
-                        title=original_task.title,
-                        due_datetime=new_dt,
-                        remind_me=original_task.remind_me,
-                        remind_before=original_task.remind_before,
-                        status=original_task.status,
-                        # Preventing infinite loop
-                        recurring=False,
-                        recurring_days=0,
-                        created_by=original_task.created_by,
-                    )
+            with transaction.atomic():
+                original_task.save()
+                expand_recurring_task(original_task)
 
             return redirect(f"{reverse('pets:pet_detail', args=[pet_id])}?tab=tasks")
     else:
@@ -129,14 +114,21 @@ def bulk_update_task_status(request, pet_id):
         action = request.POST.get('action')  # 'done' or 'skipped'
         if task_ids and action in ['done', 'skipped']:
             tasks = Task.objects.filter(id__in=task_ids, pet=pet, deleted_at__isnull=True)
-
-            for t in tasks:
-                t.mark_as_edited(request.user)
-                if action == 'done':
-                    t.mark_as_done(request.user)
-                elif action == 'skipped':
-                    t.mark_as_skipped(request.user)
-                t.save()
+            changed_tasks = list(tasks.select_related('pet__owner', 'pet__caregiver'))
+
+            if action == 'done':
+                tasks.mark_as_done(request.user)
+                new_status = Task.TaskStatus.DONE
+            else:
+                tasks.mark_as_skipped(request.user)
+                new_status = Task.TaskStatus.SKIPPED
+
+            tasks_status_changed.send(
+                sender=Task,
+                tasks=changed_tasks,
+                status=new_status,
+                user=request.user,
+            )
 
         return redirect(f"{reverse('pets:pet_detail', args=[pet_id])}?tab=tasks")
 
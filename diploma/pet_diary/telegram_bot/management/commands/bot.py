@@ -2,10 +2,11 @@ import os
 import logging
 import pytz
 from datetime import timedelta
+from functools import wraps
 
 from django.core.management.base import BaseCommand
 from django.conf import settings
-from django.db import models
+from django.db import close_old_connections, models
 from django.utils import timezone
 from django.utils.translation import gettext as _
 from django.utils import translation
@@ -48,9 +49,27 @@ CD_NOTIFY_SKIP = "NOTIFY_SKIP"
 
 LINKING_EMAIL = 1
 
+# Handler threads; each keeps its own DB connection between updates
+BOT_WORKERS = int(os.getenv("TELEGRAM_BOT_WORKERS", "16"))
+
+
+def with_db_connection(handler):
+    """
+    Run a handler the way Django runs a request: drop connections that are
+    broken or older than CONN_MAX_AGE before and after, reuse the rest.
+    """
+    @wraps(handler)
+    def wrapper(*args, **kwargs):
+        close_old_connections()
+        try:
+            return handler(*args, **kwargs)
+        finally:
+            close_old_connections()
+    return wrapper
+
 
 class Command(BaseCommand):
-    help = "Run Telegram bot (synchronous) with python-telegram-bot v13.x"
+    help = "Run Telegram bot with python-telegram-bot v13.x, handling updates in a worker pool"
 
     @staticmethod
     def account_not_linked():
@@ -62,11 +81,17 @@ class Command(BaseCommand):
             self.stderr.write("Error: TELEGRAM_BOT_TOKEN is not set!")
             return
 
-        updater = Updater(token=token, use_context=True)
+        updater = Updater(
+            token=token,
+            use_context=True,
+            workers=BOT_WORKERS,
+            # One HTTP connection per worker plus the polling thread
+            request_kwargs={'con_pool_size': BOT_WORKERS + 4},
+        )
         dp = updater.dispatcher
 
-        dp.add_handler(CommandHandler("start", self.start_command))
-        dp.add_handler(CommandHandler("tasks", self.tasks_command))
+        dp.add_handler(CommandHandler("start", self.start_command, run_async=True))
+        dp.add_handler(CommandHandler("tasks", self.tasks_command, run_async=True))
 
         link_conv_handler = ConversationHandler(
             entry_points=[
@@ -84,9 +109,9 @@ class Command(BaseCommand):
         )
         dp.add_handler(link_conv_handler)
 
-        dp.add_handler(CallbackQueryHandler(self.button_handler))
+        dp.add_handler(CallbackQueryHandler(self.button_handler, run_async=True))
 
-        dp.add_handler(MessageHandler(Filters.text & ~Filters.command, self.echo_message))
+        dp.add_handler(MessageHandler(Filters.text & ~Filters.command, self.echo_message, run_async=True))
 
         self.stdout.write(self.style.SUCCESS("Starting bot (long-polling)..."))
         updater.start_polling()
@@ -108,6 +133,7 @@ class Command(BaseCommand):
             local_dt = dt
         return local_dt.strftime("%Y-%m-%d %H:%M")
 
+    @with_db_connection
     def start_command(self, update: Update, context: CallbackContext):
         tg_id = update.effective_user.id
         user = self._get_user_by_tg(tg_id)
@@ -124,6 +150,7 @@ class Command(BaseCommand):
             keyboard = [[InlineKeyboardButton(_("Привʼязати"), callback_data=CD_LINK)]]
             update.message.reply_text(text, reply_markup=InlineKeyboardMarkup(keyboard))
 
+    @with_db_connection
     def tasks_command(self, update: Update, context: CallbackContext):
         tg_id = update.effective_user.id
         user = self._get_user_by_tg(tg_id)
@@ -139,6 +166,7 @@ class Command(BaseCommand):
                 _(f"{self.account_not_linked()}")
             )
 
+    @with_db_connection
     def echo_message(self, update: Update, context: CallbackContext):
         tg_id = update.effective_user.id
         user = self._get_user_by_tg(tg_id)
@@ -146,6 +174,7 @@ class Command(BaseCommand):
 
         update.message.reply_text(_("Вітаю! Оберіть /start щоб розпочати роботу."))
 
+    @with_db_connection
     def link_button_handler(self, update: Update, context: CallbackContext):
         query = update.callback_query
         tg_id = query.from_user.id
@@ -165,6 +194,7 @@ class Command(BaseCommand):
         )
         return LINKING_EMAIL
 
+    @with_db_connection
     def link_email_handler(self, update: Update, context: CallbackContext):
         tg_id = update.effective_user.id
         text = update.message.text.strip()
@@ -192,6 +222,7 @@ class Command(BaseCommand):
         update.message.reply_text(_("Операцію скасовано. Оберіть /start щоб спробувати знову."))
         return ConversationHandler.END
 
+    @with_db_connection
     def button_handler(self, update: Update, context: CallbackContext):
         query = update.callback_query
         query.answer()
@@ -338,16 +369,15 @@ class Command(BaseCommand):
         tasks_qs = Task.objects.filter(
             pet__owner=user,
             deleted_at__isnull=True,
-            status__in=[Task.TaskStatus.PLANNED, Task.TaskStatus.OVERDUE]
-        ).order_by('due_datetime')
-
-        tasks_qs = [t for t in tasks_qs if t.due_datetime and t.due_datetime.date() == today]
+            status__in=[Task.TaskStatus.PLANNED, Task.TaskStatus.OVERDUE],
+            due_datetime__date=today,
+        ).select_related('pet').order_by('due_datetime')
 
         page_size = 5
         start = page * page_size
         end = start + page_size
         tasks_list = tasks_qs[start:end]
-        total_count = len(tasks_qs)
+        total_count = tasks_qs.count()
         total_pages = max((total_count - 1) // page_size + 1, 1)
 
         text_lines = []
@@ -513,7 +543,9 @@ class Command(BaseCommand):
 
     def _view_task(self, query, user, task_id):
         try:
-            task = Task.objects.get(id=task_id, deleted_at__isnull=True)
+            task = Task.objects.select_related('pet__owner', 'pet__caregiver').get(
+                id=task_id, deleted_at__isnull=True
+            )
         except Task.DoesNotExist:
             query.edit_message_text(_("Task not found or deleted."))
             return
@@ -553,7 +585,9 @@ class Command(BaseCommand):
 
     def _mark_task_status(self, query, user, task_id, action):
         try:
-            task = Task.objects.get(id=task_id, deleted_at__isnull=True)
+            task = Task.objects.select_related('pet__owner', 'pet__caregiver').get(
+                id=task_id, deleted_at__isnull=True
+            )
         except Task.DoesNotExist:
             query.edit_message_text(_("Task not found or deleted."))
             return
@@ -591,7 +625,9 @@ class Command(BaseCommand):
 
     def _mark_task_status_from_notification(self, query, user, task_id, action):
         try:
-            task = Task.objects.get(id=task_id, deleted_at__isnull=True)
+            task = Task.objects.select_related('pet__owner', 'pet__caregiver').get(
+                id=task_id, deleted_at__isnull=True
+            )
         except Task.DoesNotExist:
             query.edit_message_text(_("Task not found or deleted."))
             return